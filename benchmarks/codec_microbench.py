@@ -0,0 +1,55 @@
+"""
+Per-message encode/decode cost of every installed codec.
+
+Run from the repository root with ``python benchmarks/codec_microbench.py``.
+"""
+import argparse
+import json
+import timeit
+
+from greyhound_messaging.bench import PAYLOAD_SIZES, make_message
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import codecs
+
+
+def measure(number: int) -> list[dict]:
+    results = []
+    for size_name, payload_bytes in PAYLOAD_SIZES.items():
+        message = make_message(payload_bytes)
+        iterations = max(10, number // max(1, payload_bytes // 256))
+        legacy_body = message.model_dump_json().encode("utf-8")
+        legacy_decode = timeit.timeit(
+            lambda: GreyhoundMessageRoot(**json.loads(legacy_body.decode("utf-8"))), number=iterations
+        )
+        results.append({
+            "codec": "legacy json.loads", "payload": size_name, "bytes": len(legacy_body),
+            "encode_us": timeit.timeit(lambda: message.model_dump_json().encode("utf-8"), number=iterations) / iterations * 1e6,
+            "decode_us": legacy_decode / iterations * 1e6,
+        })
+        for name, codec in sorted(codecs.items()):
+            body = codec.encode(message)
+            results.append({
+                "codec": name, "payload": size_name, "bytes": len(body),
+                "encode_us": timeit.timeit(lambda: codec.encode(message), number=iterations) / iterations * 1e6,
+                "decode_us": timeit.timeit(lambda: codec.decode(body), number=iterations) / iterations * 1e6,
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000, help="Iterations for the smallest payload.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON.")
+    args = parser.parse_args()
+
+    results = measure(args.number)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'codec':<20}{'payload':<10}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+    for row in results:
+        print(f"{row['codec']:<20}{row['payload']:<10}{row['bytes']:>10}{row['encode_us']:>12.2f}{row['decode_us']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+pytest-benchmark suite for the adapter hot paths.
+
+Run with ``python -m pytest benchmarks --benchmark-json=bench.json`` and compare
+releases with ``pytest-benchmark compare``.
+"""
+
+import operator
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from greyhound_messaging.adapters._implementations.memory_adapters import MemoryConsumerAdapter, MemoryProducerAdapter, reset_queues
+from greyhound_messaging.bench import PAYLOAD_SIZES
+from greyhound_messaging.bench.runner import make_message
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics, MetricsRegistry
+from greyhound_messaging.routing import GreyhoundRouter
+from greyhound_messaging.serialization import MessageSerializer, codecs, get_codec
+
+
+@pytest.fixture(autouse=True)
+def fresh_queues():
+    reset_queues()
+    yield
+    reset_queues()
+
+
+@pytest.fixture(params=sorted(PAYLOAD_SIZES))
+def payload_size(request):
+    return request.param
+
+
+@pytest.fixture(params=sorted(codecs))
+def serializer(request):
+    return MessageSerializer(get_codec(request.param))
+
+
+def test_encode(benchmark, serializer, payload_size):
+    message = make_message(PAYLOAD_SIZES[payload_size])
+
+    benchmark(serializer.encode, message)
+
+
+def test_decode(benchmark, serializer, payload_size):
+    body, headers = serializer.encode(make_message(PAYLOAD_SIZES[payload_size]))
+
+    benchmark(serializer.decode, body, headers)
+
+
+def test_lazy_decode(benchmark, payload_size):
+    serializer = MessageSerializer(lazy=True)
+    body, headers = serializer.encode(make_message(PAYLOAD_SIZES[payload_size]))
+
+    benchmark(serializer.decode, body, headers)
+
+
+def test_memory_produce(benchmark, serializer, payload_size):
+    producer = MemoryProducerAdapter("bench-produce", serializer=serializer)
+    message = make_message(PAYLOAD_SIZES[payload_size])
+
+    benchmark(producer.produce, message)
+
+
+def test_memory_message_received(benchmark, serializer, payload_size):
+    adapter = MemoryConsumerAdapter(GreyhoundConsumer(), "bench-consume", serializer=serializer)
+    body, headers = serializer.encode(make_message(PAYLOAD_SIZES[payload_size]))
+
+    benchmark(adapter.message_received, body, headers)
+
+
+def test_memory_message_received_with_metrics(benchmark, payload_size):
+    metrics = AdapterMetrics(MetricsRegistry(enabled=True), "MEMORY", "consumer", "bench-consume")
+    adapter = MemoryConsumerAdapter(GreyhoundConsumer(), "bench-consume", metrics=metrics)
+    body, headers = adapter.serializer.encode(make_message(PAYLOAD_SIZES[payload_size]))
+
+    benchmark(adapter.message_received, body, headers)
+
+
+def test_passthrough_bridge_hop(benchmark, payload_size):
+    consume_side = MessageSerializer()
+    produce_side = MessageSerializer(passthrough=True)
+    body, headers = consume_side.encode(make_message(PAYLOAD_SIZES[payload_size]))
+
+    def hop():
+        return produce_side.encode(consume_side.decode(body, headers))
+
+    benchmark(hop)
+
+
+@pytest.mark.parametrize("path", ["event_type", "metadata.message_id", "payload", "stages", "metadata.custom_headers"])
+def test_attribute_access(benchmark, path):
+    serializer = MessageSerializer()
+    message = serializer.decode(*serializer.encode(make_message(PAYLOAD_SIZES["small"])))
+    read = operator.attrgetter(path)
+
+    def read_many():
+        for _ in range(100):
+            read(message)
+
+    benchmark(read_many)
+
+
+@pytest.mark.parametrize("routes", [10, 500])
+def test_router_dispatch(benchmark, routes):
+    router = GreyhoundRouter()
+    for index in range(routes):
+        router.add_route(f"domain{index}.*.created", lambda message: None)
+    router.add_route("orders.#", lambda message: None)
+    message = make_message(16)
+    message.event_type = "orders.eu.created"
+
+    benchmark(router.message_received, message)
+
+
+def _cold_import(module: str):
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
+
+
+@pytest.mark.parametrize("module", ["greyhound_messaging.adapters", "greyhound_messaging.cli.main"])
+def test_cold_import(benchmark, module):
+    benchmark.pedantic(_cold_import, args=(module,), rounds=5, iterations=1)
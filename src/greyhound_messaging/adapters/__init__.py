@@ -1 +1,7 @@
-from .adapter_factory import adapter_factory_consumer, adapter_factory_producer
\ No newline at end of file
+from .adapter_factory import (
+    adapter_factory_consumer,
+    adapter_factory_producer,
+    adapter_factory_async_consumer,
+    adapter_factory_async_producer,
+)
+from .backend_registry import BackendRegistry, backend_registry, register_backend
@@ -59,4 +59,48 @@ class BufferedProducerMessageAdapter(ProducerMessageAdapter):
         """
         Flush any buffered messages to the messaging system.
         """
-        raise NotImplementedError("This method should be implemented by subclasses.")
\ No newline at end of file
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+class AsyncConsumerMessageAdapter(ABC):
+    """
+    Abstract base class for asyncio consumer message adapters.
+    This class defines the interface for consuming messages from a messaging system
+    without blocking a thread per connection.
+    """
+
+    @abstractmethod
+    async def consume(self):
+        """
+        Consume messages from the messaging system until the adapter is closed.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    async def close(self):
+        """
+        Stop consuming, wait for in-flight messages and release the connection.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+class AsyncProducerMessageAdapter(ABC):
+    """
+    Abstract base class for asyncio producer message adapters.
+    This class defines the interface for producing messages to a messaging system
+    without blocking a thread per connection.
+    """
+
+    @abstractmethod
+    async def produce(self, message: GreyhoundMessageRoot):
+        """
+        Produce a message to the messaging system.
+        
+        :param message: The message to be produced.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    async def close(self):
+        """
+        Deliver any outstanding messages and release the connection.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
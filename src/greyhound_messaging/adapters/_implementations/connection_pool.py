@@ -0,0 +1,200 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    # Imported lazily so that using one backend never loads the other backend's client library.
+    import pika
+    from confluent_kafka import Producer
+
+logger = logging.getLogger(__name__)
+
+
+def _rabbitmq_key(connection_params: "pika.ConnectionParameters") -> tuple:
+    credentials = connection_params.credentials
+    return (
+        connection_params.host,
+        connection_params.port,
+        connection_params.virtual_host,
+        getattr(credentials, "username", None),
+        getattr(credentials, "password", None),
+        connection_params.ssl_options is not None,
+    )
+
+
+class _PooledConnection:
+
+    __slots__ = ("connection", "channel", "refcount")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.channel = None
+        self.refcount = 0
+
+
+class RabbitMQConnectionPool:
+    """
+    Process-wide pool of RabbitMQ connections shared by the blocking adapters.
+
+    Connections are keyed by connection parameters and by the thread that
+    acquires them: every adapter created on the same thread with the same
+    parameters shares one TCP connection, and producers on that thread also
+    share one channel. A pooled connection is health-checked before it is
+    handed out and replaced if the broker dropped it. It is closed once every
+    adapter using it has released it.
+
+    Keying by thread only covers where adapters are created, not where they
+    are used. pika's BlockingConnection is not thread-safe, so sharing is
+    only safe while every adapter on a connection is also used from the
+    thread that created it. A consumer blocked in ``start_consuming`` whose
+    dispatcher workers publish through a producer sharing its connection
+    breaks that rule, so the RabbitMQ adapters only pool connections when
+    ``share_connection`` is set, and never for a consumer with a dispatcher.
+    """
+
+    def __init__(self, connect: Callable[["pika.ConnectionParameters"], "pika.BlockingConnection"] = None):
+        """
+        :param connect: Opens a new connection, ``pika.BlockingConnection`` by default.
+        """
+        self._connect = connect
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    def _open(self, connection_params: "pika.ConnectionParameters"):
+        connect = self._connect
+        if connect is None:
+            import pika
+            connect = pika.BlockingConnection
+        return connect(connection_params)
+
+    @staticmethod
+    def _is_healthy(connection) -> bool:
+        """
+        Whether a pooled connection is open and still talking to the broker.
+        """
+        import pika.exceptions
+
+        if not connection.is_open:
+            return False
+        try:
+            connection.process_data_events(time_limit=0)
+        except pika.exceptions.AMQPError:
+            return False
+        return connection.is_open
+
+    def acquire(self, connection_params: "pika.ConnectionParameters") -> "pika.BlockingConnection":
+        """
+        Return the calling thread's connection for these parameters, opening it on first use.
+
+        Every call must be paired with ``release``.
+        """
+        key = (_rabbitmq_key(connection_params), threading.get_ident())
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is None:
+                entry = self._connections[key] = _PooledConnection(self._open(connection_params))
+            elif not self._is_healthy(entry.connection):
+                logger.warning("Replacing unhealthy pooled connection to %s:%s", connection_params.host, connection_params.port)
+                # Adapters still holding the dead connection release it without touching the new entry.
+                entry.connection = self._open(connection_params)
+                entry.channel = None
+                entry.refcount = 0
+            entry.refcount += 1
+            return entry.connection
+
+    def channel(self, connection: "pika.BlockingConnection"):
+        """
+        Return the channel shared by producers using an acquired connection, opening it on first use.
+        """
+        with self._lock:
+            entry = self._find(connection)
+            if entry is None:
+                return connection.channel()
+            if entry.channel is None or not entry.channel.is_open:
+                entry.channel = connection.channel()
+            return entry.channel
+
+    def _find(self, connection) -> _PooledConnection | None:
+        for entry in self._connections.values():
+            if entry.connection is connection:
+                return entry
+        return None
+
+    def release(self, connection: "pika.BlockingConnection"):
+        """
+        Give back an acquired connection, closing it once no adapter uses it.
+        """
+        with self._lock:
+            entry = self._find(connection)
+            if entry is not None:
+                entry.refcount -= 1
+                if entry.refcount > 0:
+                    return
+                self._connections = {key: value for key, value in self._connections.items() if value is not entry}
+        if connection.is_open:
+            connection.close()
+
+    def close_all(self):
+        """
+        Close every pooled connection.
+        """
+        with self._lock:
+            entries, self._connections = list(self._connections.values()), {}
+        for entry in entries:
+            if entry.connection.is_open:
+                entry.connection.close()
+
+
+class KafkaProducerPool:
+    """
+    Process-wide pool of confluent-kafka producer clients shared by the Kafka producer adapters.
+
+    A librdkafka producer is thread-safe and can serve any number of topics,
+    so adapters with identical client configuration share one client and
+    its broker connections. Consumers are never pooled because each one
+    holds its own consumer group membership.
+    """
+
+    def __init__(self, create: Callable[[dict], "Producer"] = None):
+        """
+        :param create: Creates a new client, ``confluent_kafka.Producer`` by default.
+        """
+        self._create = create
+        self._producers = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, connection_params: dict, create: Callable[[dict], "Producer"] = None):
+        """
+        Return the shared client for this configuration, creating it on first use.
+
+        Every call must be paired with ``release``.
+
+        :param create: Creates the client if none is pooled yet, overriding the pool's default.
+        """
+        key = tuple(sorted((name, str(value)) for name, value in connection_params.items()))
+        with self._lock:
+            entry = self._producers.get(key)
+            if entry is None:
+                create = create or self._create
+                if create is None:
+                    from confluent_kafka import Producer
+                    create = Producer
+                entry = self._producers[key] = [create(connection_params), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, producer):
+        """
+        Give back an acquired client, dropping it from the pool once no adapter uses it.
+        """
+        with self._lock:
+            for key, entry in self._producers.items():
+                if entry[0] is producer:
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del self._producers[key]
+                    return
+
+
+rabbitmq_pool = RabbitMQConnectionPool()
+kafka_producer_pool = KafkaProducerPool()
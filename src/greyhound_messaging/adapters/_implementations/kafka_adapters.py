@@ -1,41 +1,134 @@
-from pydantic import ValidationError
 from greyhound_messaging.adapters._abstracts.core_messaging import ConsumerMessageAdapter, ProducerMessageAdapter
+from greyhound_messaging.adapters._implementations.connection_pool import KafkaProducerPool, kafka_producer_pool
+from greyhound_messaging.backpressure import Backpressure
+from greyhound_messaging.dispatch import KeyedDispatcher, OffsetTracker
 from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics
 from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
-from confluent_kafka import Consumer, Producer
+from greyhound_messaging.retry import RetryingConsumer
+from greyhound_messaging.serialization import DECODE_ERRORS, MessageDecodeError, MessageSerializer
+from concurrent.futures import Future
+from confluent_kafka import Consumer, KafkaError, KafkaException, Message, Producer, TopicPartition
+from functools import partial
+from typing import Callable
 import logging
-import json
+import queue
+import threading
+import time
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def headers_from_kafka(kafka_headers: list | None) -> dict:
+    """
+    Convert Kafka record headers into the adapter-neutral header mapping.
+    """
+    if not kafka_headers:
+        return {}
+    return {key: value.decode("utf-8") for key, value in kafka_headers if value is not None}
+
+
+def kafka_headers(headers: dict) -> list:
+    """
+    Convert adapter-neutral headers into Kafka record headers.
+    """
+    return [(key, value.encode("utf-8")) for key, value in headers.items()]
+
 class KafkaConsumerAdapter(ConsumerMessageAdapter):
     """
     Kafka implementation of the ConsumerMessageAdapter.
+
+    Messages are fetched in batches of up to ``batch_size`` and offsets are
+    committed asynchronously after every batch, or once ``commit_every``
+    messages have been processed or ``commit_interval_ms`` has elapsed when
+    either policy is configured.
+
+    When a dispatcher is supplied, messages are handed to its workers without
+    waiting for earlier ones to finish, up to ``max_in_flight`` at a time.
+    An OffsetTracker records which offsets have completed, and each commit
+    covers every partition's low-water mark: the offsets below the oldest
+    message still in flight. When partitions are revoked by a rebalance their
+    in-flight messages get up to ``revoke_timeout`` seconds to finish before
+    their final offsets are committed.
+
+    A message whose handler raises is fetched again, like a delivery
+    requeued by RabbitMQ: its partition is rewound to the failed offset and
+    the messages after it on that partition are fetched again too. Wrap the
+    consumer in a RetryingConsumer to retry with a backoff instead.
+
+    With a Backpressure, every assigned partition is paused while the
+    downstream producer is over budget and resumed once it has drained; the
+    consume loop keeps polling meanwhile so the consumer stays in its group.
     """
     def __init__(
             self, 
             consumer: GreyhoundConsumer, 
             queue_name: str,
-            connection_params: dict
+            connection_params: dict,
+            batch_size: int = 1,
+            batch_timeout: float = 1.0,
+            commit_every: int | None = None,
+            commit_interval_ms: int | None = None,
+            dispatcher: KeyedDispatcher | None = None,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            max_in_flight: int = 1000,
+            revoke_timeout: float = 10.0,
+            backpressure: Backpressure | None = None
             ):
         """
         Initialize the Kafka consumer adapter with connection parameters.
         
         :param connection_params: Parameters for connecting to Kafka.
+        :param batch_size: Maximum number of messages fetched per call to the broker.
+        :param batch_timeout: Seconds to wait for a batch to fill before dispatching it.
+        :param commit_every: Commit offsets after this many processed messages.
+        :param commit_interval_ms: Commit offsets at least this often while messages are pending.
+        :param dispatcher: Optional worker pool that runs the consumer's handler in parallel.
+        :param serializer: Decodes message bodies, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param max_in_flight: Maximum number of dispatched messages not handled yet.
+        :param revoke_timeout: Seconds a rebalance waits for in-flight messages of revoked partitions.
+        :param backpressure: Pauses consumption while the downstream producer is over budget.
         """
         self.consuming_object = consumer
         self.queue_name = queue_name
-        self.kafka_consumer = Consumer(connection_params)
+        # Offsets are stored by hand once a message is processed so a commit
+        # never covers messages still waiting in the current batch.
+        self.kafka_consumer = Consumer({**connection_params, 'enable.auto.offset.store': False})
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
+        self.dispatcher = dispatcher
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.max_in_flight = max(1, max_in_flight)
+        self.revoke_timeout = revoke_timeout
+        self.backpressure = backpressure
+        # Offsets are tracked one by one when handlers may finish out of order:
+        # on dispatcher lanes, or once the retries of a failed message are over.
+        self.tracker = OffsetTracker() if dispatcher is not None or isinstance(consumer, RetryingConsumer) else None
+        # Retried messages waiting to be handled again by the consume loop.
+        self._resubmitted = queue.SimpleQueue()
+        # (partition, offset) of dispatched messages whose handler raised, rewound by the consume loop.
+        self._failures = queue.SimpleQueue()
+        self._uncommitted = 0
+        self._first_uncommitted_at = None
+        self._last_commit = time.monotonic()
+        self._running = False
+        if metrics is not None:
+            metrics.track_buffer(lambda: self._uncommitted)
 
     @classmethod
-    def from_config(cls, consumer: GreyhoundConsumer, config: dict):
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict, backpressure: Backpressure | None = None):
         """
-        Create an instance of RabbitMQBlockingConsumerAdapter from configuration.
+        Create an instance of KafkaConsumerAdapter from configuration.
         
         :param consumer: The GreyhoundConsumer instance to use.
-        :param queue_name: The name of the RabbitMQ queue to consume from.
-        :return: An instance of RabbitMQBlockingConsumerAdapter.
+        :param config: Configuration dictionary containing connection parameters and topic name.
+        :param backpressure: Pauses consumption while the downstream producer is over budget.
+        :return: An instance of KafkaConsumerAdapter.
         """
 
         connection_params = {
@@ -44,52 +137,337 @@ class KafkaConsumerAdapter(ConsumerMessageAdapter):
             'auto.offset.reset': config.get("auto_offset_reset", "earliest"),
             'enable.auto.commit': config.get("enable_auto_commit", False),
         }
+        metrics = AdapterMetrics.from_config("KAFKA", "consumer", config)
 
-        return cls(consumer, config.get("queue"), connection_params)
+        return cls(
+            consumer,
+            config.get("queue"),
+            connection_params,
+            batch_size=config.get("batch_size", 1),
+            batch_timeout=config.get("batch_timeout", 1.0),
+            commit_every=config.get("commit_every"),
+            commit_interval_ms=config.get("commit_interval_ms"),
+            dispatcher=KeyedDispatcher.from_config(consumer, config.get("dispatch"), metrics=metrics),
+            serializer=MessageSerializer.from_config(config),
+            metrics=metrics,
+            max_in_flight=config.get("max_in_flight", 1000),
+            revoke_timeout=config.get("revoke_timeout", 10.0),
+            backpressure=backpressure
+        )
 
-    def consume(self) -> GreyhoundMessageRoot:
+    def consume(self):
         """
-        Consume a message from RabbitMQ.
+        Consume messages from Kafka until the adapter is closed.
         """
-        self.kafka_consumer.subscribe([self.queue_name])
-        while True:
-            msg = self.kafka_consumer.poll(timeout=1.0)
-            if msg is None:
+        callbacks = {}
+        if self.backpressure is not None:
+            callbacks["on_assign"] = self._on_assign
+        if self.tracker is not None:
+            callbacks["on_revoke"] = self._on_revoke
+        self.kafka_consumer.subscribe([self.queue_name], **callbacks)
+        self._running = True
+        while self._running:
+            if self.backpressure is not None:
+                self._apply_backpressure()
+            messages = self._fetch()
+            if messages:
+                self._process_batch(messages)
+            self._drain_resubmitted()
+            if self.tracker is not None:
+                self._rewind_failures()
+            self._maybe_commit()
+
+    def _fetch(self) -> list:
+        """
+        Fetch the next batch of messages from the broker.
+        """
+        if self.batch_size == 1:
+            msg = self.kafka_consumer.poll(timeout=self.batch_timeout)
+            return [] if msg is None else [msg]
+        return self.kafka_consumer.consume(num_messages=self.batch_size, timeout=self.batch_timeout)
+
+    def _process_batch(self, messages: list):
+        """
+        Decode and dispatch every message in a batch.
+        """
+        if self.metrics is not None and self._first_uncommitted_at is None:
+            self._first_uncommitted_at = time.perf_counter()
+        if self.dispatcher is not None:
+            self._dispatch_batch(messages)
+            return
+
+        tracker = self.tracker
+        failed = set()
+        for msg in messages:
+            partition = (msg.topic(), msg.partition())
+            if partition in failed:
+                # Fetched again after the rewind.
                 continue
-            if msg.error():
-                raise Exception(f"Error consuming message: {msg.error()}") 
+            greyhound_message = self._decode(msg)
+            offset = msg.offset()
+            if tracker is not None:
+                tracker.track(partition, offset)
+            result = None
+            if greyhound_message is not None:
+                try:
+                    result = self._handle(greyhound_message)
+                except MessageDecodeError as e:
+                    # A lazily decoded payload turned out to be invalid; fetching it again would not help.
+                    logger.error(f"Error decoding message: {e}")
+                except Exception as e:
+                    logger.error("Handler failed for offset %s of %s [%s], fetching it again: %s", offset, *partition, e)
+                    failed.add(partition)
+                    if tracker is not None:
+                        tracker.rewind(partition, offset)
+                    self._seek(partition, offset)
+                    continue
+            if tracker is None:
+                self.kafka_consumer.store_offsets(message=msg)
+                self._uncommitted += 1
+            elif isinstance(result, Future):
+                # Retries of a failed message hold on to its offset until they are over.
+                result.add_done_callback(partial(self._on_dispatched, partition, offset))
+            else:
+                tracker.complete(partition, offset)
+
+    def _dispatch_batch(self, messages: list):
+        """
+        Hand a batch to the dispatcher, tracking every offset until its handler has finished.
+        """
+        tracker = self.tracker
+        for msg in messages:
+            greyhound_message = self._decode(msg)
+            partition = (msg.topic(), msg.partition())
+            offset = msg.offset()
+            if not tracker.wait_for_capacity(self.max_in_flight, timeout=self.batch_timeout):
+                # Keep serving commits while every worker is busy.
+                self._maybe_commit()
+                tracker.wait_for_capacity(self.max_in_flight)
+            tracker.track(partition, offset)
+            if greyhound_message is None:
+                tracker.complete(partition, offset)
+                continue
+            self.dispatcher.submit(greyhound_message, partial(self._on_dispatched, partition, offset))
+
+    def _on_dispatched(self, partition: tuple, offset: int, future):
+        """
+        Called from a dispatcher worker once a handler has finished.
+
+        A handler returning a Future, as RetryingConsumer does for a failed
+        message, completes the offset once that future is done.
+        """
+        error = future.exception()
+        if error is None and isinstance(future.result(), Future):
+            future.result().add_done_callback(partial(self._on_dispatched, partition, offset))
+        elif isinstance(error, MessageDecodeError):
+            # A lazily decoded payload turned out to be invalid; fetching it again would not help.
+            logger.error(f"Error decoding message: {error}")
+            self.tracker.complete(partition, offset)
+        elif error is None:
+            self.tracker.complete(partition, offset)
+        else:
+            logger.error("Handler failed for offset %s of %s [%s], fetching it again: %s", offset, *partition, error)
+            self._failures.put((partition, offset))
+
+    def _rewind_failures(self):
+        """
+        Rewind every partition with a failed message to its earliest failed offset.
+        """
+        earliest = {}
+        while True:
             try:
-                raw = json.loads(msg.value().decode("utf-8"))
-                greyhound_message = GreyhoundMessageRoot(**raw)
-                self.consuming_object.message_received(greyhound_message)
-                self.kafka_consumer.commit()
-                return greyhound_message
-            except (json.JSONDecodeError, ValidationError) as e:
-                # Log or push to DLQ
-                logging.error(f"Error decoding message: {e}")
-            
+                partition, offset = self._failures.get_nowait()
+            except queue.Empty:
+                break
+            earliest[partition] = min(offset, earliest.get(partition, offset))
+        for partition, offset in earliest.items():
+            if self.tracker.rewind(partition, offset):
+                self._seek(partition, offset)
+
+    def _seek(self, partition: tuple, offset: int):
+        if self.metrics is not None:
+            self.metrics.nacked.inc()
+        try:
+            self.kafka_consumer.seek(TopicPartition(*partition, offset))
+        except KafkaException as e:
+            # The partition was revoked meanwhile; its next owner starts from the last commit.
+            logger.warning("Failed to rewind %s [%s] to offset %s: %s", *partition, offset, e)
+
+    def _apply_backpressure(self):
+        """
+        Pause or resume every assigned partition when the downstream producer crosses its budget.
+        """
+        paused = self.backpressure.update()
+        if paused is True:
+            self.kafka_consumer.pause(self.kafka_consumer.assignment())
+        elif paused is False:
+            self.kafka_consumer.resume(self.kafka_consumer.assignment())
+
+    def _on_assign(self, consumer, partitions: list):
+        """
+        Keep partitions assigned by a rebalance paused while the downstream producer is over budget.
+        """
+        if self.backpressure.paused:
+            consumer.pause(partitions)
+
+    def _on_revoke(self, consumer, partitions: list):
+        """
+        Commit what was handled on partitions taken away by a rebalance and stop tracking them.
+        """
+        offsets = self.tracker.revoke(((tp.topic, tp.partition) for tp in partitions), timeout=self.revoke_timeout)
+        if offsets:
+            self._commit_offsets(offsets, asynchronous=False)
+
+    def _handle(self, greyhound_message: GreyhoundMessageRoot):
+        if self.metrics is None:
+            return self.consuming_object.message_received(greyhound_message)
+        return self.metrics.handle(self.consuming_object.message_received, greyhound_message)
+
+    def resubmit(self, greyhound_message: GreyhoundMessageRoot):
+        """
+        Handle a message again on its dispatcher lane, or on the consume loop after the current poll; safe to call from any thread.
+
+        RetryingConsumer redelivers through here so a retried handler never
+        runs on its scheduler thread, next to the consume loop.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.submit(greyhound_message)
+        else:
+            self._resubmitted.put(greyhound_message)
+
+    def _drain_resubmitted(self):
+        while True:
+            try:
+                greyhound_message = self._resubmitted.get_nowait()
+            except queue.Empty:
+                return
+            self._handle(greyhound_message)
+
+    def _decode(self, msg) -> GreyhoundMessageRoot | None:
+        if msg.error():
+            raise Exception(f"Error consuming message: {msg.error()}") 
+        try:
+            if self.metrics is None:
+                return self.serializer.decode(msg.value(), headers_from_kafka(msg.headers()))
+            return self.metrics.decode(self.serializer.decode, msg.value(), headers_from_kafka(msg.headers()))
+        except DECODE_ERRORS as e:
+            # Log or push to DLQ
+            logger.error(f"Error decoding message: {e}")
             return None
 
+    def _maybe_commit(self):
+        """
+        Commit offsets asynchronously if the size or interval policy is met.
+        """
+        if self.tracker is not None:
+            self._uncommitted = self.tracker.uncommitted
+        if self._uncommitted == 0:
+            return
+        if self.commit_every is None and self.commit_interval_ms is None:
+            self._commit(asynchronous=True)
+            return
+        elapsed_ms = (time.monotonic() - self._last_commit) * 1000
+        if (self.commit_every is not None and self._uncommitted >= self.commit_every) or (
+                self.commit_interval_ms is not None and elapsed_ms >= self.commit_interval_ms):
+            self._commit(asynchronous=True)
+
+    def _commit(self, asynchronous: bool):
+        """
+        Commit the offsets stored for every processed message.
+        """
+        if self.tracker is None:
+            self.kafka_consumer.commit(asynchronous=asynchronous)
+        else:
+            offsets = self.tracker.committable()
+            if offsets:
+                self._commit_offsets(offsets, asynchronous)
+        if self.metrics is not None:
+            self.metrics.observe_ack(self._first_uncommitted_at, count=self._uncommitted)
+            self._first_uncommitted_at = None
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+    def _commit_offsets(self, offsets: dict, asynchronous: bool):
+        partitions = [TopicPartition(topic, partition, offset) for (topic, partition), offset in offsets.items()]
+        try:
+            self.kafka_consumer.commit(offsets=partitions, asynchronous=asynchronous)
+        except KafkaException as e:
+            # A later commit covers these offsets again.
+            logger.warning("Failed to commit offsets %s: %s", partitions, e)
+
+    def stop(self):
+        """
+        Ask the consume loop to return after the current batch; safe to call from any thread.
+        """
+        self._running = False
+
+    def close(self):
+        """
+        Stop consuming, commit any outstanding offsets and leave the consumer group.
+        """
+        self._running = False
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        # Abandoned retries leave their offsets uncommitted, to be fetched again.
+        self.consuming_object.close()
+        if self.tracker is not None:
+            self._uncommitted = self.tracker.uncommitted
+        if self._uncommitted:
+            self._commit(asynchronous=False)
+        self.kafka_consumer.close()
+
 
 class KafkaProducerAdapter(ProducerMessageAdapter):
     """
-    RabbitMQ implementation of the ProducerMessageAdapter.
+    Kafka implementation of the ProducerMessageAdapter.
+
+    ``produce`` hands the record to librdkafka and returns immediately;
+    batching is left to librdkafka (``linger.ms``, ``batch.size``) and a
+    background thread polls the producer so delivery reports are served as
+    they arrive. Failed deliveries are passed to ``on_delivery_error``, or
+    logged when no callback is given. When the local queue is full,
+    ``produce`` keeps serving delivery reports until there is room again or
+    ``block_timeout`` elapses.
     """
 
     def __init__(
             self, 
             queue_name: str,
             connection_params: dict,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            poll_interval: float = 0.1,
+            block_timeout: float | None = 30.0,
+            on_delivery_error: Callable[[KafkaError, Message], None] | None = None,
+            pool: KafkaProducerPool | None = None
             ):
         """
         Initialize the Kafka producer adapter with connection parameters.
         
         :param connection_params: Parameters for connecting to Kafka.
+        :param serializer: Encodes outgoing messages, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param poll_interval: Seconds the background thread waits for delivery reports per poll.
+        :param block_timeout: Seconds produce waits for room in a full local queue before raising BufferError, None to wait forever.
+        :param on_delivery_error: Called with the error and the record for every failed delivery.
+        :param pool: Shares the client with other producers using the same configuration; a dedicated client is created when None.
         """
         self.queue_name = queue_name
-        self.producer = Producer(connection_params)
-        self.flush_every = connection_params.get("flush_every", 1000)
-        self.producer_msg_count = 0
+        self.serializer = serializer or MessageSerializer()
+        self.pool = pool
+        self.producer = pool.acquire(connection_params, Producer) if pool is not None else Producer(connection_params)
+        self.metrics = metrics
+        self.poll_interval = poll_interval
+        self.block_timeout = block_timeout
+        self.on_delivery_error = on_delivery_error
+        self.delivery_failures = 0
+        self._pending_bytes = 0
+        self._pending_lock = threading.Lock()
+        if metrics is not None:
+            metrics.track_buffer(lambda: len(self.producer))
+        self._running = True
+        self._poller = threading.Thread(target=self._poll_loop, name="greyhound-kafka-poller", daemon=True)
+        self._poller.start()
 
     @classmethod
     def from_config(cls, config: dict):
@@ -102,26 +480,120 @@ class KafkaProducerAdapter(ProducerMessageAdapter):
         connection_params = {
             'bootstrap.servers': config.get("bootstrap_servers", "localhost:9092"),
             'client.id': config.get("client_id", "greyhound_producer"),
-            'enable.auto.commit': False,
+            'linger.ms': config.get("linger_ms", 5),
+            'batch.size': config.get("batch_size", 1000000),
+            'compression.type': config.get("compression_type", "none"),
+            'acks': config.get("acks", "all"),
         }
         
-        return cls(queue_name=config.get("queue"), connection_params=connection_params)
+        return cls(
+            queue_name=config.get("queue"),
+            connection_params=connection_params,
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("KAFKA", "producer", config),
+            poll_interval=config.get("poll_interval", 0.1),
+            block_timeout=config.get("block_timeout", 30.0),
+            pool=kafka_producer_pool if config.get("share_connection", True) else None
+        )
+
+    def _poll_loop(self):
+        while self._running:
+            self.producer.poll(self.poll_interval)
 
     def produce(self, message: GreyhoundMessageRoot):
         """
-        Produce a message to Kafka.
+        Produce a message to Kafka without waiting for it to be delivered.
         """
-        try:
-            raw = message.model_dump_json()
-            self.producer.produce(self.queue_name, value=raw.encode("utf-8"))
-            # flush here is not scalable and should be changed to a more efficient batching mechanism
-            self.producer_msg_count += 1
-            if self.producer_msg_count == self.flush_every:
-                self.producer.flush()
-                self.producer_msg_count = 0
-        except Exception as e:
-            # Log or push to DLQ
-            raise Exception(f"Error producing message: {e}")
+        self._produce(message, self._on_delivery)
+
+    def send(self, message: GreyhoundMessageRoot) -> Future:
+        """
+        Produce a message to Kafka and return a future for its delivery.
+
+        :return: A future resolving to the delivered record, or failing with a KafkaException.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def on_delivery(err, msg):
+            self._on_delivery(err, msg)
+            if err is not None:
+                future.set_exception(KafkaException(err))
+            else:
+                future.set_result(msg)
+
+        self._produce(message, on_delivery)
+        return future
+
+    def _produce(self, message: GreyhoundMessageRoot, on_delivery: Callable):
+        started = time.perf_counter() if self.metrics is not None else 0
+        body, headers = self.serializer.encode(message)
+        record_headers = kafka_headers(headers)
+        deadline = None
+        while True:
+            try:
+                self.producer.produce(self.queue_name, value=body, headers=record_headers, on_delivery=on_delivery)
+                break
+            except BufferError:
+                # The local queue is full: serve delivery reports to make room.
+                if deadline is None and self.block_timeout is not None:
+                    deadline = time.monotonic() + self.block_timeout
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+                self.producer.poll(self.poll_interval)
+        with self._pending_lock:
+            self._pending_bytes += len(body)
+        if self.metrics is not None:
+            self.metrics.observe_produce(started)
+
+    @property
+    def backlog(self) -> tuple[int, int]:
+        """
+        Messages awaiting delivery in the client's local queue, and the bytes this adapter has in it.
+        """
+        return len(self.producer), self._pending_bytes
+
+    def _on_delivery(self, err, msg):
+        """
+        Delivery report callback, served by whichever thread polls the producer.
+        """
+        value = msg.value()
+        with self._pending_lock:
+            self._pending_bytes -= len(value) if value else 0
+        if err is None:
+            if self.metrics is not None:
+                self.metrics.acked.inc()
+                latency = msg.latency()
+                if latency is not None:
+                    self.metrics.ack_latency_seconds.observe(latency)
+            return
+
+        self.delivery_failures += 1
+        if self.metrics is not None:
+            self.metrics.nacked.inc()
+        if self.on_delivery_error is not None:
+            self.on_delivery_error(err, msg)
+        else:
+            logger.error(f"Failed to deliver message to {msg.topic()}: {err}")
+
+    def flush(self, timeout: float | None = None) -> int:
+        """
+        Wait until every produced message has been delivered or has failed.
+
+        :param timeout: Seconds to wait, None to wait until the queue is empty.
+        :return: Number of messages still awaiting delivery.
+        """
+        return self.producer.flush() if timeout is None else self.producer.flush(timeout)
 
     def flush_all(self):
-        self.producer.flush()
\ No newline at end of file
+        self.flush()
+
+    def close(self):
+        """
+        Deliver every outstanding message and stop the background poller.
+        """
+        self.flush()
+        self._running = False
+        self._poller.join()
+        if self.pool is not None:
+            self.pool.release(self.producer)
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import time
+
+from greyhound_messaging.adapters._abstracts.core_messaging import AsyncConsumerMessageAdapter, AsyncProducerMessageAdapter
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer, dispatch_async
+from greyhound_messaging.metrics import AdapterMetrics
+from greyhound_messaging.adapters._implementations.kafka_adapters import headers_from_kafka, kafka_headers
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import DECODE_ERRORS, MessageDecodeError, MessageSerializer
+
+logger = logging.getLogger(__name__)
+
+try:
+    from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+except ImportError:  # pragma: no cover - optional dependency
+    AIOKafkaConsumer = AIOKafkaProducer = None
+
+
+def _require_aiokafka():
+    if AIOKafkaConsumer is None:
+        raise ImportError("The asyncio Kafka adapters require aiokafka: pip install greyhound-messaging[async]")
+
+
+class KafkaAsyncConsumerAdapter(AsyncConsumerMessageAdapter):
+    """
+    asyncio Kafka implementation of the AsyncConsumerMessageAdapter.
+
+    Each fetched batch is dispatched concurrently, with at most ``max_in_flight``
+    handlers running at once, and its offsets are committed once every message
+    in the batch has been handled. When a handler raises, its partition is
+    rewound to the failed offset and only the offsets before it are committed,
+    so the message is fetched and handled again.
+    """
+    def __init__(
+            self,
+            consumer: GreyhoundConsumer,
+            queue_name: str,
+            connection_params: dict,
+            batch_size: int = 500,
+            batch_timeout_ms: int = 1000,
+            max_in_flight: int = 1000,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None
+            ):
+        """
+        Initialize the asyncio Kafka consumer adapter with connection parameters.
+
+        :param connection_params: Keyword arguments for AIOKafkaConsumer.
+        :param batch_size: Maximum number of records fetched per batch.
+        :param batch_timeout_ms: Milliseconds to wait for a batch to fill.
+        :param max_in_flight: Maximum number of handlers running at once.
+        :param serializer: Decodes message bodies, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        """
+        _require_aiokafka()
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.consumer = consumer
+        self.queue_name = queue_name
+        self.connection_params = connection_params
+        self.batch_size = batch_size
+        self.batch_timeout_ms = batch_timeout_ms
+        self.max_in_flight = max_in_flight
+        self.kafka_consumer = None
+        self._running = False
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict):
+        """
+        Create an instance of KafkaAsyncConsumerAdapter from configuration.
+
+        :param consumer: The GreyhoundConsumer instance to use.
+        :param config: Configuration dictionary containing connection parameters and topic name.
+        :return: An instance of KafkaAsyncConsumerAdapter.
+        """
+        connection_params = {
+            "bootstrap_servers": config.get("bootstrap_servers", "localhost:9092"),
+            "group_id": config.get("group_id", "greyhound_group"),
+            "auto_offset_reset": config.get("auto_offset_reset", "earliest"),
+            "enable_auto_commit": False,
+        }
+
+        return cls(
+            consumer,
+            config.get("queue"),
+            connection_params,
+            batch_size=config.get("batch_size", 500),
+            batch_timeout_ms=config.get("batch_timeout_ms", 1000),
+            max_in_flight=config.get("max_in_flight", 1000),
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("KAFKA", "consumer", config)
+        )
+
+    async def consume(self):
+        """
+        Consume messages from Kafka until the adapter is closed.
+        """
+        self.kafka_consumer = AIOKafkaConsumer(self.queue_name, **self.connection_params)
+        await self.kafka_consumer.start()
+        self._running = True
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        try:
+            while self._running:
+                batches = await self.kafka_consumer.getmany(
+                    timeout_ms=self.batch_timeout_ms,
+                    max_records=self.batch_size
+                )
+                records = [record for partition_records in batches.values() for record in partition_records]
+                if not records:
+                    continue
+                fetched_at = time.perf_counter() if self.metrics is not None else 0
+                handled = await asyncio.gather(*(self._handle(record, semaphore) for record in records))
+                if all(handled):
+                    await self.kafka_consumer.commit()
+                else:
+                    await self._rewind(batches, records, handled)
+                if self.metrics is not None:
+                    self.metrics.observe_ack(fetched_at, count=sum(handled))
+        finally:
+            try:
+                self.consumer.close()
+            finally:
+                await self.kafka_consumer.stop()
+
+    async def _rewind(self, batches: dict, records: list, handled: list):
+        """
+        Rewind every partition with a failed record to its earliest failed offset and commit the offsets before it.
+        """
+        # Keyed by (topic, partition), which compares equal to the TopicPartition keys of the batches.
+        failed = {}
+        for record, ok in zip(records, handled):
+            if not ok:
+                key = (record.topic, record.partition)
+                failed[key] = min(record.offset, failed.get(key, record.offset))
+        offsets = {}
+        for partition, partition_records in batches.items():
+            offset = failed.get(partition)
+            if offset is None:
+                offsets[partition] = partition_records[-1].offset + 1
+            else:
+                offsets[partition] = offset
+                self.kafka_consumer.seek(partition, offset)
+                if self.metrics is not None:
+                    self.metrics.nacked.inc()
+        await self.kafka_consumer.commit(offsets)
+
+    async def _handle(self, record, semaphore: asyncio.Semaphore) -> bool:
+        """
+        Decode and dispatch a record.
+
+        :return: False when the handler raised and the record must be fetched again.
+        """
+        metrics = self.metrics
+        try:
+            if metrics is None:
+                greyhound_message = self.serializer.decode(record.value, headers_from_kafka(record.headers))
+            else:
+                greyhound_message = metrics.decode(self.serializer.decode, record.value, headers_from_kafka(record.headers))
+        except DECODE_ERRORS as e:
+            # Log or push to DLQ
+            logger.error(f"Error decoding message: {e}")
+            return True
+
+        async with semaphore:
+            try:
+                if metrics is None:
+                    await dispatch_async(self.consumer, greyhound_message)
+                else:
+                    await metrics.handle_async(self._dispatch, greyhound_message)
+            except MessageDecodeError as e:
+                # A lazily decoded payload turned out to be invalid; fetching it again would not help.
+                logger.error(f"Error decoding message: {e}")
+            except Exception:
+                logger.exception("Handler failed for offset %s of %s [%s], fetching it again", record.offset, record.topic, record.partition)
+                return False
+        return True
+
+    async def _dispatch(self, greyhound_message: GreyhoundMessageRoot):
+        return await dispatch_async(self.consumer, greyhound_message)
+
+    async def close(self):
+        """
+        Stop consuming once the current batch has been handled and committed, then close the consumer.
+        """
+        self._running = False
+
+
+class KafkaAsyncProducerAdapter(AsyncProducerMessageAdapter):
+    """
+    asyncio Kafka implementation of the AsyncProducerMessageAdapter.
+
+    ``produce`` enqueues the record and returns without waiting for the broker;
+    the returned future resolves with the record metadata once it is delivered.
+    """
+
+    def __init__(
+            self,
+            queue_name: str,
+            connection_params: dict,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None
+            ):
+        """
+        Initialize the asyncio Kafka producer adapter with connection parameters.
+
+        :param connection_params: Keyword arguments for AIOKafkaProducer.
+        :param serializer: Encodes outgoing messages, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        """
+        _require_aiokafka()
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.queue_name = queue_name
+        self.connection_params = connection_params
+        self.producer = None
+        self._start_lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create an instance of KafkaAsyncProducerAdapter from configuration.
+
+        :param config: Configuration dictionary containing connection parameters and topic name.
+        :return: An instance of KafkaAsyncProducerAdapter.
+        """
+        connection_params = {
+            "bootstrap_servers": config.get("bootstrap_servers", "localhost:9092"),
+            "client_id": config.get("client_id", "greyhound_producer"),
+        }
+        return cls(
+            queue_name=config.get("queue"),
+            connection_params=connection_params,
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("KAFKA", "producer", config)
+        )
+
+    async def _ensure_producer(self):
+        async with self._start_lock:
+            if self.producer is None:
+                producer = AIOKafkaProducer(**self.connection_params)
+                await producer.start()
+                self.producer = producer
+        return self.producer
+
+    async def produce(self, message: GreyhoundMessageRoot) -> asyncio.Future:
+        """
+        Produce a message to Kafka.
+        """
+        producer = self.producer or await self._ensure_producer()
+        started = time.perf_counter() if self.metrics is not None else 0
+        body, headers = self.serializer.encode(message)
+        future = await producer.send(self.queue_name, value=body, headers=kafka_headers(headers))
+        if self.metrics is not None:
+            self.metrics.observe_produce(started)
+        return future
+
+    async def flush(self):
+        """
+        Wait until every enqueued record has been delivered.
+        """
+        if self.producer is not None:
+            await self.producer.flush()
+
+    async def close(self):
+        """
+        Deliver any outstanding records and stop the producer.
+        """
+        if self.producer is not None:
+            await self.producer.stop()
+            self.producer = None
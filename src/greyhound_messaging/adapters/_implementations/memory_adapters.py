@@ -0,0 +1,272 @@
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+
+from greyhound_messaging.adapters._abstracts.core_messaging import ConsumerMessageAdapter, ProducerMessageAdapter
+from greyhound_messaging.backpressure import Backpressure
+from greyhound_messaging.dispatch import KeyedDispatcher
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import DECODE_ERRORS, MessageDecodeError, MessageSerializer
+
+logger = logging.getLogger(__name__)
+
+_queues: dict = {}
+_queues_lock = threading.Lock()
+
+
+def get_queue(name: str, maxsize: int = 0, process_shared: bool = False):
+    """
+    Return the in-memory queue with the given name, creating it on first use.
+
+    Unbounded queues are lock-free SimpleQueues; bounded queues block producers
+    once ``maxsize`` messages are waiting. Process-shared queues are backed by
+    multiprocessing and must be created before worker processes are forked.
+
+    :param name: The queue name, shared by every adapter in the process.
+    :param maxsize: Maximum number of waiting messages, 0 for unbounded.
+    :param process_shared: Back the queue with multiprocessing so forked processes share it.
+    """
+    existing = _queues.get(name)
+    if existing is not None:
+        return existing
+    with _queues_lock:
+        if name not in _queues:
+            if process_shared:
+                _queues[name] = multiprocessing.Queue(maxsize)
+            elif maxsize > 0:
+                _queues[name] = queue.Queue(maxsize)
+            else:
+                _queues[name] = queue.SimpleQueue()
+        return _queues[name]
+
+
+def reset_queues():
+    """
+    Discard every in-memory queue and any messages still waiting in them.
+    """
+    with _queues_lock:
+        _queues.clear()
+
+
+class MemoryConsumerAdapter(ConsumerMessageAdapter):
+    """
+    In-memory implementation of the ConsumerMessageAdapter.
+
+    Messages travel through named in-process queues as encoded bodies, so the
+    codec and dispatch paths are exercised exactly as with a network broker.
+    With a Backpressure, the consume loop stops taking messages off the queue
+    while the downstream producer is over budget.
+    """
+    def __init__(
+            self,
+            consumer: GreyhoundConsumer,
+            queue_name: str,
+            maxsize: int = 0,
+            process_shared: bool = False,
+            poll_timeout: float = 0.1,
+            dispatcher: KeyedDispatcher | None = None,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            backpressure: Backpressure | None = None
+            ):
+        """
+        Initialize the in-memory consumer adapter.
+
+        :param maxsize: Maximum number of waiting messages if the queue is created by this adapter.
+        :param process_shared: Share the queue with forked processes.
+        :param poll_timeout: Seconds to wait for a message before checking whether the adapter was closed.
+        :param dispatcher: Optional worker pool that runs the consumer's handler in parallel.
+        :param serializer: Decodes message bodies, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param backpressure: Pauses consumption while the downstream producer is over budget.
+        """
+        self.consumer = consumer
+        self.queue_name = queue_name
+        self.queue = get_queue(queue_name, maxsize, process_shared)
+        self.poll_timeout = poll_timeout
+        self.dispatcher = dispatcher
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        if metrics is not None and not process_shared:
+            metrics.track_buffer(self.queue.qsize)
+        self.backpressure = backpressure
+        # Retried messages waiting to be handled again by the consume loop.
+        self._resubmitted = queue.SimpleQueue()
+        self._running = False
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict, backpressure: Backpressure | None = None):
+        """
+        Create an instance of MemoryConsumerAdapter from configuration.
+
+        :param consumer: The GreyhoundConsumer instance to use.
+        :param config: Configuration dictionary containing the queue name.
+        :param backpressure: Pauses consumption while the downstream producer is over budget.
+        :return: An instance of MemoryConsumerAdapter.
+        """
+        metrics = AdapterMetrics.from_config("MEMORY", "consumer", config)
+        return cls(
+            consumer,
+            config.get("queue"),
+            maxsize=config.get("maxsize", 0),
+            process_shared=config.get("process_shared", False),
+            poll_timeout=config.get("poll_timeout", 0.1),
+            dispatcher=KeyedDispatcher.from_config(consumer, config.get("dispatch"), metrics=metrics),
+            serializer=MessageSerializer.from_config(config),
+            metrics=metrics,
+            backpressure=backpressure
+        )
+
+    def consume(self):
+        """
+        Consume messages from the in-memory queue until the adapter is closed.
+        """
+        self._running = True
+        while self._running:
+            self._drain_resubmitted()
+            if self.backpressure is not None:
+                self.backpressure.update()
+                if self.backpressure.paused:
+                    time.sleep(self.backpressure.check_interval)
+                    continue
+            try:
+                body, headers = self.queue.get(timeout=self.poll_timeout)
+            except queue.Empty:
+                continue
+            self.message_received(body, headers)
+
+    def message_received(self, body: bytes, headers: dict):
+        """
+        Callback for when a message is received.
+        """
+        metrics = self.metrics
+        try:
+            if metrics is None:
+                greyhound_message = self.serializer.decode(body, headers)
+            else:
+                greyhound_message = metrics.decode(self.serializer.decode, body, headers)
+        except DECODE_ERRORS as e:
+            # Log or push to DLQ
+            logger.error(f"Error decoding message: {e}")
+            return
+
+        if self.dispatcher is not None:
+            self.dispatcher.submit(greyhound_message)
+            return
+        try:
+            self._handle(greyhound_message)
+        except MessageDecodeError as e:
+            # A lazily decoded payload turned out to be invalid.
+            logger.error(f"Error decoding message: {e}")
+
+    def _handle(self, greyhound_message: GreyhoundMessageRoot):
+        if self.metrics is None:
+            self.consumer.message_received(greyhound_message)
+        else:
+            self.metrics.handle(self.consumer.message_received, greyhound_message)
+
+    def resubmit(self, greyhound_message: GreyhoundMessageRoot):
+        """
+        Handle a message again on its dispatcher lane, or on the consume loop; safe to call from any thread.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.submit(greyhound_message)
+        else:
+            self._resubmitted.put(greyhound_message)
+
+    def _drain_resubmitted(self):
+        while True:
+            try:
+                greyhound_message = self._resubmitted.get_nowait()
+            except queue.Empty:
+                return
+            self._handle(greyhound_message)
+
+    def stop(self):
+        """
+        Ask the consume loop to return; safe to call from any thread.
+        """
+        self._running = False
+
+    def close(self):
+        """
+        Stop consuming, wait for in-flight handlers and close the consumer.
+        """
+        self._running = False
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        self.consumer.close()
+
+
+class MemoryProducerAdapter(ProducerMessageAdapter):
+    """
+    In-memory implementation of the ProducerMessageAdapter.
+    """
+
+    def __init__(
+            self,
+            queue_name: str,
+            maxsize: int = 0,
+            process_shared: bool = False,
+            block_timeout: float | None = None,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None
+            ):
+        """
+        Initialize the in-memory producer adapter.
+
+        :param maxsize: Maximum number of waiting messages if the queue is created by this adapter.
+        :param process_shared: Share the queue with forked processes.
+        :param block_timeout: Seconds to wait for space in a full queue before raising queue.Full, None to wait forever.
+        :param serializer: Encodes outgoing messages, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        """
+        self.queue_name = queue_name
+        self.queue = get_queue(queue_name, maxsize, process_shared)
+        self.block_timeout = block_timeout
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create an instance of MemoryProducerAdapter from configuration.
+
+        :param config: Configuration dictionary containing the queue name.
+        :return: An instance of MemoryProducerAdapter.
+        """
+        return cls(
+            queue_name=config.get("queue"),
+            maxsize=config.get("maxsize", 0),
+            process_shared=config.get("process_shared", False),
+            block_timeout=config.get("block_timeout"),
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("MEMORY", "producer", config)
+        )
+
+    def produce(self, message: GreyhoundMessageRoot):
+        """
+        Produce a message to the in-memory queue.
+        """
+        if self.metrics is None:
+            self.queue.put(self.serializer.encode(message), timeout=self.block_timeout)
+            return
+        started = time.perf_counter()
+        self.queue.put(self.serializer.encode(message), timeout=self.block_timeout)
+        self.metrics.observe_produce(started)
+
+    @property
+    def backlog(self) -> tuple[int, int]:
+        """
+        Messages waiting in the queue; their bytes are not tracked.
+        """
+        return self.queue.qsize(), 0
+
+    def flush_all(self):
+        """
+        Messages are handed over as soon as they are produced, so there is nothing to flush.
+        """
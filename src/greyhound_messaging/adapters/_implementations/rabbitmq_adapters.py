@@ -1,61 +1,216 @@
-
-from curses import raw
-
-from pydantic import ValidationError
-from greyhound_messaging.adapters._abstracts.core_messaging import ConsumerMessageAdapter, ProducerMessageAdapter
+from greyhound_messaging.adapters._abstracts.core_messaging import BufferedProducerMessageAdapter, ConsumerMessageAdapter, ProducerMessageAdapter
+from greyhound_messaging.backpressure import Backpressure
+from greyhound_messaging.adapters._implementations.connection_pool import RabbitMQConnectionPool, rabbitmq_pool
+from greyhound_messaging.dispatch import KeyedDispatcher
 from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics
 from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import CONTENT_ENCODING_HEADER, CONTENT_TYPE_HEADER, DECODE_ERRORS, MessageDecodeError, MessageSerializer
+from concurrent.futures import Future
+from functools import partial
+import logging
 import pika
-import json
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def connection_params_from_config(config: dict) -> pika.ConnectionParameters:
+    """
+    Build pika connection parameters from a producer or consumer configuration section.
+    """
+    return pika.ConnectionParameters(
+        host = config.get("host", "localhost"),
+        port = config.get("port", 5672),
+        virtual_host = config.get("virtual_host", "/"),
+        credentials = pika.PlainCredentials(
+            username = config.get("credentials", {}).get("username", "guest"),
+            password = config.get("credentials", {}).get("password", "guest")
+        )
+    )
+
+
+def headers_from_properties(properties: pika.BasicProperties | None) -> dict:
+    """
+    Flatten the AMQP properties of a delivery into the adapter-neutral header mapping.
+    """
+    if properties is None:
+        return {}
+    headers = dict(properties.headers or {})
+    if properties.content_type is not None:
+        headers[CONTENT_TYPE_HEADER] = properties.content_type
+    if properties.content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = properties.content_encoding
+    return headers
+
+
+def properties_from_headers(headers: dict, priority: int | None = None) -> pika.BasicProperties:
+    """
+    Map adapter-neutral headers, and an optional message priority, onto AMQP properties for publishing.
+    """
+    headers = dict(headers)
+    content_type = headers.pop(CONTENT_TYPE_HEADER, None)
+    content_encoding = headers.pop(CONTENT_ENCODING_HEADER, None)
+    return pika.BasicProperties(content_type=content_type, content_encoding=content_encoding, headers=headers or None, priority=priority)
+
+
+def queue_arguments(max_priority: int | None) -> dict | None:
+    """
+    The ``queue_declare`` arguments for a queue, making it a priority queue when ``max_priority`` is set.
+    """
+    if not max_priority:
+        return None
+    return {"x-max-priority": max_priority}
+
+
+def message_priority(message: GreyhoundMessageRoot, max_priority: int | None) -> int | None:
+    """
+    The publish priority of a message, its ``metadata.priority`` clamped to ``0..max_priority``.
+
+    None when priorities are disabled, so no priority property is sent.
+    """
+    if not max_priority:
+        return None
+    return min(max(message.metadata.priority or 0, 0), max_priority)
+
 
 class RabbitMQBlockingConsumerAdapter(ConsumerMessageAdapter):
     """
     RabbitMQ implementation of the ConsumerMessageAdapter.
+
+    When ``ack_batch_size`` or ``ack_batch_interval_ms`` is set, processed
+    deliveries are acknowledged together by acking the highest delivery tag
+    with ``multiple=True`` instead of one round-trip per message. With only
+    ``ack_batch_interval_ms`` set, acks are also flushed once
+    ``prefetch_count`` deliveries are waiting, since the broker sends no more
+    until some are acknowledged.
+
+    When a dispatcher is supplied, handlers run on its workers and each
+    delivery is only acknowledged once its handler has finished. Batched
+    acknowledgements never cover a delivery that is still in flight.
+
+    With a Backpressure, the prefetch window shrinks to ``paused_prefetch``
+    and acknowledgements are held back while the downstream producer is over
+    budget, so the broker stops pushing deliveries; they are released and the
+    window restored once the producer has drained.
     """
     def __init__(
             self, 
             consumer: GreyhoundConsumer, 
             queue_name: str,
-            connection_params: pika.ConnectionParameters
+            connection_params: pika.ConnectionParameters,
+            prefetch_count: int | None = None,
+            ack_batch_size: int = 1,
+            ack_batch_interval_ms: int | None = None,
+            dispatcher: KeyedDispatcher | None = None,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            pool: RabbitMQConnectionPool | None = None,
+            max_priority: int | None = None,
+            backpressure: Backpressure | None = None
             ):
         """
         Initialize the RabbitMQ consumer adapter with connection parameters.
         
         :param connection_params: Parameters for connecting to RabbitMQ.
+        :param prefetch_count: Maximum number of unacknowledged deliveries the broker may push.
+        :param ack_batch_size: Acknowledge processed deliveries once this many are pending.
+        :param ack_batch_interval_ms: Acknowledge pending deliveries at least this often.
+        :param dispatcher: Optional worker pool that runs the consumer's handler off the connection thread.
+        :param serializer: Decodes message bodies, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param pool: Shares the connection with other adapters on this thread; a dedicated connection is opened when None.
+        :param max_priority: Declare the queue as a priority queue with priorities ``0..max_priority``.
+        :param backpressure: Stops deliveries while the downstream producer is over budget.
         """
+        if prefetch_count and ack_batch_size > prefetch_count:
+            raise ValueError(
+                f"ack_batch_size ({ack_batch_size}) cannot exceed prefetch_count ({prefetch_count})"
+            )
+
         self.connection_params: pika.ConnectionParameters = connection_params
-        self.connection = pika.BlockingConnection(self.connection_params)
+        self.pool = pool
+        self.connection = pool.acquire(connection_params) if pool is not None else pika.BlockingConnection(connection_params)
         self.channel = self.connection.channel()
         self.queue_name = queue_name
-        self.channel.queue_declare(queue_name)
+        self.max_priority = max_priority
+        self.channel.queue_declare(queue_name, arguments=queue_arguments(max_priority))
         self.consumer = consumer
+        self.prefetch_count = prefetch_count
+        self.ack_batch_size = max(1, ack_batch_size)
+        self.ack_batch_interval_ms = ack_batch_interval_ms
+        # Pending acks that trigger a flush. With only an interval configured, acks are
+        # flushed early just once the whole prefetch window is waiting on them.
+        if ack_batch_interval_ms is not None and self.ack_batch_size == 1:
+            self._ack_flush_size = prefetch_count or float("inf")
+        else:
+            self._ack_flush_size = self.ack_batch_size
+        self.dispatcher = dispatcher
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        # Receive time of every unacknowledged delivery, only kept while metrics are enabled.
+        self._received_at = {}
+        if metrics is not None:
+            metrics.track_buffer(lambda: len(self._received_at))
+        self._pending_acks = 0
+        # Delivery tags are settled out of order when a dispatcher is used, so
+        # batched acks only ever cover the contiguous run of settled tags.
+        self._settled = {}
+        self._settled_floor = 0
+        self._ack_target = 0
+        self._acked_upto = 0
+        self._last_ack = time.monotonic()
+        self.backpressure = backpressure
+        # Delivery tags whose acknowledgement is held back while paused, None while consuming normally.
+        self._held_acks = None
+        self._backpressure_timer = False
 
     @classmethod
-    def from_config(cls, consumer: GreyhoundConsumer, config: dict):
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict, backpressure: Backpressure | None = None):
         """
         Create an instance of RabbitMQBlockingConsumerAdapter from configuration.
         
         :param consumer: The GreyhoundConsumer instance to use.
-        :param queue_name: The name of the RabbitMQ queue to consume from.
+        :param config: Configuration dictionary containing connection parameters and queue name.
+        :param backpressure: Stops deliveries while the downstream producer is over budget.
         :return: An instance of RabbitMQBlockingConsumerAdapter.
         """
 
-        connection_params = pika.ConnectionParameters(
-            host = config.get("host", "localhost"),
-            port = config.get("port", 5672),
-            virtual_host = config.get("virtual_host", "/"),
-            credentials = pika.PlainCredentials(
-                username = config.get("credentials", {}).get("username", "guest"),
-                password = config.get("credentials", {}).get("password", "guest")
-            )
+        connection_params = connection_params_from_config(config)
+        metrics = AdapterMetrics.from_config("RABBITMQ", "consumer", config)
+        share_connection = config.get("share_connection", False)
+        if share_connection and config.get("dispatch"):
+            # Dispatcher workers would use the connection while this thread blocks in start_consuming.
+            raise ValueError("share_connection cannot be combined with dispatch on a RabbitMQ consumer")
+
+        return cls(
+            consumer,
+            config.get("queue"),
+            connection_params,
+            prefetch_count=config.get("prefetch_count"),
+            ack_batch_size=config.get("ack_batch_size", 1),
+            ack_batch_interval_ms=config.get("ack_batch_interval_ms"),
+            dispatcher=KeyedDispatcher.from_config(consumer, config.get("dispatch"), metrics=metrics),
+            serializer=MessageSerializer.from_config(config),
+            metrics=metrics,
+            pool=rabbitmq_pool if share_connection else None,
+            max_priority=config.get("max_priority"),
+            backpressure=backpressure
         )
 
-        return cls(consumer, config.get("queue"), connection_params)
+    @property
+    def batches_acks(self) -> bool:
+        return self.ack_batch_size > 1 or self.ack_batch_interval_ms is not None
 
-    def consume(self) -> GreyhoundMessageRoot:
+    def consume(self):
         """
-        Consume a message from RabbitMQ.
+        Consume messages from RabbitMQ until the adapter is closed.
         """
+        if self.prefetch_count:
+            self.channel.basic_qos(prefetch_count=self.prefetch_count)
+        if self.ack_batch_interval_ms is not None:
+            self.connection.call_later(self.ack_batch_interval_ms / 1000, self._on_ack_timer)
         self.channel.basic_consume(queue=self.queue_name,
                       auto_ack=False,
                       on_message_callback=self.message_received)
@@ -65,37 +220,272 @@ class RabbitMQBlockingConsumerAdapter(ConsumerMessageAdapter):
         """
         Callback for when a message is received.
         """
+        metrics = self.metrics
         try:
-            raw = json.loads(body.decode("utf-8"))
-            greyhound_message = GreyhoundMessageRoot(**raw)
-        except (json.JSONDecodeError, ValidationError) as e:
+            if metrics is None:
+                greyhound_message = self.serializer.decode(body, headers_from_properties(properties))
+            else:
+                self._received_at[method.delivery_tag] = time.perf_counter()
+                greyhound_message = metrics.decode(self.serializer.decode, body, headers_from_properties(properties))
+        except DECODE_ERRORS as e:
             # Log or push to DLQ
-            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self._nack(ch, method.delivery_tag, requeue=False)
             return
-        
-        self.consumer.message_received(greyhound_message)
-        ch.basic_ack(delivery_tag=method.delivery_tag)
+
+        if self.dispatcher is not None:
+            self.dispatcher.submit(greyhound_message, partial(self._on_dispatched, ch, method.delivery_tag))
+            return
+
+        try:
+            result = self._handle(greyhound_message)
+        except MessageDecodeError as e:
+            # A lazily decoded payload turned out to be invalid.
+            logger.error(f"Error decoding message: {e}")
+            self._nack(ch, method.delivery_tag, requeue=False)
+            return
+        if isinstance(result, Future):
+            # Retries of a failed message hold on to its delivery until they are over.
+            result.add_done_callback(partial(self._on_dispatched, ch, method.delivery_tag))
+        else:
+            self._ack(ch, method.delivery_tag)
+        if self.backpressure is not None:
+            self._apply_backpressure()
+
+    def _handle(self, greyhound_message: GreyhoundMessageRoot):
+        if self.metrics is None:
+            return self.consumer.message_received(greyhound_message)
+        return self.metrics.handle(self.consumer.message_received, greyhound_message)
+
+    def resubmit(self, greyhound_message: GreyhoundMessageRoot):
+        """
+        Handle a message again on its dispatcher lane, or on the connection thread; safe to call from any thread.
+
+        RetryingConsumer redelivers through here so a retried handler never
+        runs on its scheduler thread, next to the consume loop on a channel
+        that is not thread-safe.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.submit(greyhound_message)
+        else:
+            self.connection.add_callback_threadsafe(partial(self._handle, greyhound_message))
+
+    def _on_dispatched(self, ch, delivery_tag: int, future):
+        """
+        Called from a dispatcher worker; settles the delivery back on the connection thread.
+
+        A handler returning a Future, as RetryingConsumer does for a failed
+        message, settles the delivery once that future is done.
+        """
+        if future.exception() is None and isinstance(future.result(), Future):
+            future.result().add_done_callback(partial(self._on_dispatched, ch, delivery_tag))
+            return
+        self.connection.add_callback_threadsafe(partial(self._settle_dispatched, ch, delivery_tag, future))
+
+    def _settle_dispatched(self, ch, delivery_tag: int, future):
+        error = future.exception()
+        if error is not None:
+            # Requeueing a message that cannot be decoded would only fail again.
+            self._nack(ch, delivery_tag, requeue=not isinstance(error, MessageDecodeError))
+        else:
+            self._ack(ch, delivery_tag)
+        if self.backpressure is not None:
+            self._apply_backpressure()
+
+    def _apply_backpressure(self):
+        """
+        Shrink or restore the prefetch window when the downstream producer crosses its budget.
+        """
+        paused = self.backpressure.update()
+        if paused is True:
+            self._held_acks = []
+            self.channel.basic_qos(prefetch_count=self.backpressure.paused_prefetch)
+            if not self._backpressure_timer:
+                self._backpressure_timer = True
+                self.connection.call_later(self.backpressure.check_interval, self._on_backpressure_timer)
+        elif paused is False:
+            held, self._held_acks = self._held_acks, None
+            self.channel.basic_qos(prefetch_count=self.prefetch_count or 0)
+            for delivery_tag in held or ():
+                self._ack(self.channel, delivery_tag)
+
+    def _on_backpressure_timer(self):
+        # Deliveries stop while paused, so the backlog is also checked on a timer.
+        if self._held_acks is not None and self.channel.is_open:
+            self._apply_backpressure()
+        if self._held_acks is not None and self.channel.is_open:
+            self.connection.call_later(self.backpressure.check_interval, self._on_backpressure_timer)
+        else:
+            self._backpressure_timer = False
+
+    def _nack(self, ch, delivery_tag: int, requeue: bool):
+        ch.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+        if self.metrics is not None:
+            self._received_at.pop(delivery_tag, None)
+            self.metrics.nacked.inc()
+        if self.batches_acks:
+            self._settle(delivery_tag, acked=False)
+
+    def _settle(self, delivery_tag: int, acked: bool):
+        """
+        Record a settled delivery and advance past every contiguously settled tag.
+        """
+        self._settled[delivery_tag] = acked
+        while self._settled_floor + 1 in self._settled:
+            self._settled_floor += 1
+            if self._settled.pop(self._settled_floor):
+                self._ack_target = self._settled_floor
+
+    def _ack(self, ch, delivery_tag: int):
+        """
+        Acknowledge a processed delivery, either immediately or as part of a batch.
+        """
+        if self._held_acks is not None:
+            self._held_acks.append(delivery_tag)
+            return
+        if not self.batches_acks:
+            ch.basic_ack(delivery_tag=delivery_tag)
+            if self.metrics is not None:
+                self.metrics.observe_ack(self._received_at.pop(delivery_tag, None))
+            return
+
+        self._settle(delivery_tag, acked=True)
+        self._pending_acks += 1
+        elapsed_ms = (time.monotonic() - self._last_ack) * 1000
+        if self._pending_acks >= self._ack_flush_size or (
+                self.ack_batch_interval_ms is not None and elapsed_ms >= self.ack_batch_interval_ms):
+            self.flush_acks(ch)
+
+    def flush_acks(self, ch=None):
+        """
+        Acknowledge every processed delivery up to the highest contiguously settled delivery tag.
+        """
+        if self._ack_target > self._acked_upto:
+            (ch or self.channel).basic_ack(delivery_tag=self._ack_target, multiple=True)
+            if self.metrics is not None:
+                self._observe_acks(self._ack_target)
+            self._acked_upto = self._ack_target
+            self._pending_acks = 0
+        self._last_ack = time.monotonic()
+
+    def _observe_acks(self, upto: int):
+        """
+        Record the ack latency of every delivery covered by a multiple ack up to ``upto``.
+        """
+        received_at = self._received_at
+        while received_at:
+            delivery_tag = next(iter(received_at))
+            if delivery_tag > upto:
+                break
+            self.metrics.observe_ack(received_at.pop(delivery_tag))
+
+    def _on_ack_timer(self):
+        self.flush_acks()
+        if self.channel.is_open:
+            self.connection.call_later(self.ack_batch_interval_ms / 1000, self._on_ack_timer)
+
+    def stop(self):
+        """
+        Ask the consume loop to return; safe to call from any thread.
+        """
+        self.connection.add_callback_threadsafe(self.channel.stop_consuming)
+
+    def close(self):
+        """
+        Wait for in-flight handlers, acknowledge outstanding deliveries and close the connection.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        # Abandoned retries settle their deliveries through connection callbacks.
+        self.consumer.close()
+        if self.connection.is_open:
+            self.connection.process_data_events(time_limit=0)
+        if self.channel.is_open:
+            held, self._held_acks = self._held_acks, None
+            for delivery_tag in held or ():
+                self._ack(self.channel, delivery_tag)
+            self.flush_acks()
+            self.channel.stop_consuming()
+        if self.pool is not None:
+            if self.channel.is_open:
+                self.channel.close()
+            self.pool.release(self.connection)
+        elif self.connection.is_open:
+            self.connection.close()
+
+
+class PublishNackedError(Exception):
+    """
+    Raised by a confirming producer when the broker rejected messages more often than allowed.
+
+    :ivar bodies: The bodies of the rejected messages.
+    """
+
+    def __init__(self, bodies: list):
+        super().__init__(f"{len(bodies)} message(s) were nacked by the broker")
+        self.bodies = bodies
 
 
 class RabbitMQBlockingProducerAdapter(ProducerMessageAdapter):
     """
     RabbitMQ implementation of the ProducerMessageAdapter.
+
+    With ``confirm_delivery`` enabled, publishes are pipelined: up to
+    ``confirm_window`` messages may await a broker confirmation at once, and
+    acks and nacks are matched to publishes by delivery tag as they arrive.
+    Nacked messages are republished up to ``confirm_retries`` times. ``flush``
+    blocks until every outstanding publish has been confirmed.
     """
 
     def __init__(
             self, 
             queue_name: str,
             connection_params: pika.ConnectionParameters,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            confirm_delivery: bool = False,
+            confirm_window: int = 1000,
+            confirm_retries: int = 3,
+            pool: RabbitMQConnectionPool | None = None,
+            max_priority: int | None = None
             ):
         """
         Initialize the RabbitMQ producer adapter with connection parameters.
         
         :param connection_params: Parameters for connecting to RabbitMQ.
+        :param serializer: Encodes outgoing messages, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param confirm_delivery: Have the broker confirm every publish.
+        :param confirm_window: Maximum number of publishes awaiting confirmation before produce blocks.
+        :param confirm_retries: Times a nacked message is republished before it is reported as failed.
+        :param pool: Shares the connection, and the channel unless confirms are enabled, with other adapters on this thread.
+        :param max_priority: Declare the queue as a priority queue and publish every message with its ``metadata.priority``.
         """
-        self.connection = pika.BlockingConnection(connection_params)
-        self.channel = self.connection.channel()
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.pool = pool
+        if pool is None:
+            self.connection = pika.BlockingConnection(connection_params)
+            self.channel = self.connection.channel()
+        else:
+            self.connection = pool.acquire(connection_params)
+            # Publisher confirms number deliveries per channel, so a confirming producer needs its own.
+            self.channel = self.connection.channel() if confirm_delivery else pool.channel(self.connection)
         self.queue_name = queue_name
-        self.channel.queue_declare(queue_name)
+        self.max_priority = max_priority
+        self.channel.queue_declare(queue_name, arguments=queue_arguments(max_priority))
+        self.confirm_delivery = confirm_delivery
+        self.confirm_window = max(1, confirm_window)
+        self.confirm_retries = confirm_retries
+        # Publishes awaiting confirmation, by delivery tag: (body, properties, attempts, published_at).
+        self._outstanding = {}
+        self._outstanding_bytes = 0
+        self._delivery_tag = 0
+        self._to_retry = []
+        self._failed = []
+        if confirm_delivery:
+            self._select_confirms()
+            if metrics is not None:
+                metrics.track_buffer(lambda: len(self._outstanding))
 
     @classmethod
     def from_config(cls, config: dict):
@@ -105,21 +495,373 @@ class RabbitMQBlockingProducerAdapter(ProducerMessageAdapter):
         :param config: Configuration dictionary containing connection parameters and queue name.
         :return: An instance of RabbitMQBlockingProducerAdapter.
         """
-        connection_params = pika.ConnectionParameters(
-            host = config.get("host", "localhost"),
-            port = config.get("port", 5672),
-            virtual_host = config.get("virtual_host", "/"),
-            credentials = pika.PlainCredentials(
-                username = config.get("credentials", {}).get("username", "guest"),
-                password = config.get("credentials", {}).get("password", "guest")
-            )
+        connection_params = connection_params_from_config(config)
+        return cls(
+            queue_name=config.get("queue"),
+            connection_params=connection_params,
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("RABBITMQ", "producer", config),
+            confirm_delivery=config.get("confirm_delivery", False),
+            confirm_window=config.get("confirm_window", 1000),
+            confirm_retries=config.get("confirm_retries", 3),
+            pool=rabbitmq_pool if config.get("share_connection", False) else None,
+            max_priority=config.get("max_priority")
         )
-        return cls(queue_name=config.get("queue"), connection_params=connection_params)
+
+    def _select_confirms(self):
+        """
+        Put the channel into confirm mode without making publishes wait for their confirmation.
+
+        BlockingChannel.confirm_delivery turns every basic_publish into a
+        synchronous round-trip, so confirm mode is selected on the underlying
+        channel and confirmations are collected by ``_on_confirm`` whenever
+        the connection processes I/O.
+        """
+        selected = []
+        self.channel._impl.confirm_delivery(ack_nack_callback=self._on_confirm, callback=selected.append)
+        while not selected:
+            self.connection.process_data_events(time_limit=1)
+
+    @property
+    def outstanding(self) -> int:
+        """
+        Number of publishes still awaiting confirmation.
+        """
+        return len(self._outstanding)
+
+    @property
+    def backlog(self) -> tuple[int, int]:
+        """
+        Publishes still awaiting confirmation and their bytes; always empty without publisher confirms.
+        """
+        return len(self._outstanding), self._outstanding_bytes
 
     def produce(self, message: GreyhoundMessageRoot):
         """
         Produce a message to RabbitMQ.
         """
+        started = time.perf_counter() if self.metrics is not None else 0
+        body, headers = self.serializer.encode(message)
+        properties = properties_from_headers(headers, message_priority(message, self.max_priority))
+        if self.confirm_delivery:
+            self._wait_for_window(self.confirm_window - 1)
+            self._publish(body, properties, attempts=0)
+        else:
+            self.channel.basic_publish(exchange='',
+                                       routing_key=self.queue_name,
+                                       body=body,
+                                       properties=properties)
+        if self.metrics is not None:
+            self.metrics.observe_produce(started)
+
+    def _basic_publish(self, body: bytes, properties: pika.BasicProperties):
         self.channel.basic_publish(exchange='',
                                    routing_key=self.queue_name,
-                                   body=message.model_dump_json())
+                                   body=body,
+                                   properties=properties)
+
+    def _publish(self, body: bytes, properties: pika.BasicProperties, attempts: int):
+        self._basic_publish(body, properties)
+        self._delivery_tag += 1
+        published_at = time.perf_counter() if self.metrics is not None else None
+        self._outstanding[self._delivery_tag] = (body, properties, attempts, published_at)
+        self._outstanding_bytes += len(body)
+
+    def _on_confirm(self, frame):
+        """
+        Settle every outstanding publish covered by a Basic.Ack or Basic.Nack.
+        """
+        method = frame.method
+        acked = isinstance(method, pika.spec.Basic.Ack)
+        if method.multiple:
+            tags = []
+            for delivery_tag in self._outstanding:
+                if delivery_tag > method.delivery_tag:
+                    break
+                tags.append(delivery_tag)
+        else:
+            tags = [method.delivery_tag]
+
+        for delivery_tag in tags:
+            publish = self._outstanding.pop(delivery_tag, None)
+            if publish is None:
+                continue
+            body, properties, attempts, published_at = publish
+            self._outstanding_bytes -= len(body)
+            if acked:
+                if self.metrics is not None:
+                    self.metrics.observe_ack(published_at)
+            else:
+                if self.metrics is not None:
+                    self.metrics.nacked.inc()
+                if attempts < self.confirm_retries:
+                    self._to_retry.append((body, properties, attempts + 1))
+                else:
+                    logger.error("Message nacked by the broker after %s attempts", attempts + 1)
+                    self._failed.append(body)
+
+    def _wait_for_window(self, limit: int):
+        """
+        Process confirmations, republishing nacked messages, until at most ``limit`` publishes are outstanding.
+        """
+        self.connection.process_data_events(time_limit=0)
+        while True:
+            while self._to_retry:
+                self._publish(*self._to_retry.pop(0))
+            if len(self._outstanding) <= limit:
+                return
+            self.connection.process_data_events(time_limit=1)
+
+    def flush(self):
+        """
+        Block until every outstanding publish has been confirmed.
+
+        :raises PublishNackedError: If messages were still nacked after ``confirm_retries`` retries.
+        """
+        if not self.confirm_delivery:
+            return
+        self._wait_for_window(0)
+        if self._failed:
+            failed, self._failed = self._failed, []
+            raise PublishNackedError(failed)
+
+    def flush_all(self):
+        self.flush()
+
+    def close(self):
+        """
+        Wait for outstanding confirmations and close the connection.
+        """
+        try:
+            if self.connection.is_open:
+                self.flush()
+        finally:
+            if self.pool is not None:
+                self.pool.release(self.connection)
+            elif self.connection.is_open:
+                self.connection.close()
+
+
+class RabbitMQBufferedProducerAdapter(RabbitMQBlockingProducerAdapter, BufferedProducerMessageAdapter):
+    """
+    RabbitMQ implementation of the BufferedProducerMessageAdapter.
+
+    ``produce`` encodes the message and adds it to a buffer. A background
+    flusher publishes the buffer once it holds ``batch_size`` messages or
+    ``batch_bytes`` bytes, or ``linger_ms`` after its first message arrived.
+    A batch is written to the channel as one run of frames followed by a
+    single socket flush, instead of one round of I/O per message.
+
+    Only the flusher thread touches the connection once the adapter has been
+    created, so ``produce`` may be called from any thread. A batch that fails
+    on the flusher thread is logged there and its error is raised by the next
+    ``produce`` or ``flush``.
+    """
+
+    def __init__(
+            self,
+            queue_name: str,
+            connection_params: pika.ConnectionParameters,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            confirm_delivery: bool = False,
+            confirm_window: int = 1000,
+            confirm_retries: int = 3,
+            batch_size: int = 500,
+            batch_bytes: int = 1024 * 1024,
+            linger_ms: float = 5,
+            max_buffered: int = 10000,
+            max_priority: int | None = None
+            ):
+        """
+        Initialize the buffered RabbitMQ producer adapter and start its flusher.
+
+        :param batch_size: Publish once this many messages are buffered.
+        :param batch_bytes: Publish once the buffered bodies add up to this many bytes.
+        :param linger_ms: Publish at most this long after the first message of a batch was buffered.
+        :param max_buffered: Block ``produce`` while this many messages are waiting to be published.
+        """
+        super().__init__(
+            queue_name,
+            connection_params,
+            serializer=serializer,
+            metrics=metrics,
+            confirm_delivery=confirm_delivery,
+            confirm_window=confirm_window,
+            confirm_retries=confirm_retries,
+            max_priority=max_priority
+        )
+        self.batch_size = max(1, batch_size)
+        self.batch_bytes = batch_bytes
+        self.linger_ms = linger_ms
+        self.max_buffered = max(self.batch_size, max_buffered)
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._buffer_started = 0.0
+        self._condition = threading.Condition()
+        self._flush_requested = 0
+        self._flushed = 0
+        self._error = None
+        self._closed = False
+        if metrics is not None:
+            metrics.track_buffer(lambda: len(self._buffer) + len(self._outstanding))
+        self._flusher = threading.Thread(target=self._run, name="greyhound-rabbitmq-flusher", daemon=True)
+        self._flusher.start()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create an instance of RabbitMQBufferedProducerAdapter from configuration.
+
+        :param config: Configuration dictionary containing connection parameters and queue name.
+        :return: An instance of RabbitMQBufferedProducerAdapter.
+        """
+        return cls(
+            queue_name=config.get("queue"),
+            connection_params=connection_params_from_config(config),
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("RABBITMQ", "producer", config),
+            confirm_delivery=config.get("confirm_delivery", False),
+            confirm_window=config.get("confirm_window", 1000),
+            confirm_retries=config.get("confirm_retries", 3),
+            batch_size=config.get("batch_size", 500),
+            batch_bytes=config.get("batch_bytes", 1024 * 1024),
+            linger_ms=config.get("linger_ms", 5),
+            max_buffered=config.get("max_buffered", 10000),
+            max_priority=config.get("max_priority")
+        )
+
+    def produce(self, message: GreyhoundMessageRoot):
+        """
+        Buffer a message for publishing by the background flusher.
+
+        :raises Exception: The error of a batch that failed since the last ``produce`` or ``flush``; the message is not buffered.
+        """
+        started = time.perf_counter() if self.metrics is not None else 0
+        self.add_to_buffer(message)
+        if self.metrics is not None:
+            self.metrics.observe_produce(started)
+
+    def add_to_buffer(self, message: GreyhoundMessageRoot):
+        """
+        Encode a message and add it to the buffer, blocking while the buffer is full.
+        """
+        body, headers = self.serializer.encode(message)
+        properties = properties_from_headers(headers, message_priority(message, self.max_priority))
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot produce to a closed RabbitMQBufferedProducerAdapter")
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            self._condition.wait_for(lambda: len(self._buffer) < self.max_buffered)
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append((body, properties))
+            self._buffered_bytes += len(body)
+            if len(self._buffer) >= self.batch_size or self._buffered_bytes >= self.batch_bytes:
+                self._condition.notify_all()
+
+    @property
+    def backlog(self) -> tuple[int, int]:
+        """
+        Buffered messages plus publishes awaiting confirmation, and their bytes.
+        """
+        messages, nbytes = super().backlog
+        return messages + len(self._buffer), nbytes + self._buffered_bytes
+
+    def _batch_due(self) -> bool:
+        if self._closed or self._flush_requested > self._flushed:
+            return True
+        if not self._buffer:
+            return False
+        return (len(self._buffer) >= self.batch_size
+                or self._buffered_bytes >= self.batch_bytes
+                or (time.monotonic() - self._buffer_started) * 1000 >= self.linger_ms)
+
+    def _next_wakeup(self) -> float:
+        """
+        Seconds until the buffered batch has lingered long enough, or until the connection needs servicing.
+        """
+        if not self._buffer:
+            return 1.0
+        return max(0.0, self.linger_ms / 1000 - (time.monotonic() - self._buffer_started))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._batch_due, timeout=self._next_wakeup())
+                batch, self._buffer, self._buffered_bytes = self._buffer, [], 0
+                generation = self._flush_requested
+                closing = self._closed
+                self._condition.notify_all()
+
+            error = None
+            try:
+                if batch:
+                    self._publish_batch(batch)
+                else:
+                    # Keeps heartbeats and publisher confirms flowing while idle.
+                    self.connection.process_data_events(time_limit=0)
+                if generation > self._flushed:
+                    RabbitMQBlockingProducerAdapter.flush(self)
+            except Exception as e:
+                logger.exception("Failed to publish a batch of %s message(s)", len(batch))
+                error = e
+
+            with self._condition:
+                if error is not None:
+                    self._error = error
+                self._flushed = max(self._flushed, generation)
+                self._condition.notify_all()
+                if closing and not self._buffer:
+                    return
+
+    def _basic_publish(self, body: bytes, properties: pika.BasicProperties):
+        # Frames are queued on the underlying channel and written to the socket
+        # together when the batch is flushed, rather than once per message.
+        self.channel._impl.basic_publish(exchange='',
+                                         routing_key=self.queue_name,
+                                         body=body,
+                                         properties=properties)
+
+    def _publish_batch(self, batch: list):
+        for body, properties in batch:
+            if self.confirm_delivery:
+                if len(self._outstanding) >= self.confirm_window:
+                    self._wait_for_window(self.confirm_window - 1)
+                self._publish(body, properties, attempts=0)
+            else:
+                self._basic_publish(body, properties)
+        self.connection.process_data_events(time_limit=0)
+
+    def flush(self):
+        """
+        Block until every buffered message has been published, and confirmed when confirms are enabled.
+
+        :raises PublishNackedError: If messages were still nacked after ``confirm_retries`` retries.
+        """
+        with self._condition:
+            if not self._flusher.is_alive():
+                return
+            self._flush_requested += 1
+            generation = self._flush_requested
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._flushed >= generation or not self._flusher.is_alive())
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """
+        Publish every buffered message, stop the flusher and close the connection.
+        """
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._flusher.join()
+            if self.connection.is_open:
+                self.connection.close()
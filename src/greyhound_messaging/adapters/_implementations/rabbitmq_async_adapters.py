@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import time
+
+from greyhound_messaging.adapters._abstracts.core_messaging import AsyncConsumerMessageAdapter, AsyncProducerMessageAdapter
+from greyhound_messaging.adapters._implementations.rabbitmq_adapters import message_priority, queue_arguments
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer, dispatch_async
+from greyhound_messaging.metrics import AdapterMetrics
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import CONTENT_ENCODING_HEADER, CONTENT_TYPE_HEADER, DECODE_ERRORS, MessageDecodeError, MessageSerializer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import aio_pika
+except ImportError:  # pragma: no cover - optional dependency
+    aio_pika = None
+
+
+def _require_aio_pika():
+    if aio_pika is None:
+        raise ImportError("The asyncio RabbitMQ adapters require aio-pika: pip install greyhound-messaging[async]")
+
+
+def _connection_params_from_config(config: dict) -> dict:
+    """
+    Translate the shared RabbitMQ configuration keys into aio-pika connection arguments.
+    """
+    return {
+        "host": config.get("host", "localhost"),
+        "port": config.get("port", 5672),
+        "virtualhost": config.get("virtual_host", "/"),
+        "login": config.get("credentials", {}).get("username", "guest"),
+        "password": config.get("credentials", {}).get("password", "guest"),
+    }
+
+
+def _headers_from_message(message) -> dict:
+    headers = dict(message.headers or {})
+    if message.content_type is not None:
+        headers[CONTENT_TYPE_HEADER] = message.content_type
+    if message.content_encoding is not None:
+        headers[CONTENT_ENCODING_HEADER] = message.content_encoding
+    return headers
+
+
+class RabbitMQAsyncConsumerAdapter(AsyncConsumerMessageAdapter):
+    """
+    asyncio RabbitMQ implementation of the AsyncConsumerMessageAdapter.
+
+    Every delivery is handled in its own task, so up to ``prefetch_count``
+    messages can be in flight at once on a single connection. Each delivery
+    is acknowledged as soon as its handler completes.
+    """
+    def __init__(
+            self,
+            consumer: GreyhoundConsumer,
+            queue_name: str,
+            connection_params: dict,
+            prefetch_count: int = 100,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            max_priority: int | None = None
+            ):
+        """
+        Initialize the asyncio RabbitMQ consumer adapter with connection parameters.
+
+        :param connection_params: Keyword arguments for aio_pika.connect_robust.
+        :param prefetch_count: Maximum number of deliveries in flight at once.
+        :param serializer: Decodes message bodies, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param max_priority: Declare the queue as a priority queue with priorities ``0..max_priority``.
+        """
+        _require_aio_pika()
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.consumer = consumer
+        self.queue_name = queue_name
+        self.connection_params = connection_params
+        self.prefetch_count = prefetch_count
+        self.max_priority = max_priority
+        self.connection = None
+        self.channel = None
+        self._queue = None
+        self._consumer_tag = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._closed = asyncio.Event()
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict):
+        """
+        Create an instance of RabbitMQAsyncConsumerAdapter from configuration.
+
+        :param consumer: The GreyhoundConsumer instance to use.
+        :param config: Configuration dictionary containing connection parameters and queue name.
+        :return: An instance of RabbitMQAsyncConsumerAdapter.
+        """
+        return cls(
+            consumer,
+            config.get("queue"),
+            _connection_params_from_config(config),
+            prefetch_count=config.get("prefetch_count", 100),
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("RABBITMQ", "consumer", config),
+            max_priority=config.get("max_priority")
+        )
+
+    async def consume(self):
+        """
+        Consume messages from RabbitMQ until the adapter is closed.
+        """
+        self.connection = await aio_pika.connect_robust(**self.connection_params)
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
+        self._queue = await self.channel.declare_queue(self.queue_name, arguments=queue_arguments(self.max_priority))
+        self._consumer_tag = await self._queue.consume(self.message_received)
+        await self._closed.wait()
+
+    async def message_received(self, message):
+        """
+        Callback for when a message is received; hands the delivery to its own task.
+        """
+        task = asyncio.create_task(self._handle(message))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _handle(self, message):
+        metrics = self.metrics
+        received_at = time.perf_counter() if metrics is not None else 0
+        try:
+            if metrics is None:
+                greyhound_message = self.serializer.decode(message.body, _headers_from_message(message))
+            else:
+                greyhound_message = metrics.decode(self.serializer.decode, message.body, _headers_from_message(message))
+        except DECODE_ERRORS as e:
+            # Log or push to DLQ
+            await message.nack(requeue=False)
+            if metrics is not None:
+                metrics.nacked.inc()
+            return
+
+        try:
+            if metrics is None:
+                await dispatch_async(self.consumer, greyhound_message)
+            else:
+                await metrics.handle_async(self._dispatch, greyhound_message)
+        except Exception as e:
+            if isinstance(e, MessageDecodeError):
+                # A lazily decoded payload turned out to be invalid; requeueing it would only fail again.
+                logger.error(f"Error decoding message: {e}")
+            else:
+                logger.exception("Handler failed for message %s", greyhound_message.metadata.message_id)
+            await message.nack(requeue=not isinstance(e, MessageDecodeError))
+            if metrics is not None:
+                metrics.nacked.inc()
+            return
+        await message.ack()
+        if metrics is not None:
+            metrics.observe_ack(received_at)
+
+    async def _dispatch(self, greyhound_message: GreyhoundMessageRoot):
+        return await dispatch_async(self.consumer, greyhound_message)
+
+    async def close(self):
+        """
+        Stop consuming, wait for in-flight handlers, then close the consumer and the connection.
+        """
+        if self._consumer_tag is not None:
+            await self._queue.cancel(self._consumer_tag)
+            self._consumer_tag = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self.consumer.close()
+        if self.connection is not None:
+            await self.connection.close()
+        self._closed.set()
+
+
+class RabbitMQAsyncProducerAdapter(AsyncProducerMessageAdapter):
+    """
+    asyncio RabbitMQ implementation of the AsyncProducerMessageAdapter.
+    """
+
+    def __init__(
+            self,
+            queue_name: str,
+            connection_params: dict,
+            serializer: MessageSerializer | None = None,
+            metrics: AdapterMetrics | None = None,
+            max_priority: int | None = None
+            ):
+        """
+        Initialize the asyncio RabbitMQ producer adapter with connection parameters.
+
+        :param connection_params: Keyword arguments for aio_pika.connect_robust.
+        :param serializer: Encodes outgoing messages, JSON by default.
+        :param metrics: Metrics to record, or None when metrics are disabled.
+        :param max_priority: Declare the queue as a priority queue and publish every message with its ``metadata.priority``.
+        """
+        _require_aio_pika()
+        self.serializer = serializer or MessageSerializer()
+        self.metrics = metrics
+        self.queue_name = queue_name
+        self.connection_params = connection_params
+        self.max_priority = max_priority
+        self.connection = None
+        self.channel = None
+        self._connect_lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create an instance of RabbitMQAsyncProducerAdapter from configuration.
+
+        :param config: Configuration dictionary containing connection parameters and queue name.
+        :return: An instance of RabbitMQAsyncProducerAdapter.
+        """
+        return cls(
+            queue_name=config.get("queue"),
+            connection_params=_connection_params_from_config(config),
+            serializer=MessageSerializer.from_config(config),
+            metrics=AdapterMetrics.from_config("RABBITMQ", "producer", config),
+            max_priority=config.get("max_priority")
+        )
+
+    async def _ensure_channel(self):
+        async with self._connect_lock:
+            if self.channel is None:
+                self.connection = await aio_pika.connect_robust(**self.connection_params)
+                self.channel = await self.connection.channel()
+                await self.channel.declare_queue(self.queue_name, arguments=queue_arguments(self.max_priority))
+        return self.channel
+
+    async def produce(self, message: GreyhoundMessageRoot):
+        """
+        Produce a message to RabbitMQ.
+        """
+        channel = self.channel or await self._ensure_channel()
+        started = time.perf_counter() if self.metrics is not None else 0
+        body, headers = self.serializer.encode(message)
+        content_type = headers.pop(CONTENT_TYPE_HEADER, None)
+        content_encoding = headers.pop(CONTENT_ENCODING_HEADER, None)
+        await channel.default_exchange.publish(
+            aio_pika.Message(
+                body=body,
+                content_type=content_type,
+                content_encoding=content_encoding,
+                headers=headers or None,
+                priority=message_priority(message, self.max_priority)
+            ),
+            routing_key=self.queue_name
+        )
+        if self.metrics is not None:
+            self.metrics.observe_produce(started)
+
+    async def close(self):
+        """
+        Close the connection.
+        """
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+            self.channel = None
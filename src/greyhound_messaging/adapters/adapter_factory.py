@@ -1,34 +1,89 @@
-from greyhound_messaging.adapters._implementations.kafka_adapters import KafkaConsumerAdapter, KafkaProducerAdapter
+from greyhound_messaging.adapters.backend_registry import backend_registry
+from greyhound_messaging.backpressure import Backpressure
+from greyhound_messaging.claim_check import ClaimCheckReleasingConsumer
 from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
-from greyhound_messaging.adapters._implementations.rabbitmq_adapters import RabbitMQBlockingConsumerAdapter, RabbitMQBlockingProducerAdapter
 from greyhound_messaging.config import CONFIGURATION_PROPERTIES
+from greyhound_messaging.dedup import DeduplicatingConsumer
+from greyhound_messaging.metrics import configure_metrics
+from greyhound_messaging.retry import RetryingConsumer
 
-adapters = {
-    "RABBITMQ": {
-        "consumer": RabbitMQBlockingConsumerAdapter,
-        "producer": RabbitMQBlockingProducerAdapter
-    },
-    "KAFKA": {
-        "consumer": KafkaConsumerAdapter,
-        "producer": KafkaProducerAdapter
-    }
-}
-
-def adapter_factory_consumer(consumer: GreyhoundConsumer, configuration_properties = CONFIGURATION_PROPERTIES):
+def adapter_factory_consumer(consumer: GreyhoundConsumer, configuration_properties = CONFIGURATION_PROPERTIES, backpressure: Backpressure | None = None):
 
     type = configuration_properties.get("consumer").get("backend")
 
-    consumer_cls = adapters.get(type, {}).get("consumer")
+    consumer_cls = backend_registry.get(type, "consumer")
     if consumer_cls is None:
         raise ValueError(f"Unknown consumer adapter type: {type}")
 
-    return consumer_cls.from_config(consumer=consumer, config=configuration_properties["consumer"])
+    configure_metrics(configuration_properties.get("metrics"))
+
+    releasing_consumer = ClaimCheckReleasingConsumer.from_config(consumer, configuration_properties["consumer"].get("claim_check"))
+    if releasing_consumer is not None:
+        consumer = releasing_consumer
+
+    deduplicating_consumer = DeduplicatingConsumer.from_config(
+        consumer, configuration_properties["consumer"].get("dedup"), queue=configuration_properties["consumer"].get("queue")
+    )
+    if deduplicating_consumer is not None:
+        consumer = deduplicating_consumer
+
+    retrying_consumer = RetryingConsumer.from_config(consumer, configuration_properties["consumer"].get("retry"))
+    if retrying_consumer is not None:
+        consumer = retrying_consumer
+
+    if backpressure is not None:
+        adapter = consumer_cls.from_config(consumer=consumer, config=configuration_properties["consumer"], backpressure=backpressure)
+    else:
+        adapter = consumer_cls.from_config(consumer=consumer, config=configuration_properties["consumer"])
+    if retrying_consumer is not None:
+        # Retries are handled again on the adapter's own thread or dispatcher lane, not on the retry scheduler.
+        retrying_consumer.resubmit = getattr(adapter, "resubmit", None)
+    return adapter
 
 def adapter_factory_producer(configuration_properties = CONFIGURATION_PROPERTIES):
 
     type = configuration_properties.get("producer").get("backend")
 
-    producer_cls = adapters.get(type, {}).get("producer")
+    producer_cls = backend_registry.get(type, "producer")
     if producer_cls is None:
         raise ValueError(f"Unknown producer adapter type: {type}")
-    return producer_cls.from_config(config=configuration_properties["producer"])
\ No newline at end of file
+    if configuration_properties["producer"].get("buffered"):
+        producer_cls = backend_registry.get(type, "buffered_producer") or producer_cls
+    configure_metrics(configuration_properties.get("metrics"))
+    return producer_cls.from_config(config=configuration_properties["producer"])
+
+def adapter_factory_async_consumer(consumer: GreyhoundConsumer, configuration_properties = CONFIGURATION_PROPERTIES):
+
+    type = configuration_properties.get("consumer").get("backend")
+
+    consumer_cls = backend_registry.get(type, "async_consumer")
+    if consumer_cls is None:
+        raise ValueError(f"Unknown async consumer adapter type: {type}")
+
+    configure_metrics(configuration_properties.get("metrics"))
+
+    releasing_consumer = ClaimCheckReleasingConsumer.from_config(consumer, configuration_properties["consumer"].get("claim_check"))
+    if releasing_consumer is not None:
+        consumer = releasing_consumer
+
+    deduplicating_consumer = DeduplicatingConsumer.from_config(
+        consumer, configuration_properties["consumer"].get("dedup"), queue=configuration_properties["consumer"].get("queue")
+    )
+    if deduplicating_consumer is not None:
+        consumer = deduplicating_consumer
+
+    retrying_consumer = RetryingConsumer.from_config(consumer, configuration_properties["consumer"].get("retry"))
+    if retrying_consumer is not None:
+        consumer = retrying_consumer
+
+    return consumer_cls.from_config(consumer=consumer, config=configuration_properties["consumer"])
+
+def adapter_factory_async_producer(configuration_properties = CONFIGURATION_PROPERTIES):
+
+    type = configuration_properties.get("producer").get("backend")
+
+    producer_cls = backend_registry.get(type, "async_producer")
+    if producer_cls is None:
+        raise ValueError(f"Unknown async producer adapter type: {type}")
+    configure_metrics(configuration_properties.get("metrics"))
+    return producer_cls.from_config(config=configuration_properties["producer"])
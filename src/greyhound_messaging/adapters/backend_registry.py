@@ -0,0 +1,122 @@
+import importlib
+import logging
+import threading
+from importlib.metadata import entry_points
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "greyhound_messaging.backends"
+
+ROLES = ("consumer", "producer", "buffered_producer", "async_consumer", "async_producer")
+
+BUILTIN_BACKENDS = {
+    "RABBITMQ": {
+        "consumer": "greyhound_messaging.adapters._implementations.rabbitmq_adapters:RabbitMQBlockingConsumerAdapter",
+        "producer": "greyhound_messaging.adapters._implementations.rabbitmq_adapters:RabbitMQBlockingProducerAdapter",
+        "buffered_producer": "greyhound_messaging.adapters._implementations.rabbitmq_adapters:RabbitMQBufferedProducerAdapter",
+        "async_consumer": "greyhound_messaging.adapters._implementations.rabbitmq_async_adapters:RabbitMQAsyncConsumerAdapter",
+        "async_producer": "greyhound_messaging.adapters._implementations.rabbitmq_async_adapters:RabbitMQAsyncProducerAdapter"
+    },
+    "KAFKA": {
+        "consumer": "greyhound_messaging.adapters._implementations.kafka_adapters:KafkaConsumerAdapter",
+        "producer": "greyhound_messaging.adapters._implementations.kafka_adapters:KafkaProducerAdapter",
+        "async_consumer": "greyhound_messaging.adapters._implementations.kafka_async_adapters:KafkaAsyncConsumerAdapter",
+        "async_producer": "greyhound_messaging.adapters._implementations.kafka_async_adapters:KafkaAsyncProducerAdapter"
+    },
+    "MEMORY": {
+        "consumer": "greyhound_messaging.adapters._implementations.memory_adapters:MemoryConsumerAdapter",
+        "producer": "greyhound_messaging.adapters._implementations.memory_adapters:MemoryProducerAdapter"
+    }
+}
+
+
+def _import(path: str):
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class BackendRegistry:
+    """
+    Maps backend names and adapter roles to adapter classes, importing them on first use.
+
+    Backends are registered as ``package.module:Class`` paths, so a process
+    only imports the client library of the backends it actually creates
+    adapters for. Third-party backends are discovered through the
+    ``greyhound_messaging.backends`` entry point group: the entry point name
+    is the backend name, and it must load to a ``{role: class or path}``
+    mapping. Entry points are only scanned when a backend is not already
+    registered.
+    """
+
+    def __init__(self, backends: dict | None = None, group: str = ENTRY_POINT_GROUP):
+        """
+        :param backends: Initial ``{backend: {role: class or path}}`` registrations.
+        :param group: Entry point group third-party backends are discovered in.
+        """
+        self.group = group
+        self._backends = {name: dict(roles) for name, roles in (backends or {}).items()}
+        self._entry_points_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, backend: str, roles: dict):
+        """
+        Register, or extend, a backend.
+
+        :param backend: The backend name used in configuration, e.g. ``KAFKA``.
+        :param roles: Adapter classes, or ``package.module:Class`` paths, keyed by role.
+        """
+        unknown = set(roles) - set(ROLES)
+        if unknown:
+            raise ValueError(f"Unknown adapter roles for backend {backend}: {sorted(unknown)}")
+        with self._lock:
+            self._backends.setdefault(backend, {}).update(roles)
+
+    def _load_entry_points(self):
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+        for entry_point in entry_points(group=self.group):
+            try:
+                roles = entry_point.load()
+            except Exception:
+                logger.exception("Failed to load greyhound backend plugin %s", entry_point.name)
+                continue
+            self.register(entry_point.name, roles)
+
+    def get(self, backend: str, role: str):
+        """
+        The adapter class for a backend and role, or None when there is none.
+
+        The adapter's module is imported the first time it is requested.
+        """
+        roles = self._backends.get(backend)
+        if roles is None or role not in roles:
+            self._load_entry_points()
+            roles = self._backends.get(backend)
+            if roles is None:
+                return None
+        target = roles.get(role)
+        if isinstance(target, str):
+            target = _import(target)
+            with self._lock:
+                roles[role] = target
+        return target
+
+    @property
+    def backends(self) -> list[str]:
+        """
+        The names of every registered backend, including plugins.
+        """
+        self._load_entry_points()
+        return sorted(self._backends)
+
+
+backend_registry = BackendRegistry(BUILTIN_BACKENDS)
+
+
+def register_backend(backend: str, roles: dict):
+    """
+    Register a backend with the default registry so the adapter factories can create its adapters.
+    """
+    backend_registry.register(backend, roles)
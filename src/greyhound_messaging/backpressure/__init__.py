@@ -0,0 +1 @@
+from .backpressure import Backpressure
@@ -0,0 +1,99 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Backpressure:
+    """
+    In-flight and buffered-byte budgets for the messages a bridge has handed to its downstream producer.
+
+    The producer reports its ``backlog``: the messages, and their encoded
+    bytes, it has accepted but not yet delivered. Once either budget is used
+    up the consumer adapter is paused, pausing its Kafka partitions or
+    shrinking its RabbitMQ prefetch window to ``paused_prefetch`` while
+    holding back acknowledgements, and it is resumed once the backlog has
+    drained below ``resume_ratio`` of both budgets. The gap between the two
+    thresholds keeps a producer hovering around its limit from flapping the
+    consumer between states.
+
+    Consumer adapters call ``update`` after handling messages and every
+    ``check_interval`` seconds while paused.
+    """
+
+    def __init__(
+            self,
+            producer,
+            max_in_flight: int = 10000,
+            max_buffered_bytes: int = 64 * 1024 * 1024,
+            resume_ratio: float = 0.5,
+            paused_prefetch: int = 1,
+            check_interval: float = 0.1
+            ):
+        """
+        Initialize the budgets.
+
+        :param producer: The downstream producer, which must expose a ``backlog`` of ``(messages, bytes)``.
+        :param max_in_flight: Undelivered messages at which the consumer is paused.
+        :param max_buffered_bytes: Undelivered encoded bytes at which the consumer is paused.
+        :param resume_ratio: Fraction of both budgets the backlog must drain below before the consumer resumes.
+        :param paused_prefetch: RabbitMQ prefetch window while paused.
+        :param check_interval: Seconds between checks of the backlog while paused.
+        """
+        if not hasattr(producer, "backlog"):
+            raise ValueError(f"{type(producer).__name__} does not report its backlog and cannot apply backpressure")
+        self.producer = producer
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_buffered_bytes = max(1, max_buffered_bytes)
+        self.resume_ratio = min(max(resume_ratio, 0.0), 1.0)
+        self.paused_prefetch = max(1, paused_prefetch)
+        self.check_interval = check_interval
+        self.paused = False
+        self.pauses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, producer, config: dict | None):
+        """
+        Create a Backpressure from the top-level ``backpressure`` section of a bridge configuration.
+
+        :param producer: The producer the bridge forwards to.
+        :param config: Backpressure configuration, or None when backpressure is not configured.
+        :return: An instance of Backpressure, or None.
+        """
+        if not config:
+            return None
+
+        return cls(
+            producer,
+            max_in_flight=config.get("max_in_flight", 10000),
+            max_buffered_bytes=config.get("max_buffered_bytes", 64 * 1024 * 1024),
+            resume_ratio=config.get("resume_ratio", 0.5),
+            paused_prefetch=config.get("paused_prefetch", 1),
+            check_interval=config.get("check_interval", 0.1)
+        )
+
+    def saturated(self, messages: int, nbytes: int) -> bool:
+        return messages >= self.max_in_flight or nbytes >= self.max_buffered_bytes
+
+    def drained(self, messages: int, nbytes: int) -> bool:
+        return messages <= self.max_in_flight * self.resume_ratio and nbytes <= self.max_buffered_bytes * self.resume_ratio
+
+    def update(self) -> bool | None:
+        """
+        Check the producer's backlog against the budgets.
+
+        :return: True when the consumer must pause, False when it may resume, None when nothing changed.
+        """
+        messages, nbytes = self.producer.backlog
+        with self._lock:
+            if not self.paused and self.saturated(messages, nbytes):
+                self.paused = True
+                self.pauses += 1
+                logger.warning("Downstream producer is behind (%s messages, %s bytes undelivered), pausing the consumer", messages, nbytes)
+                return True
+            if self.paused and self.drained(messages, nbytes):
+                self.paused = False
+                logger.info("Downstream producer drained (%s messages, %s bytes undelivered), resuming the consumer", messages, nbytes)
+                return False
+        return None
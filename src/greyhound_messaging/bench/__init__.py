@@ -0,0 +1 @@
+from .runner import BenchmarkResult, make_message, run_case, run_suite, PAYLOAD_SIZES
@@ -0,0 +1,193 @@
+import copy
+import math
+import platform
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+
+from greyhound_messaging.adapters.adapter_factory import adapter_factory_consumer, adapter_factory_producer
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+SENT_AT_HEADER = "bench_sent_ns"
+
+PAYLOAD_SIZES = {"small": 256, "medium": 16 * 1024, "large": 256 * 1024}
+
+
+@dataclass
+class BenchmarkResult:
+    backend: str
+    codec: str
+    payload_size: str
+    payload_bytes: int
+    messages: int
+    received: int
+    target_rate: float
+    duration_s: float
+    throughput_msgs_per_s: float
+    produce_us_mean: float
+    latency_us: dict = field(default_factory=dict)
+
+
+def make_message(payload_bytes: int, sequence: int = 0) -> GreyhoundMessageRoot:
+    """
+    Build a message whose payload serializes to roughly ``payload_bytes`` bytes.
+    """
+    chunk = "x" * 64
+    return GreyhoundMessageRoot(
+        event_type="bench.event",
+        stages=[{"destination": "bench-service"}],
+        payload={f"field_{i}": chunk for i in range(max(1, payload_bytes // 76))},
+        metadata={"correlation_id": f"bench-{sequence % 64}", "message_id": f"msg-{sequence}", "priority": 0, "retry_count": 0}
+    )
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyRecordingConsumer(GreyhoundConsumer):
+    """
+    Records the end-to-end latency of every benchmark message it receives.
+    """
+
+    def __init__(self, expected: int):
+        super().__init__()
+        self.expected = expected
+        self.latencies_ns = []
+        self.last_received_ns = 0
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        now = time.perf_counter_ns()
+        sent = message.metadata.custom_headers.get(SENT_AT_HEADER)
+        with self._lock:
+            if sent is not None:
+                self.latencies_ns.append(now - sent)
+            self.last_received_ns = now
+            if len(self.latencies_ns) >= self.expected:
+                self.done.set()
+        return message
+
+
+def run_case(
+        base_config: dict,
+        backend: str,
+        codec: str,
+        payload_size: str,
+        messages: int,
+        rate: float = 0,
+        warmup: int = 0,
+        timeout: float = 60.0
+        ) -> BenchmarkResult:
+    """
+    Produce ``messages`` messages through one adapter pair and measure throughput and latency.
+
+    :param base_config: Configuration with ``producer`` and ``consumer`` sections for the backend.
+    :param rate: Target messages per second, 0 to produce as fast as possible.
+    :param warmup: Messages produced and discarded before measuring.
+    :param timeout: Seconds to wait for every message to arrive.
+    """
+    config = copy.deepcopy(base_config)
+    for section in ("producer", "consumer"):
+        config[section]["backend"] = backend
+        config[section]["codec"] = codec
+    if backend == "MEMORY":
+        queue_name = f"greyhound-bench-{uuid.uuid4().hex}"
+        config["producer"]["queue"] = config["consumer"]["queue"] = queue_name
+
+    payload_bytes = PAYLOAD_SIZES[payload_size]
+    template = make_message(payload_bytes)
+    consumer = LatencyRecordingConsumer(expected=messages + warmup)
+    producer_adapter = adapter_factory_producer(config)
+    consumer_adapter = adapter_factory_consumer(consumer, config)
+    consumer_thread = threading.Thread(target=consumer_adapter.consume, name="greyhound-bench-consumer", daemon=True)
+    consumer_thread.start()
+
+    for sequence in range(warmup):
+        _produce(producer_adapter, template, sequence)
+
+    interval_ns = int(1e9 / rate) if rate else 0
+    produce_ns = 0
+    started = time.perf_counter_ns()
+    for sequence in range(messages):
+        if interval_ns:
+            deadline = started + sequence * interval_ns
+            while (remaining := deadline - time.perf_counter_ns()) > 0:
+                time.sleep(remaining / 1e9 if remaining > 200_000 else 0)
+        produce_ns += _produce(producer_adapter, template, warmup + sequence)
+    if hasattr(producer_adapter, "flush_all"):
+        producer_adapter.flush_all()
+
+    consumer.done.wait(timeout=timeout)
+    consumer_adapter.stop()
+    consumer_thread.join(timeout=timeout)
+    consumer_adapter.close()
+
+    latencies = sorted(consumer.latencies_ns[warmup:])
+    duration_ns = max(1, (consumer.last_received_ns or time.perf_counter_ns()) - started)
+    return BenchmarkResult(
+        backend=backend,
+        codec=codec,
+        payload_size=payload_size,
+        payload_bytes=len(template.model_dump_json()),
+        messages=messages,
+        received=len(latencies),
+        target_rate=rate,
+        duration_s=duration_ns / 1e9,
+        throughput_msgs_per_s=len(latencies) / (duration_ns / 1e9),
+        produce_us_mean=produce_ns / max(1, messages) / 1e3,
+        latency_us={
+            "p50": percentile(latencies, 0.50) / 1e3,
+            "p99": percentile(latencies, 0.99) / 1e3,
+            "p999": percentile(latencies, 0.999) / 1e3,
+            "max": (latencies[-1] / 1e3) if latencies else 0.0,
+        },
+    )
+
+
+def _produce(producer_adapter, template: GreyhoundMessageRoot, sequence: int) -> int:
+    message = template.model_copy(update={
+        "metadata": template.metadata.model_copy(update={
+            "message_id": f"msg-{sequence}",
+            "custom_headers": {SENT_AT_HEADER: time.perf_counter_ns()},
+        })
+    })
+    started = time.perf_counter_ns()
+    producer_adapter.produce(message)
+    return time.perf_counter_ns() - started
+
+
+def run_suite(
+        base_config: dict,
+        backends: list[str],
+        codecs: list[str],
+        payload_sizes: list[str],
+        messages: int,
+        rate: float = 0,
+        warmup: int = 0
+        ) -> dict:
+    """
+    Run every combination of backend, codec and payload size and collect machine-readable results.
+    """
+    results = [
+        asdict(run_case(base_config, backend, codec, payload_size, messages, rate=rate, warmup=warmup))
+        for backend in backends
+        for codec in codecs
+        for payload_size in payload_sizes
+    ]
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "messages": messages,
+        "target_rate": rate,
+        "results": results,
+    }
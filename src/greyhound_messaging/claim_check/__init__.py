@@ -0,0 +1,2 @@
+from .blob_store import BlobStore, FilesystemBlobStore
+from .claim_check import CLAIM_CHECK_HEADER, ClaimCheck, ClaimCheckPayload, ClaimCheckReleasingConsumer
@@ -0,0 +1,195 @@
+import mmap
+import os
+import shutil
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class BlobStore(ABC):
+    """
+    Abstract base class for the stores claim-checked payloads are offloaded to.
+
+    A blob is written once by ``put`` and starts with one reference, held by
+    the message carrying its id. ``retain`` adds a reference for every further
+    message carrying the same id, and ``release`` drops one; the blob is
+    deleted when its last reference is released or, whatever its references,
+    once it is older than the store's TTL.
+    """
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """
+        Store ``data`` and return the id of the new blob.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def open(self, blob_id: str):
+        """
+        Context manager yielding the blob's content as a buffer, valid until the context exits.
+
+        :raises KeyError: When the blob does not exist, for example because it expired.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    def read(self, blob_id: str) -> bytes:
+        """
+        The blob's content as bytes, for readers that cannot parse a buffer in place.
+
+        :raises KeyError: When the blob does not exist, for example because it expired.
+        """
+        with self.open(blob_id) as view:
+            return bytes(view)
+
+    @abstractmethod
+    def retain(self, blob_id: str):
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def release(self, blob_id: str):
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class FilesystemBlobStore(BlobStore):
+    """
+    Stores blobs as files under ``path``, a directory every producer and consumer of a queue can reach.
+
+    Each blob is a directory holding a ``data`` file and one empty ``ref-*``
+    file per reference, so references are counted by the filesystem and work
+    across processes and hosts sharing the directory. Blobs are read through
+    ``mmap``, so a payload is paged in from the page cache as it is parsed
+    rather than copied into memory first. Blobs older than ``ttl`` seconds are
+    swept at most every ``sweep_interval`` seconds as new ones are written.
+    """
+
+    def __init__(self, path: str, ttl: float | None = 86400.0, sweep_interval: float = 60.0):
+        """
+        Initialize the store, creating ``path`` if needed.
+
+        :param path: Directory the blobs are written to.
+        :param ttl: Seconds after which a blob is deleted even if it is still referenced, None to keep it until released.
+        :param sweep_interval: Minimum seconds between two sweeps for expired blobs.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        os.makedirs(path, exist_ok=True)
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def _blob_path(self, blob_id: str) -> str:
+        if not blob_id or os.sep in blob_id or blob_id.startswith("."):
+            raise KeyError(blob_id)
+        return os.path.join(self.path, blob_id)
+
+    def put(self, data: bytes) -> str:
+        self._maybe_sweep()
+        blob_id = uuid.uuid4().hex
+        staging = os.path.join(self.path, f".{blob_id}")
+        os.mkdir(staging)
+        with open(os.path.join(staging, "data"), "wb") as f:
+            f.write(data)
+        open(os.path.join(staging, f"ref-{uuid.uuid4().hex}"), "wb").close()
+        # Readers only ever see complete blobs.
+        os.rename(staging, self._blob_path(blob_id))
+        return blob_id
+
+    @contextmanager
+    def open(self, blob_id: str) -> Iterator[memoryview]:
+        try:
+            f = open(os.path.join(self._blob_path(blob_id), "data"), "rb")
+        except FileNotFoundError:
+            raise KeyError(blob_id) from None
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+                mapped.close()
+
+    def read(self, blob_id: str) -> bytes:
+        # One read into bytes, rather than mapping the file only to copy it.
+        try:
+            with open(os.path.join(self._blob_path(blob_id), "data"), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise KeyError(blob_id) from None
+
+    def retain(self, blob_id: str):
+        """
+        Add a reference to the blob.
+
+        :raises KeyError: When the blob no longer exists.
+        """
+        try:
+            open(os.path.join(self._blob_path(blob_id), f"ref-{uuid.uuid4().hex}"), "xb").close()
+        except FileNotFoundError:
+            raise KeyError(blob_id) from None
+
+    def release(self, blob_id: str):
+        """
+        Drop a reference to the blob, deleting it with its last reference. Releasing a deleted blob does nothing.
+        """
+        blob_path = self._blob_path(blob_id)
+        try:
+            refs = [name for name in os.listdir(blob_path) if name.startswith("ref-")]
+        except FileNotFoundError:
+            return
+        for name in refs:
+            try:
+                os.unlink(os.path.join(blob_path, name))
+                break
+            except FileNotFoundError:
+                # Another consumer released this reference first.
+                continue
+        try:
+            remaining = any(name.startswith("ref-") for name in os.listdir(blob_path))
+        except FileNotFoundError:
+            return
+        if not remaining:
+            shutil.rmtree(blob_path, ignore_errors=True)
+
+    def __contains__(self, blob_id: str) -> bool:
+        return os.path.isdir(self._blob_path(blob_id))
+
+    def sweep(self, now: float | None = None) -> int:
+        """
+        Delete every blob older than the TTL, and staging directories left by crashed writers.
+
+        :return: The number of blobs deleted.
+        """
+        if self.ttl is None:
+            return 0
+        deadline = (time.time() if now is None else now) - self.ttl
+        deleted = 0
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                try:
+                    # Adding and dropping references touches the directory, but never the data file.
+                    written_at = os.stat(os.path.join(entry.path, "data")).st_mtime
+                except FileNotFoundError:
+                    try:
+                        written_at = entry.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+                if written_at <= deadline:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    deleted += 1
+        return deleted
+
+    def _maybe_sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + self.sweep_interval
+        self.sweep()
@@ -0,0 +1,189 @@
+import inspect
+import logging
+
+from pydantic import BaseModel
+from greyhound_messaging.claim_check.blob_store import BlobStore, FilesystemBlobStore
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageMetadata, GreyhoundMessageRoot
+from greyhound_messaging.serialization.message_codecs import MessageCodec, MessageDecodeError, codec_for_content_type
+
+logger = logging.getLogger(__name__)
+
+CLAIM_CHECK_HEADER = "greyhound-claim-check"
+
+DEFAULT_CLAIM_CHECK_THRESHOLD = 256 * 1024
+
+CLEANUP_MODES = ("ttl", "refcount")
+
+
+class ClaimCheckPayload(BaseModel):
+    """
+    The content of a claim-checked blob.
+    """
+
+    payload: dict
+
+
+def claim_check_reference(metadata: GreyhoundMessageMetadata) -> dict | None:
+    """
+    The claim-check reference a message's metadata carries, or None.
+    """
+    return metadata.get_header(CLAIM_CHECK_HEADER)
+
+
+class ClaimCheck:
+    """
+    Offloads payloads of oversized messages to a BlobStore so only a reference travels through the broker.
+
+    A message whose encoded body reaches ``threshold`` bytes is sent with an
+    empty ``payload`` and a ``{"blob": id, "content-type": ...}`` reference
+    in ``metadata.custom_headers["greyhound-claim-check"]``; the encoded
+    body itself is written to the store, so the payload is never encoded
+    twice. On decode the payload is read back from the store, and the rest of
+    the stored body is ignored, so with ``lazy: true`` the blob is only
+    opened once ``payload`` (or ``stages``) is accessed. A reference next to a
+    non-empty payload is stale and ignored.
+
+    With ``cleanup: refcount`` every encode that forwards an existing
+    reference retains the blob and ClaimCheckReleasingConsumer releases it
+    once the handler has succeeded, so a blob is deleted as soon as the last
+    message referring to it is handled. In both modes blobs are deleted after
+    the store's TTL.
+    """
+
+    def __init__(self, store: BlobStore, threshold: int = DEFAULT_CLAIM_CHECK_THRESHOLD, cleanup: str = "ttl"):
+        """
+        Initialize the claim check.
+
+        :param store: The store payloads are offloaded to.
+        :param threshold: Smallest encoded body size in bytes whose payload is offloaded.
+        :param cleanup: ``ttl`` to only expire blobs, or ``refcount`` to also delete them once every reference was handled.
+        """
+        if cleanup not in CLEANUP_MODES:
+            raise ValueError(f"Unknown claim check cleanup mode: {cleanup}")
+        self.store = store
+        self.threshold = threshold
+        self.refcount = cleanup == "refcount"
+
+    @classmethod
+    def from_config(cls, config: dict | None):
+        """
+        Create a ClaimCheck backed by a FilesystemBlobStore from the ``claim_check`` section of an adapter configuration.
+
+        :param config: Claim check configuration naming the blob directory ``path``, or None when claim checks are not configured.
+        :return: An instance of ClaimCheck, or None.
+        """
+        if not config:
+            return None
+        store = FilesystemBlobStore(
+            config["path"],
+            ttl=config.get("ttl", 86400.0),
+            sweep_interval=config.get("sweep_interval", 60.0)
+        )
+        return cls(store, threshold=config.get("threshold", DEFAULT_CLAIM_CHECK_THRESHOLD), cleanup=config.get("cleanup", "ttl"))
+
+    def check_in(self, message: GreyhoundMessageRoot, codec: MessageCodec, body: bytes) -> bytes:
+        """
+        Offload the payload of a message encoded as ``body`` if the body is too large.
+
+        The message itself is left untouched.
+
+        :return: The body to send, either ``body`` or the encoded reference message.
+        """
+        if len(body) < self.threshold or not message.payload:
+            return body
+        # The body decodes as a ClaimCheckPayload, whose model ignores every field but ``payload``.
+        blob_id = self.store.put(body)
+        metadata = message.metadata
+        custom_headers = dict(metadata.custom_headers)
+        custom_headers[CLAIM_CHECK_HEADER] = {"blob": blob_id, "content-type": codec.content_type}
+        reference = message.model_copy(update={"payload": {}, "metadata": metadata.model_copy(update={"custom_headers": custom_headers})})
+        return codec.encode(reference)
+
+    def check_out(self, message: GreyhoundMessageRoot):
+        """
+        Replace the empty payload of a claim-checked message with the payload read from the store.
+
+        :raises MessageDecodeError: When the blob is missing or cannot be decoded.
+        """
+        reference = claim_check_reference(message.metadata)
+        if reference is None or message.payload:
+            return
+        try:
+            blob_id = reference["blob"]
+            codec = codec_for_content_type(reference.get("content-type"))
+            if codec.buffer_decode:
+                with self.store.open(blob_id) as view:
+                    content = codec.decode(view, ClaimCheckPayload)
+            else:
+                # pydantic only validates JSON from str, bytes or bytearray, not a memoryview.
+                content = codec.decode(self.store.read(blob_id), ClaimCheckPayload)
+        except (KeyError, TypeError) as e:
+            raise MessageDecodeError(f"Claim-checked payload is not available: {reference!r}") from e
+        message.payload = content.payload
+
+    def retain(self, metadata: GreyhoundMessageMetadata):
+        """
+        Count one more reference to the blob ``metadata`` refers to, when reference counting.
+        """
+        reference = claim_check_reference(metadata) if self.refcount else None
+        if reference is not None:
+            try:
+                self.store.retain(reference["blob"])
+            except KeyError:
+                logger.warning("Forwarding a reference to missing claim-checked blob %s", reference.get("blob"))
+
+    def release(self, metadata: GreyhoundMessageMetadata):
+        """
+        Drop one reference to the blob ``metadata`` refers to, when reference counting.
+        """
+        reference = claim_check_reference(metadata) if self.refcount else None
+        if reference is not None:
+            self.store.release(reference["blob"])
+
+
+class ClaimCheckReleasingConsumer(GreyhoundConsumer):
+    """
+    Consumer wrapper releasing a message's claim-checked blob once the wrapped consumer has handled it.
+
+    A handler that raises keeps its reference, so a redelivered message can
+    still read its payload; the blob is then left to the store's TTL.
+    """
+
+    def __init__(self, consumer: GreyhoundConsumer, claim_check: ClaimCheck):
+        """
+        Initialize the wrapper.
+
+        :param consumer: The GreyhoundConsumer handling the messages.
+        :param claim_check: The claim check whose blobs are released.
+        """
+        super().__init__()
+        self.consumer = consumer
+        self.claim_check = claim_check
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict | None):
+        """
+        Create a ClaimCheckReleasingConsumer from the ``claim_check`` section of a consumer configuration.
+
+        :return: An instance of ClaimCheckReleasingConsumer, or None unless ``cleanup`` is ``refcount``.
+        """
+        claim_check = ClaimCheck.from_config(config)
+        if claim_check is None or not claim_check.refcount:
+            return None
+        return cls(consumer, claim_check)
+
+    def message_received(self, message: GreyhoundMessageRoot):
+        result = self.consumer.message_received(message)
+        if inspect.isawaitable(result):
+            return self._release_after(result, message)
+        self.claim_check.release(message.metadata)
+        return result
+
+    async def _release_after(self, result, message: GreyhoundMessageRoot):
+        result = await result
+        self.claim_check.release(message.metadata)
+        return result
+
+    def close(self):
+        self.consumer.close()
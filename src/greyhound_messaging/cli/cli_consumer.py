@@ -1,15 +1,25 @@
+import logging
+import threading
+
 from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
 from greyhound_messaging.model import GreyhoundMessageRoot
 
+logger = logging.getLogger(__name__)
+
 
 class CliConsumer(GreyhoundConsumer):
     
     def __init__(self, producer=None):
         self.producer = producer
+        self.forwarded = 0
+        # Dispatcher lanes forward concurrently, and blocking producers are not thread-safe.
+        self._lock = threading.Lock()
         super().__init__()
     
     def message_received(self, message: GreyhoundMessageRoot):
         # Implement your message processing logic here
-        print(f"Processing message: {message.event_type}")
-        self.producer.produce(message)
-        print(f"Message produced: {message.event_type}")
\ No newline at end of file
+        logger.debug("Processing message: %s", message.event_type)
+        with self._lock:
+            self.producer.produce(message)
+            self.forwarded += 1
+        logger.debug("Message produced: %s", message.event_type)
\ No newline at end of file
@@ -1,33 +1,152 @@
+import json
+import logging
+import signal
+import threading
+from functools import partial
+
 import click
 import yaml
 from greyhound_messaging.adapters import adapter_factory_consumer, adapter_factory_producer
+from greyhound_messaging.backpressure import Backpressure
 from greyhound_messaging.cli.cli_consumer import CliConsumer  # you wire this
+from greyhound_messaging.cli.supervisor import Supervisor
 
-@click.command()
-@click.option('--config', type=click.Path(exists=True), required=True, help='Path to config YAML.')
-def consume(config):
+def load_config(config):
+    with open(config, 'r') as f:
+        return yaml.safe_load(f)
+
+@click.group(invoke_without_command=True)
+@click.option('--config', type=click.Path(exists=True), help='Path to config YAML; starts a consumer as with `greyhound consume`.')
+@click.pass_context
+def cli(ctx, config):
     """
-    Start a greyhound consumer using the specified config.
+    Greyhound messaging command line.
     """
-    with open(config, 'r') as f:
-        config_data = yaml.safe_load(f)
+    logging.basicConfig(level=logging.INFO)
+    if ctx.invoked_subcommand is not None:
+        return
+    if config is None:
+        click.echo(ctx.get_help())
+        ctx.exit(2)
+    ctx.invoke(consume, config=config)
 
-    print(f"Config loaded successfully")
-    print(f"Consumer backend: {config_data['consumer']['backend']}")
-    print(f"Producer backend: {config_data['producer']['backend']}")
+def run_consumer(config_data: dict, on_started=None):
+    """
+    Bridge the configured consumer to the configured producer until interrupted, then drain.
 
+    :param config_data: The loaded configuration.
+    :param on_started: Called with the CliConsumer once the adapters are connected.
+    """
     producer = adapter_factory_producer(config_data)
     consumer = CliConsumer(producer=producer)
-    adapter = adapter_factory_consumer(consumer, config_data)
+    backpressure = Backpressure.from_config(producer, config_data.get("backpressure"))
+    adapter = adapter_factory_consumer(consumer, config_data, backpressure=backpressure)
+    if on_started is not None:
+        on_started(consumer)
 
-    click.echo("Starting consumer loop. Press Ctrl+C to exit.")
     try:
         adapter.consume()
     except KeyboardInterrupt:
         click.echo("Shutdown requested. Cleaning up...")
+    finally:
+        # Closing the adapter closes its consumer wrappers, which flush their own producers.
         adapter.close()
         if hasattr(producer, "flush_all"):
             producer.flush_all()
+    return consumer
+
+def run_worker(config_data: dict, stats_interval: float, index: int, stats_queue):
+    """
+    Entry point of a supervised worker process.
+
+    SIGTERM is turned into KeyboardInterrupt so the worker drains through the
+    same clean-up path as Ctrl+C, and the worker's counters are reported to
+    the supervisor every ``stats_interval`` seconds and once more on exit.
+    """
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    stopped = threading.Event()
+
+    def report_stats(consumer: CliConsumer):
+        while not stopped.wait(stats_interval):
+            stats_queue.put((index, {"forwarded": consumer.forwarded}))
+
+    def on_started(consumer: CliConsumer):
+        threading.Thread(target=report_stats, args=(consumer,), name="greyhound-worker-stats", daemon=True).start()
+
+    consumer = run_consumer(config_data, on_started=on_started)
+    stopped.set()
+    stats_queue.put((index, {"forwarded": consumer.forwarded}))
+
+@cli.command()
+@click.option('--config', type=click.Path(exists=True), required=True, help='Path to config YAML.')
+@click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True, help='Consumer processes to run under a supervisor.')
+@click.option('--drain-timeout', type=float, default=30.0, show_default=True, help='Seconds workers get to finish in-flight messages on SIGTERM.')
+@click.option('--stats-interval', type=float, default=10.0, show_default=True, help='Seconds between combined worker stats reports.')
+def consume(config, workers, drain_timeout, stats_interval):
+    """
+    Start a greyhound consumer using the specified config.
+    """
+    config_data = load_config(config)
+
+    print(f"Config loaded successfully")
+    print(f"Consumer backend: {config_data['consumer']['backend']}")
+    print(f"Producer backend: {config_data['producer']['backend']}")
+
+    if workers == 1:
+        click.echo("Starting consumer loop. Press Ctrl+C to exit.")
+        run_consumer(config_data)
+        return
+
+    if config_data["consumer"].get("backend") == "MEMORY":
+        raise click.UsageError("--workers needs a broker backend; in-memory queues are not shared between worker processes.")
+    metrics = config_data.get("metrics") or {}
+    if metrics.get("port"):
+        # Each worker keeps its metrics in-process; only the combined stats are reported by the supervisor.
+        click.echo("Metrics HTTP export is disabled in worker processes when --workers is used.")
+        config_data = {**config_data, "metrics": {**metrics, "port": None}}
+
+    supervisor = Supervisor(
+        partial(run_worker, config_data, stats_interval),
+        workers,
+        drain_timeout=drain_timeout,
+        stats_interval=stats_interval
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: supervisor.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: supervisor.stop())
+    click.echo(f"Starting {workers} consumer workers. Send SIGTERM or press Ctrl+C to drain and exit.")
+    supervisor.run()
+    click.echo(f"Combined worker stats: {json.dumps(supervisor.stats)}")
+
+@cli.command()
+@click.option('--config', type=click.Path(exists=True), help='Config YAML with producer/consumer connection details; defaults to an in-memory loopback.')
+@click.option('--backend', 'backends', multiple=True, help='Backend to benchmark; repeatable. Defaults to the config backend or MEMORY.')
+@click.option('--codec', 'codecs', multiple=True, default=('json',), show_default=True, help='Codec to benchmark; repeatable.')
+@click.option('--payload-size', 'payload_sizes', multiple=True, type=click.Choice(['small', 'medium', 'large']), default=('small', 'medium'), show_default=True, help='Payload size to benchmark; repeatable.')
+@click.option('--messages', type=int, default=10000, show_default=True, help='Messages measured per case.')
+@click.option('--warmup', type=int, default=500, show_default=True, help='Messages produced before measuring each case.')
+@click.option('--rate', type=float, default=0, show_default=True, help='Target messages per second; 0 produces as fast as possible.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='Write the JSON results to this file instead of stdout.')
+def bench(config, backends, codecs, payload_sizes, messages, warmup, rate, output):
+    """
+    Measure throughput and latency of the adapter hot paths.
+    """
+    from greyhound_messaging.bench import run_suite
+
+    base_config = load_config(config) if config else {
+        "producer": {"backend": "MEMORY", "queue": "greyhound-bench"},
+        "consumer": {"backend": "MEMORY", "queue": "greyhound-bench", "poll_timeout": 0.01},
+    }
+    if not backends:
+        backends = (base_config["consumer"].get("backend", "MEMORY"),)
+
+    report = run_suite(base_config, list(backends), list(codecs), list(payload_sizes), messages, rate=rate, warmup=warmup)
+    rendered = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w') as f:
+            f.write(rendered)
+        click.echo(f"Benchmark results written to {output}")
+    else:
+        click.echo(rendered)
 
 if __name__ == '__main__':
-    consume()
\ No newline at end of file
+    cli()
@@ -0,0 +1,168 @@
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class Supervisor:
+    """
+    Runs a consumer in ``workers`` forked processes and keeps them running.
+
+    Every worker calls ``target(index, stats_queue)`` and opens its own broker
+    connections, so the workers join the same Kafka consumer group or share
+    the same RabbitMQ queue. A worker that exits while the supervisor is not
+    stopping is restarted, with an exponentially growing delay while it keeps
+    crashing. ``stop`` sends SIGTERM to every worker and waits up to
+    ``drain_timeout`` seconds for them to finish in-flight work before
+    killing them.
+
+    Workers report their counters by putting ``(index, {name: value})`` on the
+    stats queue; ``stats`` sums the latest report of every worker with the
+    final reports of workers that were replaced.
+    """
+
+    def __init__(
+            self,
+            target: Callable,
+            workers: int,
+            restart_delay: float = 1.0,
+            max_restart_delay: float = 30.0,
+            drain_timeout: float = 30.0,
+            stats_interval: float = 10.0
+            ):
+        """
+        Initialize the supervisor without starting any worker.
+
+        :param target: Called as ``target(index, stats_queue)`` in every worker process.
+        :param workers: Number of worker processes.
+        :param restart_delay: Seconds before restarting a worker that crashed.
+        :param max_restart_delay: Upper bound on the restart delay of a worker that keeps crashing.
+        :param drain_timeout: Seconds ``stop`` waits for workers to exit before killing them.
+        :param stats_interval: Seconds between logging the combined stats.
+        """
+        self.target = target
+        self.workers = max(1, workers)
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.drain_timeout = drain_timeout
+        self.stats_interval = stats_interval
+        # Workers must inherit the already loaded configuration rather than re-import it.
+        self._context = multiprocessing.get_context("fork")
+        self._stats_queue = self._context.Queue()
+        self._processes = [None] * self.workers
+        self._delays = [restart_delay] * self.workers
+        self._restart_at = [0.0] * self.workers
+        self._started_at = [0.0] * self.workers
+        self._latest = [{} for _ in range(self.workers)]
+        self._retired = {}
+        self.restarts = 0
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def _start(self, index: int):
+        process = self._context.Process(
+            target=self.target,
+            args=(index, self._stats_queue),
+            name=f"greyhound-worker-{index}",
+            daemon=False
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info("Started worker %s (pid %s)", index, process.pid)
+
+    @property
+    def pids(self) -> list[int | None]:
+        return [process.pid if process is not None else None for process in self._processes]
+
+    @property
+    def stats(self) -> dict:
+        """
+        Counters summed across every worker, including workers that were restarted.
+        """
+        with self._lock:
+            totals = dict(self._retired)
+            for latest in self._latest:
+                for name, value in latest.items():
+                    totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def _collect_stats(self, timeout: float = 0.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                index, stats = self._stats_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return
+            with self._lock:
+                self._latest[index] = stats
+
+    def _retire(self, index: int):
+        with self._lock:
+            for name, value in self._latest[index].items():
+                self._retired[name] = self._retired.get(name, 0) + value
+            self._latest[index] = {}
+
+    def run(self):
+        """
+        Start the workers and supervise them until ``stop`` is called, then drain them.
+        """
+        for index in range(self.workers):
+            self._start(index)
+        next_log = time.monotonic() + self.stats_interval
+        while not self._stopping.is_set():
+            self._collect_stats(timeout=0.1)
+            now = time.monotonic()
+            for index, process in enumerate(self._processes):
+                if process.is_alive() or self._stopping.is_set():
+                    continue
+                if self._restart_at[index] == 0.0:
+                    self._collect_stats()
+                    self._retire(index)
+                    # A worker that ran for a while before dying starts again from the base delay.
+                    if now - self._started_at[index] > self.max_restart_delay:
+                        self._delays[index] = self.restart_delay
+                    logger.error(
+                        "Worker %s (pid %s) exited with code %s, restarting in %.1fs",
+                        index, process.pid, process.exitcode, self._delays[index]
+                    )
+                    self._restart_at[index] = now + self._delays[index]
+                    self._delays[index] = min(self.max_restart_delay, self._delays[index] * 2)
+                elif now >= self._restart_at[index]:
+                    self._restart_at[index] = 0.0
+                    self.restarts += 1
+                    self._start(index)
+            if now >= next_log:
+                logger.info("Combined worker stats: %s", self.stats)
+                next_log = now + self.stats_interval
+        self._drain()
+
+    def stop(self):
+        """
+        Ask ``run`` to drain the workers and return. Safe to call from a signal handler.
+        """
+        self._stopping.set()
+
+    def _drain(self):
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.drain_timeout
+        for process in self._processes:
+            if process is None:
+                continue
+            while process.is_alive() and time.monotonic() < deadline:
+                self._collect_stats(timeout=0.05)
+                process.join(timeout=0.05)
+            if process.is_alive():
+                logger.warning("Worker %s (pid %s) did not drain in %.0fs, killing it", process.name, process.pid, self.drain_timeout)
+                process.kill()
+                process.join()
+        self._collect_stats(timeout=0.1)
+        logger.info("All workers stopped. Combined worker stats: %s", self.stats)
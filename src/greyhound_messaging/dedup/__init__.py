@@ -0,0 +1,2 @@
+from .deduplication_cache import DeduplicationCache, SqliteDeduplicationStore
+from .deduplicating_consumer import DeduplicatingConsumer
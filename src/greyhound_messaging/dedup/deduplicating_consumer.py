@@ -0,0 +1,94 @@
+import inspect
+import logging
+
+from greyhound_messaging.dedup.deduplication_cache import DeduplicationCache, SqliteDeduplicationStore
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import REGISTRY, MetricsRegistry
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+logger = logging.getLogger(__name__)
+
+
+class DeduplicatingConsumer(GreyhoundConsumer):
+    """
+    Consumer wrapper that skips messages whose ``metadata.message_id`` was already handled.
+
+    Only ``metadata`` is read before the check, so with ``lazy: true`` a
+    duplicate is dropped without its stages and payload ever being
+    validated. An id is remembered once the wrapped consumer has returned,
+    so a message whose handler raised is not mistaken for a duplicate when
+    it is redelivered. When the wrapped consumer is an AsyncGreyhoundConsumer
+    a coroutine is returned instead, remembering the id once the handler's
+    coroutine has completed.
+    """
+
+    def __init__(self, consumer: GreyhoundConsumer, cache: DeduplicationCache, hits=None, misses=None):
+        """
+        Initialize the wrapper.
+
+        :param consumer: The GreyhoundConsumer to protect from duplicates.
+        :param cache: The cache of handled message ids.
+        :param hits: Optional counter incremented for every duplicate skipped.
+        :param misses: Optional counter incremented for every new message.
+        """
+        super().__init__()
+        self.consumer = consumer
+        self.cache = cache
+        self._hits = hits
+        self._misses = misses
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict | None, queue: str | None = None, registry: MetricsRegistry = REGISTRY):
+        """
+        Create a DeduplicatingConsumer from the ``dedup`` section of a consumer configuration.
+
+        :param consumer: The GreyhoundConsumer instance to wrap.
+        :param config: Deduplication configuration, or None when deduplication is not configured.
+        :param queue: The queue the consumer reads from, used to label metrics.
+        :param registry: The registry hit and miss counts are exported to when it is enabled.
+        :return: An instance of DeduplicatingConsumer, or None to leave the consumer unwrapped.
+        """
+        if not config:
+            return None
+
+        path = config.get("path")
+        cache = DeduplicationCache(
+            max_entries=config.get("max_entries", 100000),
+            ttl=config.get("ttl", 3600.0),
+            store=SqliteDeduplicationStore(path, commit_every=config.get("commit_every", 100)) if path else None
+        )
+        hits = misses = None
+        if registry.enabled:
+            labels = {"queue": queue or ""}
+            hits = registry.counter("greyhound_dedup_hits_total", "Duplicate messages skipped.", ("queue",)).labels(**labels)
+            misses = registry.counter("greyhound_dedup_misses_total", "Messages not seen before.", ("queue",)).labels(**labels)
+            registry.gauge("greyhound_dedup_entries", "Message ids held in the deduplication cache.", ("queue",)).labels(**labels).set_function(cache.__len__)
+        return cls(consumer, cache, hits=hits, misses=misses)
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        message_id = message.metadata.message_id
+        if self.cache.seen(message_id):
+            if self._hits is not None:
+                self._hits.inc()
+            logger.debug("Skipping duplicate message %s", message_id)
+            return message
+        if self._misses is not None:
+            self._misses.inc()
+
+        result = self.consumer.message_received(message)
+        if inspect.isawaitable(result):
+            return self._add_after(result, message_id)
+        self.cache.add(message_id)
+        return result
+
+    async def _add_after(self, result, message_id: str):
+        result = await result
+        self.cache.add(message_id)
+        return result
+
+    def close(self):
+        """
+        Commit and close the persistent store, if any, then close the wrapped consumer.
+        """
+        self.cache.close()
+        self.consumer.close()
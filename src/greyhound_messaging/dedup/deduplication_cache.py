@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class SqliteDeduplicationStore:
+    """
+    Persists seen message ids in SQLite so deduplication survives restarts.
+
+    Writes are committed in batches of ``commit_every`` ids, so a crash can
+    forget the last few ids and let their duplicates through once more,
+    which at-least-once delivery already allows. Expired ids are purged as
+    new ones are written.
+    """
+
+    def __init__(self, path: str, commit_every: int = 100):
+        """
+        Open, or create, the store.
+
+        :param path: Path of the SQLite database file.
+        :param commit_every: Number of ids written between commits.
+        """
+        self.path = path
+        self.commit_every = commit_every
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS seen (message_id TEXT PRIMARY KEY, expires_at REAL NOT NULL)")
+        self._connection.commit()
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+
+    def expires_at(self, message_id: str) -> float | None:
+        """
+        When the stored ``message_id`` expires, or None if it was never stored.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT expires_at FROM seen WHERE message_id = ?", (message_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def add(self, message_id: str, expires_at: float):
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO seen (message_id, expires_at) VALUES (?, ?)", (message_id, expires_at))
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self._connection.execute("DELETE FROM seen WHERE expires_at <= ?", (time.time(),))
+                self._connection.commit()
+                self._uncommitted = 0
+
+    def close(self):
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+
+
+class DeduplicationCache:
+    """
+    Bounded LRU cache of recently handled message ids, each expiring after ``ttl`` seconds.
+
+    At most ``max_entries`` ids are held in memory; the least recently seen
+    id is evicted first, so memory use is fixed by ``max_entries`` and the
+    length of the ids. An optional SqliteDeduplicationStore backs the cache
+    so ids evicted from memory, or remembered by a previous run, are still
+    recognised.
+    """
+
+    def __init__(self, max_entries: int = 100000, ttl: float = 3600.0, store: SqliteDeduplicationStore | None = None):
+        """
+        Initialize an empty cache.
+
+        :param max_entries: Maximum number of ids held in memory.
+        :param ttl: Seconds a handled id is remembered for.
+        :param store: Optional persistent store consulted on a memory miss.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def seen(self, message_id: str) -> bool:
+        """
+        Whether ``message_id`` was added and has not expired, counting a hit or a miss.
+        """
+        now = time.time()
+        entries = self._entries
+        with self._lock:
+            expires_at = entries.get(message_id)
+            if expires_at is not None:
+                if expires_at > now:
+                    entries.move_to_end(message_id)
+                    self.hits += 1
+                    return True
+                del entries[message_id]
+
+        if self.store is not None:
+            expires_at = self.store.expires_at(message_id)
+            if expires_at is not None and expires_at > now:
+                with self._lock:
+                    self._remember(message_id, expires_at)
+                    self.hits += 1
+                return True
+
+        with self._lock:
+            self.misses += 1
+        return False
+
+    def add(self, message_id: str):
+        """
+        Remember ``message_id`` as handled.
+        """
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(message_id, expires_at)
+        if self.store is not None:
+            self.store.add(message_id, expires_at)
+
+    def _remember(self, message_id: str, expires_at: float):
+        entries = self._entries
+        entries[message_id] = expires_at
+        entries.move_to_end(message_id)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Hits, misses and the number of ids held in memory.
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
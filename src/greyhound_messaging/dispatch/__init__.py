@@ -0,0 +1,2 @@
+from .keyed_dispatcher import KeyedDispatcher
+from .offset_tracker import OffsetTracker, PartitionOffsets
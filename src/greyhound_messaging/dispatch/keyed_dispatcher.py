@@ -0,0 +1,202 @@
+import itertools
+import logging
+import math
+import pickle
+import queue
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable
+
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# The consumer of a ``process`` mode child, installed once when the child starts.
+_process_consumer: GreyhoundConsumer | None = None
+
+
+def _install_consumer(consumer: GreyhoundConsumer):
+    global _process_consumer
+    _process_consumer = consumer
+
+
+def _run_handler(message: GreyhoundMessageRoot):
+    return _process_consumer.message_received(message)
+
+
+class KeyedDispatcher:
+    """
+    Runs consumer handlers on a pool of workers while preserving order per key.
+
+    Every message is routed to a worker by hashing its ordering key, so messages
+    sharing a key are handled one after another by the same worker while
+    messages with different keys are handled in parallel. In ``process`` mode
+    each worker hands its messages to a dedicated child process, which requires
+    the consumer and messages to be picklable. The consumer is copied into
+    each child once, when it starts, so state it keeps is per child.
+
+    In ``thread`` mode a consumer's handler runs on several workers at once,
+    so anything it shares across messages, such as a producer, must be safe to
+    use from several threads.
+
+    With ``priority`` enabled each worker's backlog is a priority queue on
+    ``metadata.priority``: higher-priority messages are handled before
+    lower-priority ones already waiting on the same worker, and messages of
+    equal priority keep their order. Ordering per key then only holds among
+    messages of the same priority.
+    """
+
+    MODES = ("thread", "process")
+
+    def __init__(
+            self,
+            consumer: GreyhoundConsumer,
+            workers: int = 4,
+            mode: str = "thread",
+            ordering_key: str = "correlation_id",
+            metrics: AdapterMetrics | None = None,
+            priority: bool = False
+            ):
+        """
+        Initialize the dispatcher and start its workers.
+
+        :param consumer: The GreyhoundConsumer whose handler is run for every message.
+        :param workers: Number of workers, and therefore of independently ordered lanes.
+        :param mode: ``thread`` to run handlers in worker threads, ``process`` to run them in child processes.
+        :param ordering_key: Metadata (or message) field whose value keeps messages in order.
+        :param metrics: Metrics of the owning adapter; queued and running messages count as in flight.
+        :param priority: Let higher ``metadata.priority`` messages skip ahead of each worker's backlog.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown dispatch mode: {mode}")
+        if mode == "process":
+            try:
+                pickle.dumps(consumer)
+            except Exception as e:
+                raise ValueError(f"The process dispatch mode requires a picklable consumer, {type(consumer).__name__} is not: {e}") from e
+
+        self.consumer = consumer
+        self.workers = max(1, workers)
+        self.mode = mode
+        self.ordering_key = ordering_key
+        self.metrics = metrics
+        self.priority = priority
+        self._sequence = itertools.count()
+        self._queues = [(queue.PriorityQueue if priority else queue.Queue)() for _ in range(self.workers)]
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_install_consumer, initargs=(consumer,))
+            for _ in range(self.workers)
+        ] if mode == "process" else []
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"greyhound-dispatch-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict | None, metrics: AdapterMetrics | None = None):
+        """
+        Create a KeyedDispatcher from the ``dispatch`` section of a consumer configuration.
+
+        :param consumer: The GreyhoundConsumer instance to use.
+        :param config: Dispatch configuration, or None when dispatch is not configured.
+        :param metrics: Metrics of the owning adapter.
+        :return: An instance of KeyedDispatcher, or None to handle messages inline.
+        """
+        if not config:
+            return None
+
+        return cls(
+            consumer,
+            workers=config.get("workers", 4),
+            mode=config.get("mode", "thread"),
+            ordering_key=config.get("ordering_key", "correlation_id"),
+            metrics=metrics,
+            priority=config.get("priority", False)
+        )
+
+    def key_for(self, message: GreyhoundMessageRoot) -> str:
+        """
+        Resolve the ordering key of a message, looking in its metadata first.
+        """
+        value = getattr(message.metadata, self.ordering_key, None)
+        if value is None:
+            value = getattr(message, self.ordering_key, None)
+        return "" if value is None else str(value)
+
+    def worker_for(self, message: GreyhoundMessageRoot) -> int:
+        return zlib.crc32(self.key_for(message).encode("utf-8")) % self.workers
+
+    def submit(self, message: GreyhoundMessageRoot, on_done: Callable[[Future], None] | None = None) -> Future:
+        """
+        Queue a message on the worker that owns its key.
+
+        :param message: The message to hand to the consumer.
+        :param on_done: Called from the worker with the completed future once the handler has finished.
+        :return: A future resolving to the handler's result.
+        """
+        future = Future()
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        if self.metrics is not None:
+            self.metrics.in_flight.inc()
+        self._put(self.worker_for(message), (message, future), message.metadata.priority or 0)
+        return future
+
+    def _put(self, index: int, item, priority: int = 0):
+        if self.priority:
+            # The sequence number keeps equal priorities in FIFO order and never lets the items themselves be compared.
+            item = (-priority, next(self._sequence), item)
+        self._queues[index].put(item)
+
+    def _work(self, index: int):
+        work_queue = self._queues[index]
+        while True:
+            item = work_queue.get()
+            if self.priority:
+                item = item[2]
+            if item is _STOP:
+                return
+            message, future = item
+            if not future.set_running_or_notify_cancel():
+                if self.metrics is not None:
+                    self.metrics.in_flight.dec()
+                continue
+            started = time.perf_counter() if self.metrics is not None else 0
+            try:
+                if self.mode == "process":
+                    result = self._executors[index].submit(_run_handler, message).result()
+                else:
+                    result = self.consumer.message_received(message)
+            except BaseException as e:
+                logger.exception("Handler failed for message %s", message.metadata.message_id)
+                self._observe(started)
+                future.set_exception(e)
+            else:
+                self._observe(started)
+                future.set_result(result)
+
+    def _observe(self, started: float):
+        if self.metrics is not None:
+            self.metrics.handler_seconds.observe(time.perf_counter() - started)
+            self.metrics.in_flight.dec()
+
+    def close(self, wait: bool = True):
+        """
+        Stop the workers once every queued message has been handled.
+        """
+        for index in range(self.workers):
+            # Stop after everything already queued, whatever its priority.
+            self._put(index, _STOP, -math.inf)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        for executor in self._executors:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,236 @@
+import bisect
+import threading
+import time
+from typing import Hashable, Iterable
+
+
+class PartitionOffsets:
+    """
+    Completion state of one partition: the low-water mark and the completed offsets above it.
+
+    ``base`` is the lowest offset not yet known to be handled, which is the
+    offset to commit, and ``end`` is the offset after the last one tracked.
+    Completed offsets above ``base`` are kept as sorted, disjoint
+    ``[start, stop)`` intervals, so the state stays a handful of integers
+    however many messages complete out of order. Offsets skipped by the
+    broker, such as compacted records or transaction markers, count as
+    completed as soon as a later offset is tracked.
+    """
+
+    __slots__ = ("base", "end", "committed", "in_flight", "_starts", "_stops")
+
+    def __init__(self, offset: int):
+        self.base = offset
+        self.end = offset
+        self.committed = offset
+        self.in_flight = 0
+        self._starts: list[int] = []
+        self._stops: list[int] = []
+
+    def track(self, offset: int):
+        """
+        Record an offset handed to a handler. Offsets must be tracked in increasing order.
+        """
+        if offset < self.end:
+            return
+        if offset > self.end:
+            self._add(self.end, offset)
+        self.end = offset + 1
+        self.in_flight += 1
+
+    def complete(self, offset: int) -> bool:
+        """
+        Record a handled offset and advance the low-water mark past every contiguously completed offset.
+
+        :return: Whether the offset was being tracked.
+        """
+        if offset < self.base or offset >= self.end:
+            return False
+        index = bisect.bisect_right(self._starts, offset) - 1
+        if index >= 0 and offset < self._stops[index]:
+            return False
+        self._add(offset, offset + 1)
+        self.in_flight -= 1
+        return True
+
+    def rewind(self, offset: int) -> bool:
+        """
+        Forget ``offset`` and every offset tracked after it, so they can be tracked again once refetched.
+
+        :return: False when ``offset`` is not tracked, or already completed.
+        """
+        if offset < self.base or offset >= self.end:
+            return False
+        starts, stops = self._starts, self._stops
+        index = bisect.bisect_right(starts, offset) - 1
+        if index >= 0 and offset < stops[index]:
+            return False
+        completed = 0
+        for start, stop in zip(starts, stops):
+            if stop > offset:
+                completed += stop - max(start, offset)
+        self.in_flight -= (self.end - offset) - completed
+        keep = bisect.bisect_left(starts, offset)
+        del starts[keep:], stops[keep:]
+        self.end = offset
+        return True
+
+    def _add(self, start: int, stop: int):
+        starts, stops = self._starts, self._stops
+        index = bisect.bisect_left(starts, start)
+        if index > 0 and stops[index - 1] == start:
+            index -= 1
+            start = starts[index]
+            del starts[index], stops[index]
+        if index < len(starts) and starts[index] == stop:
+            stop = stops[index]
+            del starts[index], stops[index]
+        starts.insert(index, start)
+        stops.insert(index, stop)
+        if starts[0] == self.base:
+            self.base = stops[0]
+            del starts[0], stops[0]
+
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        """
+        The completed ``[start, stop)`` intervals above the low-water mark.
+        """
+        return list(zip(self._starts, self._stops))
+
+
+class OffsetTracker:
+    """
+    Tracks out-of-order completion of consumed offsets across partitions so only safe offsets are committed.
+
+    Offsets are tracked from the consuming thread as messages are handed to
+    handlers, and completed from whichever thread ran the handler. The offset
+    committed for a partition is its low-water mark, the lowest offset not yet
+    handled, so a message still in flight is never skipped by a commit however
+    many later messages have already finished. A failed message is never
+    completed; the consumer rewinds its partition to it, which drops the
+    failed offset and every later one so they are tracked again when they
+    are fetched a second time.
+    """
+
+    def __init__(self):
+        self._partitions: dict[Hashable, PartitionOffsets] = {}
+        self._completed = 0
+        self._condition = threading.Condition()
+
+    def track(self, partition: Hashable, offset: int):
+        """
+        Record that ``offset`` of ``partition`` was handed to a handler.
+        """
+        with self._condition:
+            offsets = self._partitions.get(partition)
+            if offsets is None:
+                offsets = self._partitions[partition] = PartitionOffsets(offset)
+            offsets.track(offset)
+
+    def complete(self, partition: Hashable, offset: int):
+        """
+        Record that ``offset`` of ``partition`` was handled. Offsets of partitions no longer tracked are ignored.
+        """
+        with self._condition:
+            offsets = self._partitions.get(partition)
+            if offsets is not None and offsets.complete(offset):
+                self._completed += 1
+                self._condition.notify_all()
+
+    def rewind(self, partition: Hashable, offset: int) -> bool:
+        """
+        Stop tracking ``offset`` of ``partition`` and every offset after it, ahead of fetching them again.
+
+        Handlers of dropped offsets that are still running may complete them
+        once they are tracked again, which only ever means they were handled.
+
+        :return: Whether the partition must be rewound; False when the offset was already completed, rewound past or revoked.
+        """
+        with self._condition:
+            offsets = self._partitions.get(partition)
+            if offsets is None or not offsets.rewind(offset):
+                return False
+            self._condition.notify_all()
+            return True
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of tracked offsets not completed yet, across every partition.
+        """
+        with self._condition:
+            return sum(offsets.in_flight for offsets in self._partitions.values())
+
+    @property
+    def uncommitted(self) -> int:
+        """
+        Number of offsets completed since ``committable`` last returned them.
+        """
+        return self._completed
+
+    def committable(self, partitions: Iterable[Hashable] | None = None) -> dict[Hashable, int]:
+        """
+        The low-water mark of every partition that advanced since the previous call, marked as committed.
+
+        :param partitions: Only consider these partitions, every tracked one by default.
+        """
+        with self._condition:
+            selected = self._partitions if partitions is None else {
+                partition: self._partitions[partition] for partition in partitions if partition in self._partitions
+            }
+            offsets = {}
+            for partition, state in selected.items():
+                if state.base > state.committed:
+                    offsets[partition] = state.committed = state.base
+            if partitions is None:
+                self._completed = 0
+            return offsets
+
+    def wait_for_capacity(self, limit: int, timeout: float | None = None) -> bool:
+        """
+        Block until fewer than ``limit`` offsets are in flight.
+
+        :return: False if ``timeout`` seconds passed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while sum(offsets.in_flight for offsets in self._partitions.values()) >= limit:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def revoke(self, partitions: Iterable[Hashable], timeout: float = 0.0) -> dict[Hashable, int]:
+        """
+        Stop tracking partitions taken away by a rebalance.
+
+        Waits up to ``timeout`` seconds for their in-flight offsets to complete
+        so the final commit covers as much as possible; offsets still running
+        afterwards will be redelivered to the partition's next owner.
+
+        :return: The low-water marks of the revoked partitions that still need committing.
+        """
+        partitions = list(partitions)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            def busy():
+                return any(self._partitions[p].in_flight for p in partitions if p in self._partitions)
+
+            while busy():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            offsets = {}
+            for partition in partitions:
+                state = self._partitions.pop(partition, None)
+                if state is not None and state.base > state.committed:
+                    offsets[partition] = state.base
+            self._condition.notify_all()
+            return offsets
+
+    def __contains__(self, partition: Hashable) -> bool:
+        with self._condition:
+            return partition in self._partitions
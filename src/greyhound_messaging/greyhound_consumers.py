@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
+import inspect
 
-from greyhound_messaging.adapters._abstracts.core_messaging import ConsumerMessageAdapter
 from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
 
 class GreyhoundConsumer(ABC):
@@ -12,3 +12,32 @@ class GreyhoundConsumer(ABC):
 
         return message
 
+    def close(self):
+        """
+        Release anything the consumer holds; called by the consumer adapter's close().
+
+        Wrappers close the consumer they wrap after themselves.
+        """
+
+
+class AsyncGreyhoundConsumer(GreyhoundConsumer):
+    """
+    Consumer whose message_received hook is a coroutine, for use with the asyncio adapters.
+    """
+
+    async def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+
+        return message
+
+
+async def dispatch_async(consumer: GreyhoundConsumer, message: GreyhoundMessageRoot):
+    """
+    Invoke a consumer's message_received hook, awaiting it when it is a coroutine.
+
+    This lets the asyncio adapters drive both AsyncGreyhoundConsumer and
+    plain GreyhoundConsumer implementations.
+    """
+    result = consumer.message_received(message)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
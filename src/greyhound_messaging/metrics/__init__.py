@@ -0,0 +1,28 @@
+from .registry import MetricsRegistry, Counter, Gauge, Histogram, REGISTRY, DEFAULT_BUCKETS
+from .adapter_metrics import AdapterMetrics
+from .exporter import start_http_server
+
+_server = None
+
+
+def configure_metrics(config: dict | None, registry: MetricsRegistry = REGISTRY):
+    """
+    Enable metrics from the top-level ``metrics`` configuration section.
+
+    Metrics stay disabled when the section is missing or ``enabled`` is false.
+    When a ``port`` is given the registry is also served over HTTP; the
+    endpoint is started once per process however often this is called.
+
+    :param config: The ``metrics`` section, e.g. ``{"enabled": True, "port": 9464}``.
+    :param registry: The registry to enable.
+    :return: The registry.
+    """
+    global _server
+    if not config or not config.get("enabled", True):
+        return registry
+
+    registry.enable()
+    port = config.get("port")
+    if port is not None and _server is None:
+        _server = start_http_server(port, host=config.get("host", "127.0.0.1"), registry=registry, path=config.get("path", "/metrics"))
+    return registry
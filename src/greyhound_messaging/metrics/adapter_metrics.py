@@ -0,0 +1,117 @@
+import time
+from typing import Callable
+
+from greyhound_messaging.metrics.registry import REGISTRY, MetricsRegistry
+from greyhound_messaging.serialization import DECODE_ERRORS
+
+LABELS = ("backend", "role", "queue")
+
+
+class AdapterMetrics:
+    """
+    The metrics one adapter reports, with every label already bound.
+
+    Adapters hold an AdapterMetrics, or None when metrics are disabled, and
+    guard each update with ``if self.metrics is not None`` so the disabled
+    path stays a single attribute check.
+    """
+
+    def __init__(self, registry: MetricsRegistry, backend: str, role: str, queue: str | None):
+        """
+        Look up the metric children for one adapter.
+
+        :param registry: The registry the metrics are exported from.
+        :param backend: The adapter's backend, e.g. ``KAFKA``.
+        :param role: ``consumer`` or ``producer``.
+        :param queue: The queue or topic the adapter is bound to.
+        """
+        labels = {"backend": backend, "role": role, "queue": queue or ""}
+        self.registry = registry
+        self.labels = labels
+        self.consumed = registry.counter("greyhound_messages_consumed_total", "Messages received from the broker.", LABELS).labels(**labels)
+        self.produced = registry.counter("greyhound_messages_produced_total", "Messages handed to the broker.", LABELS).labels(**labels)
+        self.acked = registry.counter("greyhound_messages_acked_total", "Messages acknowledged or committed.", LABELS).labels(**labels)
+        self.nacked = registry.counter("greyhound_messages_nacked_total", "Messages rejected back to the broker.", LABELS).labels(**labels)
+        self.decode_errors = registry.counter("greyhound_decode_errors_total", "Message bodies that failed to decode.", LABELS).labels(**labels)
+        self.decode_seconds = registry.histogram("greyhound_decode_seconds", "Time spent decoding message bodies.", LABELS).labels(**labels)
+        self.handler_seconds = registry.histogram("greyhound_handler_seconds", "Time spent in consumer handlers.", LABELS).labels(**labels)
+        self.produce_seconds = registry.histogram("greyhound_produce_seconds", "Time spent encoding and handing messages to the broker.", LABELS).labels(**labels)
+        self.ack_latency_seconds = registry.histogram("greyhound_ack_latency_seconds", "Time from receiving a message to acknowledging it.", LABELS).labels(**labels)
+        self.in_flight = registry.gauge("greyhound_in_flight", "Messages received but not yet handled.", LABELS).labels(**labels)
+        self.buffer_depth = registry.gauge("greyhound_buffer_depth", "Messages buffered by the adapter awaiting delivery or acknowledgement.", LABELS).labels(**labels)
+
+    @classmethod
+    def from_config(cls, backend: str, role: str, config: dict, registry: MetricsRegistry = REGISTRY):
+        """
+        Create the metrics for an adapter if metrics are enabled.
+
+        :param backend: The adapter's backend, e.g. ``KAFKA``.
+        :param role: ``consumer`` or ``producer``.
+        :param config: The adapter's configuration section.
+        :param registry: The registry to report to.
+        :return: An instance of AdapterMetrics, or None when the registry is disabled.
+        """
+        if not registry.enabled:
+            return None
+        return cls(registry, backend, role, config.get("queue"))
+
+    def decode(self, decode: Callable, body, headers: dict):
+        """
+        Decode a received body, counting it and timing the decode.
+
+        Decode errors are counted and re-raised.
+        """
+        self.consumed.inc()
+        started = time.perf_counter()
+        try:
+            return decode(body, headers)
+        except DECODE_ERRORS:
+            self.decode_errors.inc()
+            raise
+        finally:
+            self.decode_seconds.observe(time.perf_counter() - started)
+
+    def handle(self, handler: Callable, message):
+        """
+        Run a consumer handler, timing it and tracking it as in flight.
+        """
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            return handler(message)
+        finally:
+            self.handler_seconds.observe(time.perf_counter() - started)
+            self.in_flight.dec()
+
+    async def handle_async(self, handler: Callable, message):
+        """
+        Await a coroutine handler, timing it and tracking it as in flight.
+        """
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            return await handler(message)
+        finally:
+            self.handler_seconds.observe(time.perf_counter() - started)
+            self.in_flight.dec()
+
+    def observe_produce(self, started: float, count: int = 1):
+        """
+        Record messages handed to the broker since ``started`` (a ``time.perf_counter()`` reading).
+        """
+        self.produced.inc(count)
+        self.produce_seconds.observe(time.perf_counter() - started)
+
+    def observe_ack(self, received_at: float | None = None, count: int = 1):
+        """
+        Record acknowledged messages, and the ack latency of the oldest one when its receive time is known.
+        """
+        self.acked.inc(count)
+        if received_at is not None:
+            self.ack_latency_seconds.observe(time.perf_counter() - received_at)
+
+    def track_buffer(self, depth: Callable[[], float]):
+        """
+        Export the adapter's buffer depth by calling ``depth`` at scrape time.
+        """
+        self.buffer_depth.set_function(depth)
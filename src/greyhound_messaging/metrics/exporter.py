@@ -0,0 +1,53 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from greyhound_messaging.metrics.registry import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _handler_for(registry: MetricsRegistry, path: str):
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != path:
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("metrics endpoint: " + format, *args)
+
+    return MetricsHandler
+
+
+def start_http_server(
+        port: int,
+        host: str = "127.0.0.1",
+        registry: MetricsRegistry = REGISTRY,
+        path: str = "/metrics"
+        ) -> ThreadingHTTPServer:
+    """
+    Serve the registry in the Prometheus text format from a background thread.
+
+    :param port: Port to listen on, 0 to pick a free one.
+    :param host: Interface to bind; local-only by default.
+    :param registry: The registry to export.
+    :param path: URL path the metrics are served from.
+    :return: The running server; call ``shutdown()`` to stop it.
+    """
+    server = ThreadingHTTPServer((host, port), _handler_for(registry, path))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="greyhound-metrics", daemon=True)
+    thread.start()
+    logger.info("Serving metrics on http://%s:%s%s", host, server.server_address[1], path)
+    return server
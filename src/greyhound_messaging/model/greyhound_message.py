@@ -1,14 +1,195 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
-class GreyhoundMessageStage(BaseModel):
+class _TrackedDict(dict):
+    """
+    A dict that flags its owner as modified when it is changed in place.
+
+    ``flag`` is a ``(private, key, value)`` triple: every change sets
+    ``private[key] = value`` on the ``__pydantic_private__`` of the owner.
+    Copies and pickles are plain dicts.
+    """
+
+    __slots__ = ("_flag",)
+
+    def __init__(self, items, flag: tuple):
+        super().__init__(items)
+        self._flag = flag
+
+    def _changed(self):
+        private, key, value = self._flag
+        private[key] = value
+
+    def __setitem__(self, key, value):
+        self._changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._changed()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._changed()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._changed()
+        super().update(*args, **kwargs)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+class _TrackedList(list):
+    """
+    A list that flags its owner as modified when it is changed in place, like _TrackedDict.
+    """
+
+    __slots__ = ("_flag",)
+
+    def __init__(self, items, flag: tuple):
+        super().__init__(items)
+        self._flag = flag
+
+    def _changed(self):
+        private, key, value = self._flag
+        private[key] = value
+
+    def __setitem__(self, index, value):
+        self._changed()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._changed()
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, count):
+        self._changed()
+        return super().__imul__(count)
+
+    def append(self, value):
+        self._changed()
+        super().append(value)
+
+    def extend(self, values):
+        self._changed()
+        super().extend(values)
+
+    def insert(self, index, value):
+        self._changed()
+        super().insert(index, value)
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def remove(self, value):
+        self._changed()
+        super().remove(value)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._changed()
+        super().reverse()
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+def _track(value, flag: tuple):
+    """
+    Wrap ``value`` and every dict and list nested in it so that changing any of them raises ``flag``.
+    """
+    if type(value) is dict:
+        return _TrackedDict({key: _track(item, flag) for key, item in value.items()}, flag)
+    if type(value) is list:
+        return _TrackedList([_track(item, flag) for item in value], flag)
+    if isinstance(value, GreyhoundMessageStage):
+        value._track_changes()
+    return value
+
+def _model_eq(model: BaseModel, other) -> bool:
+    # Change tracking is a transport detail and must not affect equality.
+    return (
+        type(model) is type(other)
+        and model.__dict__ == other.__dict__
+        and model.__pydantic_extra__ == other.__pydantic_extra__
+    )
+
+class _ChangeTrackedModel(BaseModel):
+    """
+    A model nested in a message that remembers being modified, so the message knows its original body is stale.
+    """
+
+    # Set when a field is reassigned or a tracked container it holds is changed in place.
+    _modified: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._modified = True
+
+    @property
+    def is_modified(self) -> bool:
+        return bool(self.__pydantic_private__ and self.__pydantic_private__.get("_modified"))
+
+    def mark_clean(self):
+        if self.__pydantic_private__ is not None:
+            self.__pydantic_private__["_modified"] = False
+
+    def _track_field(self, name: str):
+        """
+        Replace the container held by field ``name`` with a tracked copy, once, and return it.
+        """
+        value = self.__dict__[name]
+        private = self.__pydantic_private__
+        if type(value) in (dict, list) and private is not None:
+            value = self.__dict__[name] = _track(value, (private, "_modified", True))
+        return value
+
+class GreyhoundMessageStage(_ChangeTrackedModel):
 
     destination: str
     inputs: dict = Field(default_factory=dict)
     outputs: dict = Field(default_factory=dict)
     parameters: dict = Field(default_factory=dict)
 
-class GreyhoundMessageMetadata(BaseModel):
+    def __eq__(self, other):
+        if isinstance(other, GreyhoundMessageStage):
+            return _model_eq(self, other)
+        return NotImplemented
+
+    def _track_changes(self):
+        for name in ("inputs", "outputs", "parameters"):
+            self._track_field(name)
+
+class GreyhoundMessageMetadata(_ChangeTrackedModel):
 
     correlation_id: str
     message_id: str
@@ -18,6 +199,25 @@ class GreyhoundMessageMetadata(BaseModel):
     error_message: str | None = None
     custom_headers: dict = Field(default_factory=dict)
 
+    def __eq__(self, other):
+        if isinstance(other, GreyhoundMessageMetadata):
+            return _model_eq(self, other)
+        return NotImplemented
+
+    def get_header(self, name: str, default=None):
+        """
+        Read a custom header.
+        """
+        return self.__dict__["custom_headers"].get(name, default)
+
+def _property(name: str, get):
+    def set_(model, value):
+        model.__dict__[name] = value
+    return property(get, set_)
+
+# ``custom_headers`` is handed out as a tracked dict, so changing it in place marks the metadata modified.
+GreyhoundMessageMetadata.custom_headers = _property("custom_headers", lambda metadata: metadata._track_field("custom_headers"))
+
 class GreyhoundMessageRoot(BaseModel):
 
     event_type: str
@@ -25,3 +225,73 @@ class GreyhoundMessageRoot(BaseModel):
     stages: list[GreyhoundMessageStage] = Field(default_factory=list)
     payload: dict
     metadata: GreyhoundMessageMetadata = Field(default_factory=GreyhoundMessageMetadata) 
+
+    # The body this message was decoded from, kept so that an unmodified message
+    # can be forwarded without re-encoding it. Reassigning any field, including
+    # fields of ``metadata`` and ``stages``, clears it. So does changing
+    # ``stages``, ``payload`` or ``metadata.custom_headers`` in place: while a
+    # body is kept they are handed out as containers that track changes.
+    _raw_body: bytes | None = PrivateAttr(default=None)
+    _raw_content_type: str | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        if not name.startswith("_"):
+            self.mark_dirty()
+        super().__setattr__(name, value)
+
+    def _track_field(self, name: str):
+        """
+        Replace the container held by field ``name`` with a tracked copy while a body is kept, and return it.
+        """
+        value = self.__dict__[name]
+        private = self.__pydantic_private__
+        if type(value) in (dict, list) and private is not None and private.get("_raw_body") is not None:
+            value = self.__dict__[name] = _track(value, (private, "_raw_body", None))
+        return value
+
+    def __eq__(self, other):
+        if isinstance(other, GreyhoundMessageRoot):
+            return _model_eq(self, other)
+        return NotImplemented
+
+    def model_copy(self, *, update=None, deep=False):
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.mark_dirty()
+        if not deep:
+            # A shallow copy shares its nested values with this message, so neither can see the other change them.
+            copy.mark_dirty()
+            self.mark_dirty()
+        return copy
+
+    def attach_raw_body(self, body: bytes, content_type: str | None):
+        """
+        Remember the body this message was decoded from.
+        """
+        self._raw_body = body
+        self._raw_content_type = content_type
+        self.__dict__["metadata"].mark_clean()
+
+    def mark_dirty(self):
+        """
+        Forget the original body so the message is re-encoded when produced.
+        """
+        private = self.__pydantic_private__
+        if private is not None and private.get("_raw_body") is not None:
+            private["_raw_body"] = None
+            private["_raw_content_type"] = None
+
+    @property
+    def raw_body(self) -> tuple[bytes, str | None] | None:
+        """
+        The original body and its content type, or None once the message has been modified.
+        """
+        if self._raw_body is None or self.__dict__["metadata"].is_modified:
+            return None
+        stages = self.__dict__["stages"]
+        if type(stages) is _TrackedList and any(stage.is_modified for stage in stages):
+            return None
+        return self._raw_body, self._raw_content_type
+
+GreyhoundMessageRoot.payload = _property("payload", lambda message: message._track_field("payload"))
+GreyhoundMessageRoot.stages = _property("stages", lambda message: message._track_field("stages"))
@@ -0,0 +1,99 @@
+from typing import Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageMetadata, GreyhoundMessageRoot, GreyhoundMessageStage
+
+class GreyhoundEnvelopeMetadata(GreyhoundMessageMetadata):
+    """
+    Read-only metadata exposed by a lazily decoded message.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+class GreyhoundMessageEnvelope(BaseModel):
+    """
+    The routing fields of a GreyhoundMessageRoot; ``stages`` and ``payload`` are skipped, not validated.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    event_type: str
+    is_dry_run: bool = False
+    metadata: GreyhoundEnvelopeMetadata = Field(default_factory=GreyhoundEnvelopeMetadata)
+
+
+class LazyGreyhoundMessage:
+    """
+    A message whose envelope is validated up front while ``stages`` and ``payload``
+    are only decoded on first access.
+
+    ``event_type``, ``is_dry_run`` and ``metadata`` are read-only. Accessing
+    ``stages``, ``payload`` or ``message`` decodes the full GreyhoundMessageRoot,
+    which may then be modified like any other message. When the body turns out
+    to be invalid that access raises MessageDecodeError, which the adapters
+    handle like a body that failed to decode up front. Until that happens the
+    original body is kept so the message can be forwarded without re-encoding it.
+    """
+
+    __slots__ = ("raw", "content_type", "_envelope", "_decode", "_message")
+
+    def __init__(
+            self,
+            raw: bytes,
+            envelope: GreyhoundMessageEnvelope,
+            decode: Callable[[bytes], GreyhoundMessageRoot],
+            content_type: str | None = None
+            ):
+        """
+        Initialize the lazy message.
+
+        :param raw: The original message body.
+        :param envelope: The already validated envelope of the body.
+        :param decode: Decodes the full message from the body on first access.
+        :param content_type: The content type the body was encoded with.
+        """
+        self.raw = raw
+        self.content_type = content_type
+        self._envelope = envelope
+        self._decode = decode
+        self._message: GreyhoundMessageRoot | None = None
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        Whether the full message has been decoded.
+        """
+        return self._message is not None
+
+    @property
+    def message(self) -> GreyhoundMessageRoot:
+        """
+        The fully decoded message, decoded on first access.
+        """
+        if self._message is None:
+            self._message = self._decode(self.raw)
+        return self._message
+
+    @property
+    def event_type(self) -> str:
+        return self._envelope.event_type if self._message is None else self._message.event_type
+
+    @property
+    def is_dry_run(self) -> bool:
+        return self._envelope.is_dry_run if self._message is None else self._message.is_dry_run
+
+    @property
+    def metadata(self) -> GreyhoundMessageMetadata:
+        return self._envelope.metadata if self._message is None else self._message.metadata
+
+    @property
+    def stages(self) -> list[GreyhoundMessageStage]:
+        return self.message.stages
+
+    @property
+    def payload(self) -> dict:
+        return self.message.payload
+
+    def __repr__(self) -> str:
+        state = "materialized" if self.is_materialized else f"{len(self.raw)} bytes"
+        return f"LazyGreyhoundMessage(event_type={self.event_type!r}, {state})"
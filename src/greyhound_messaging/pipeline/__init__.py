@@ -0,0 +1 @@
+from .stage_executor import STAGE_CURSOR_HEADER, StageExecutor
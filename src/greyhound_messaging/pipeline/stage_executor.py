@@ -0,0 +1,133 @@
+import logging
+import threading
+from typing import Callable
+
+from greyhound_messaging.adapters._abstracts.core_messaging import ProducerMessageAdapter
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot, GreyhoundMessageStage
+from greyhound_messaging.model.lazy_message import LazyGreyhoundMessage
+
+logger = logging.getLogger(__name__)
+
+# Index of the next stage to run, kept in ``metadata.custom_headers`` so a
+# message forwarded mid-pipeline resumes where the previous process stopped.
+STAGE_CURSOR_HEADER = "greyhound-stage"
+
+StageHandler = Callable[[GreyhoundMessageStage, GreyhoundMessageRoot], dict | None]
+
+
+class StageExecutor(GreyhoundConsumer):
+    """
+    Consumer that runs consecutive local stages of a message back to back in memory.
+
+    Each stage of ``message.stages`` names a ``destination``. Starting at the
+    message's stage cursor, every stage whose destination has a local handler
+    is run in turn and its ``outputs`` filled in from the handler's return
+    value, skipping the serialize/publish/consume round-trip between them. At
+    the first stage handled elsewhere the message is produced to that
+    destination; once every stage has run it is passed to ``on_complete``.
+    """
+
+    def __init__(
+            self,
+            handlers: dict[str, StageHandler] | None = None,
+            producers: dict[str, ProducerMessageAdapter] | None = None,
+            producer_factory: Callable[[str], ProducerMessageAdapter] | None = None,
+            on_complete: Callable[[GreyhoundMessageRoot], None] | None = None
+            ):
+        """
+        Initialize the executor.
+
+        :param handlers: Local stage handlers keyed by destination. A handler receives the stage and the message and returns the stage outputs.
+        :param producers: Producers for remote destinations, keyed by destination.
+        :param producer_factory: Creates the producer for a remote destination missing from ``producers``.
+        :param on_complete: Called with the message once its last stage has run.
+        """
+        super().__init__()
+        self.handlers = dict(handlers or {})
+        self.producers = dict(producers or {})
+        self.producer_factory = producer_factory
+        self.on_complete = on_complete
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, handlers: dict[str, StageHandler], config: dict, on_complete: Callable | None = None):
+        """
+        Create a StageExecutor forwarding to remote destinations through producers built from configuration.
+
+        Every remote destination gets its own producer, created from the
+        ``producer`` section with ``queue`` set to the destination.
+
+        :param handlers: Local stage handlers keyed by destination.
+        :param config: Producer configuration section used as the template for remote destinations.
+        :param on_complete: Called with the message once its last stage has run.
+        :return: An instance of StageExecutor.
+        """
+        from greyhound_messaging.adapters.adapter_factory import adapter_factory_producer
+
+        def producer_factory(destination: str) -> ProducerMessageAdapter:
+            return adapter_factory_producer({"producer": {**config, "queue": destination}})
+
+        return cls(handlers, producer_factory=producer_factory, on_complete=on_complete)
+
+    def stage(self, destination: str) -> Callable[[StageHandler], StageHandler]:
+        """
+        Decorator registering the decorated function as the local handler for ``destination``.
+        """
+        def register(handler: StageHandler) -> StageHandler:
+            self.handlers[destination] = handler
+            return handler
+        return register
+
+    def _producer(self, destination: str) -> ProducerMessageAdapter:
+        producer = self.producers.get(destination)
+        if producer is None:
+            if self.producer_factory is None:
+                raise ValueError(f"No handler or producer for stage destination: {destination}")
+            with self._lock:
+                producer = self.producers.get(destination)
+                if producer is None:
+                    producer = self.producers[destination] = self.producer_factory(destination)
+        return producer
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        if isinstance(message, LazyGreyhoundMessage):
+            message = message.message
+
+        stages = message.stages
+        custom_headers = message.metadata.custom_headers
+        index = int(custom_headers.get(STAGE_CURSOR_HEADER, 0))
+        start = index
+        handlers = self.handlers
+        while index < len(stages):
+            stage = stages[index]
+            handler = handlers.get(stage.destination)
+            if handler is None:
+                break
+            outputs = handler(stage, message)
+            if outputs is not None:
+                stage.outputs = outputs
+            index += 1
+
+        if index != start:
+            custom_headers[STAGE_CURSOR_HEADER] = index
+            message.mark_dirty()
+
+        if index < len(stages):
+            destination = stages[index].destination
+            logger.debug("Ran stages %s-%s locally, forwarding to %s", start, index, destination)
+            self._producer(destination).produce(message)
+        elif self.on_complete is not None:
+            self.on_complete(message)
+        return message
+
+    def close(self):
+        """
+        Flush and close every producer the executor created or was given.
+        """
+        with self._lock:
+            producers, self.producers = list(self.producers.values()), {}
+        for producer in producers:
+            close = getattr(producer, "close", None)
+            if close is not None:
+                close()
@@ -0,0 +1,2 @@
+from .delay_scheduler import DelayScheduler
+from .retrying_consumer import RetryingConsumer
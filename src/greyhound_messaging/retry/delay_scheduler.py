@@ -0,0 +1,80 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class DelayScheduler:
+    """
+    Runs callbacks after a delay on a single background thread.
+
+    Pending callbacks are kept in a heap ordered by due time, so scheduling
+    costs O(log n) and the thread only wakes when the earliest callback is
+    due, however many are pending. Callbacks run one at a time on the
+    scheduler thread and must not block for long.
+    """
+
+    def __init__(self, name: str = "greyhound-delay-scheduler"):
+        """
+        Initialize the scheduler and start its thread.
+
+        :param name: Name of the scheduler thread.
+        """
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, delay: float, callback: Callable, *args):
+        """
+        Run ``callback(*args)`` once ``delay`` seconds have passed.
+        """
+        due = time.monotonic() + max(0.0, delay)
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot schedule on a closed DelayScheduler")
+            entry = (due, next(self._sequence), callback, args)
+            heapq.heappush(self._heap, entry)
+            # Only a new earliest entry changes when the thread has to wake up.
+            if self._heap[0] is entry:
+                self._condition.notify()
+
+    def _run(self):
+        heap = self._heap
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if heap:
+                        remaining = heap[0][0] - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                _, _, callback, args = heapq.heappop(heap)
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("Scheduled callback %s failed", callback)
+
+    def close(self) -> list[tuple[Callable, tuple]]:
+        """
+        Stop the scheduler and return the callbacks that had not run yet, earliest first.
+        """
+        with self._condition:
+            self._closed = True
+            pending, self._heap[:] = sorted(self._heap), []
+            self._condition.notify()
+        self._thread.join()
+        return [(callback, args) for _, _, callback, args in pending]
@@ -0,0 +1,282 @@
+import asyncio
+import inspect
+import logging
+import random
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable
+
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.model.lazy_message import LazyGreyhoundMessage
+from greyhound_messaging.retry.delay_scheduler import DelayScheduler
+from greyhound_messaging.serialization.message_codecs import MessageDecodeError
+
+if TYPE_CHECKING:
+    # The adapter factory wraps consumers in RetryingConsumer, so the adapters package imports this module.
+    from greyhound_messaging.adapters._abstracts.core_messaging import ProducerMessageAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class RetryingConsumer(GreyhoundConsumer):
+    """
+    Consumer wrapper that retries failed messages with exponential backoff and jitter.
+
+    When the wrapped consumer raises, the message's ``metadata.retry_count``
+    is incremented, ``metadata.error_message`` is set, and the message is
+    scheduled for redelivery on a DelayScheduler, so the consumer thread (and
+    with it the queue or partition) moves on immediately. Redelivery hands the
+    message to ``resubmit``, which the adapter factory binds to the consumer
+    adapter so the wrapped consumer runs again on the adapter's own thread or
+    dispatcher lane, or produces the message to the ``requeue`` producer when
+    one is given so pending retries survive a restart. Once ``max_retries`` is
+    exhausted the message is produced to the ``dead_letter`` producer, or
+    logged and dropped when there is none.
+
+    The first failed attempt returns a Future resolved once the message's
+    retries are over: when a retry succeeds, or the message was produced to
+    ``requeue`` or ``dead_letter``. The adapters hold the delivery's ack, or
+    its Kafka offset, until then, and the future fails when the retries are
+    abandoned on close so the broker redelivers the message.
+
+    When the wrapped consumer is an AsyncGreyhoundConsumer a coroutine is
+    returned that catches the handler's failure once it has been awaited, and
+    the message is redelivered as a task on the event loop it failed on; the
+    coroutine of the first attempt completes once the retries are over.
+    """
+
+    def __init__(
+            self,
+            consumer: GreyhoundConsumer,
+            max_retries: int = 5,
+            base_delay: float = 0.5,
+            max_delay: float = 60.0,
+            multiplier: float = 2.0,
+            jitter: float = 1.0,
+            dead_letter: "ProducerMessageAdapter | None" = None,
+            requeue: "ProducerMessageAdapter | None" = None,
+            scheduler: DelayScheduler | None = None
+            ):
+        """
+        Initialize the wrapper.
+
+        :param consumer: The GreyhoundConsumer whose failures are retried.
+        :param max_retries: Number of redeliveries before a message is dead-lettered.
+        :param base_delay: Seconds before the first retry.
+        :param max_delay: Upper bound in seconds on any single retry delay.
+        :param multiplier: Factor the delay grows by with every retry.
+        :param jitter: Fraction of each delay that is randomised, from 0 (none) to 1 (full jitter).
+        :param dead_letter: Producer receiving messages whose retries are exhausted.
+        :param requeue: Producer redelivering retries through the broker instead of in process.
+        :param scheduler: The scheduler holding pending retries; a new one is started by default.
+        """
+        super().__init__()
+        self.consumer = consumer
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.dead_letter = dead_letter
+        self.requeue = requeue
+        self.scheduler = scheduler or DelayScheduler(name="greyhound-retry")
+        # Hands a retried message back to the consumer adapter; handled on the scheduler thread when None.
+        self.resubmit: Callable[[GreyhoundMessageRoot], None] | None = None
+        # Redeliveries running on an event loop, kept so they are not garbage collected mid-flight.
+        self._tasks = set()
+        # Futures of first attempts, keyed by the id of the message being redelivered.
+        self._outcomes: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        # The scheduler thread and dispatcher workers share the producers, which need not be thread-safe.
+        self._produce_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, consumer: GreyhoundConsumer, config: dict | None):
+        """
+        Create a RetryingConsumer from the ``retry`` section of a consumer configuration.
+
+        ``dead_letter`` and ``requeue`` are producer sections, e.g.
+        ``{"backend": "RABBITMQ", "queue": "orders.dlq"}``.
+
+        :param consumer: The GreyhoundConsumer instance to wrap.
+        :param config: Retry configuration, or None when retries are not configured.
+        :return: An instance of RetryingConsumer, or None to leave the consumer unwrapped.
+        """
+        if not config:
+            return None
+
+        from greyhound_messaging.adapters.adapter_factory import adapter_factory_producer
+
+        def producer(section: dict | None) -> "ProducerMessageAdapter | None":
+            return adapter_factory_producer({"producer": section}) if section else None
+
+        return cls(
+            consumer,
+            max_retries=config.get("max_retries", 5),
+            base_delay=config.get("base_delay", 0.5),
+            max_delay=config.get("max_delay", 60.0),
+            multiplier=config.get("multiplier", 2.0),
+            jitter=config.get("jitter", 1.0),
+            dead_letter=producer(config.get("dead_letter")),
+            requeue=producer(config.get("requeue"))
+        )
+
+    def delay(self, retry_count: int) -> float:
+        """
+        Seconds to wait before redelivering a message that has already been retried ``retry_count`` times.
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry_count)
+        return delay * (1.0 - self.jitter * random.random())
+
+    def message_received(self, message: GreyhoundMessageRoot):
+        outcome = self._take_outcome(message)
+        try:
+            result = self.consumer.message_received(message)
+        except MessageDecodeError as e:
+            # Retrying cannot fix the body; the adapter rejects the message.
+            if outcome is not None:
+                outcome.set_exception(e)
+            raise
+        except Exception as e:
+            return self._failed(message, e, outcome)
+        if inspect.isawaitable(result):
+            return self._await_handler(result, message, outcome)
+        if outcome is not None:
+            outcome.set_result(result)
+        return result
+
+    async def _await_handler(self, result, message: GreyhoundMessageRoot, outcome: Future | None):
+        try:
+            result = await result
+        except MessageDecodeError as e:
+            if outcome is not None:
+                outcome.set_exception(e)
+            raise
+        except Exception as e:
+            pending = self._failed(message, e, outcome, loop=asyncio.get_running_loop())
+            # The first attempt holds on to its delivery until the retries are over.
+            return message if pending is None else await asyncio.wrap_future(pending)
+        if outcome is not None:
+            outcome.set_result(result)
+        return result
+
+    def _take_outcome(self, message: GreyhoundMessageRoot) -> Future | None:
+        if not self._outcomes:
+            return None
+        with self._lock:
+            return self._outcomes.pop(id(message), None)
+
+    def _failed(
+            self,
+            message: GreyhoundMessageRoot,
+            error: Exception,
+            outcome: Future | None = None,
+            loop: asyncio.AbstractEventLoop | None = None
+            ) -> Future | None:
+        """
+        Schedule a failed message for redelivery, or dead-letter it once its retries are exhausted.
+
+        :param outcome: The future of the message's first attempt when this was a retry.
+        :return: A new future resolved once the message's retries are over, or None for a retry.
+        """
+        first = outcome is None
+        if first:
+            outcome = Future()
+            outcome.set_running_or_notify_cancel()
+        if isinstance(message, LazyGreyhoundMessage):
+            message = message.message
+        metadata = message.metadata
+        retry_count = metadata.retry_count or 0
+        metadata.error_message = f"{type(error).__name__}: {error}"
+        if retry_count >= self.max_retries:
+            message.mark_dirty()
+            self._settle(outcome, self._dead_letter, message)
+            return outcome if first else None
+        metadata.retry_count = retry_count + 1
+        message.mark_dirty()
+        delay = self.delay(retry_count)
+        logger.warning(
+            "Handler failed for message %s (attempt %s of %s), retrying in %.3fs: %s",
+            metadata.message_id, retry_count + 1, self.max_retries + 1, delay, metadata.error_message
+        )
+        self.scheduler.schedule(delay, self._redeliver, message, outcome, loop)
+        return outcome if first else None
+
+    def _settle(self, outcome: Future, produce: Callable, message: GreyhoundMessageRoot):
+        """
+        Resolve ``outcome`` once ``produce(message)`` has handed the message to a producer.
+        """
+        try:
+            produce(message)
+        except Exception as e:
+            logger.exception("Failed to hand over message %s", message.metadata.message_id)
+            outcome.set_exception(e)
+        else:
+            outcome.set_result(message)
+
+    def _redeliver(self, message: GreyhoundMessageRoot, outcome: Future, loop: asyncio.AbstractEventLoop | None = None):
+        if self.requeue is not None:
+            self._settle(outcome, self._produce_requeue, message)
+            return
+        with self._lock:
+            self._outcomes[id(message)] = outcome
+        try:
+            if loop is not None:
+                loop.call_soon_threadsafe(self._redeliver_on_loop, message)
+            elif self.resubmit is not None:
+                self.resubmit(message)
+            else:
+                self.message_received(message)
+        except Exception as e:
+            if self._take_outcome(message) is not None:
+                logger.error("Could not redeliver message %s: %s", message.metadata.message_id, e)
+                outcome.set_exception(e)
+
+    def _redeliver_on_loop(self, message: GreyhoundMessageRoot):
+        result = self.message_received(message)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _produce_requeue(self, message: GreyhoundMessageRoot):
+        with self._produce_lock:
+            self.requeue.produce(message)
+
+    def _dead_letter(self, message: GreyhoundMessageRoot):
+        if self.dead_letter is None:
+            logger.error("Dropping message %s after %s retries: %s", message.metadata.message_id, self.max_retries, message.metadata.error_message)
+            return
+        with self._produce_lock:
+            self.dead_letter.produce(message)
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of retries waiting for their delay to pass.
+        """
+        return len(self.scheduler)
+
+    def close(self):
+        """
+        Stop the scheduler, then close the wrapped consumer and the producers.
+
+        Pending retries are produced to ``requeue`` when it is set. Otherwise
+        they are abandoned and their first attempts fail, so the adapter
+        leaves them to the broker to redeliver.
+        """
+        pending = self.scheduler.close()
+        for _, (message, outcome, _loop) in pending:
+            if self.requeue is not None:
+                self._settle(outcome, self._produce_requeue, message)
+            elif not outcome.done():
+                outcome.set_exception(RuntimeError("Retry abandoned on close"))
+        if pending and self.requeue is None:
+            logger.warning("Abandoning %s pending retries on close, they are redelivered by the broker", len(pending))
+        for producer in (self.requeue, self.dead_letter):
+            for name in ("flush_all", "close"):
+                method = getattr(producer, name, None)
+                if method is not None:
+                    method()
+        self.consumer.close()
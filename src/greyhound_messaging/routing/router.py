@@ -0,0 +1,165 @@
+import importlib
+import logging
+import threading
+from typing import Callable
+
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[GreyhoundMessageRoot], GreyhoundMessageRoot | None]
+
+
+class _RouteNode:
+
+    __slots__ = ("children", "star", "hash", "handlers")
+
+    def __init__(self):
+        self.children = {}
+        self.star = None
+        self.hash = None
+        self.handlers = []
+
+
+def _load(path: str):
+    """
+    Import ``package.module:attribute``.
+    """
+    module_name, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Handler path must look like 'package.module:function': {path}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class GreyhoundRouter(GreyhoundConsumer):
+    """
+    Consumer that dispatches every message to the handlers registered for its ``event_type``.
+
+    Patterns are dot-separated words where ``*`` matches exactly one word and
+    ``#`` matches zero or more words, as with AMQP topic bindings; for example
+    ``orders.*`` or ``orders.#.created``. Patterns are compiled into a trie,
+    and the handlers resolved for each event type are cached, so routing
+    cost does not grow with the number of routes.
+
+    Every matching handler runs, in registration order, and the router
+    returns the last handler's result. Messages matching no route go to the
+    fallback, or are logged and dropped when there is none.
+    """
+
+    def __init__(self, fallback: Handler | None = None, cache_size: int = 4096):
+        """
+        Initialize an empty router.
+
+        :param fallback: Handler for messages whose event type matches no route.
+        :param cache_size: Maximum number of distinct event types whose resolved handlers are cached.
+        """
+        super().__init__()
+        self.fallback = fallback
+        self.cache_size = cache_size
+        self._root = _RouteNode()
+        self._routes = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict | None):
+        """
+        Create a GreyhoundRouter from a ``routing`` configuration section.
+
+        Handlers are given as import paths::
+
+            routing:
+              routes:
+                "orders.*": my_service.handlers:on_order
+                "orders.#.created": my_service.handlers:on_created
+              fallback: my_service.handlers:on_unknown
+
+        :param config: Routing configuration.
+        :return: An instance of GreyhoundRouter.
+        """
+        config = config or {}
+        fallback = config.get("fallback")
+        router = cls(fallback=_load(fallback) if fallback else None, cache_size=config.get("cache_size", 4096))
+        for pattern, handler in (config.get("routes") or {}).items():
+            router.add_route(pattern, _load(handler) if isinstance(handler, str) else handler)
+        return router
+
+    def add_route(self, pattern: str, handler: Handler):
+        """
+        Register a handler for every event type matching ``pattern``.
+        """
+        words = pattern.split(".")
+        if not pattern or any(word == "" for word in words):
+            raise ValueError(f"Invalid route pattern: {pattern!r}")
+
+        with self._lock:
+            node = self._root
+            for word in words:
+                if word == "*":
+                    node.star = node.star or _RouteNode()
+                    node = node.star
+                elif word == "#":
+                    node.hash = node.hash or _RouteNode()
+                    node = node.hash
+                else:
+                    node = node.children.setdefault(word, _RouteNode())
+            node.handlers.append((self._routes, handler))
+            self._routes += 1
+            self._cache = {}
+
+    def route(self, pattern: str) -> Callable[[Handler], Handler]:
+        """
+        Decorator registering the decorated function for ``pattern``.
+        """
+        def register(handler: Handler) -> Handler:
+            self.add_route(pattern, handler)
+            return handler
+        return register
+
+    def handlers_for(self, event_type: str) -> tuple:
+        """
+        Resolve the handlers for an event type, in registration order.
+        """
+        handlers = self._cache.get(event_type)
+        if handlers is not None:
+            return handlers
+
+        matches = {}
+        words = event_type.split(".")
+        self._match(self._root, words, 0, matches)
+        handlers = tuple(matches[order] for order in sorted(matches))
+        cache = self._cache
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[event_type] = handlers
+        return handlers
+
+    def _match(self, node: _RouteNode, words: list, index: int, matches: dict):
+        if node.hash is not None:
+            # '#' consumes any number of the remaining words, including none.
+            for end in range(index, len(words) + 1):
+                self._match(node.hash, words, end, matches)
+        if index == len(words):
+            matches.update(node.handlers)
+            return
+        child = node.children.get(words[index])
+        if child is not None:
+            self._match(child, words, index + 1, matches)
+        if node.star is not None:
+            self._match(node.star, words, index + 1, matches)
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        handlers = self.handlers_for(message.event_type)
+        if not handlers:
+            if self.fallback is None:
+                logger.warning("No route for event type %s", message.event_type)
+                return message
+            handlers = (self.fallback,)
+
+        result = message
+        for handler in handlers:
+            returned = handler(message)
+            if returned is not None:
+                result = returned
+        return result
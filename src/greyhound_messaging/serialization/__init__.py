@@ -0,0 +1,22 @@
+from .message_codecs import (
+    MessageCodec,
+    MessageDecodeError,
+    JsonCodec,
+    OrjsonCodec,
+    MsgpackCodec,
+    codecs,
+    register_codec,
+    get_codec,
+    codec_for_content_type,
+)
+from .compressors import (
+    Compressor,
+    ZlibCompressor,
+    Lz4Compressor,
+    ZstdCompressor,
+    compressors,
+    register_compressor,
+    get_compressor,
+    compressor_for_encoding,
+)
+from .message_serializer import MessageSerializer, DECODE_ERRORS, CONTENT_TYPE_HEADER, CONTENT_ENCODING_HEADER
@@ -0,0 +1,148 @@
+import zlib
+from abc import ABC, abstractmethod
+
+from greyhound_messaging.serialization.message_codecs import MessageDecodeError
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class Compressor(ABC):
+    """
+    Abstract base class for body compressors.
+    A compressor shrinks an encoded message body and is named by the ``content-encoding`` header.
+    """
+
+    name: str
+
+    @abstractmethod
+    def compress(self, body: bytes) -> bytes:
+        """
+        Compress an encoded message body.
+
+        :param body: The encoded message body.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def decompress(self, body: bytes) -> bytes:
+        """
+        Restore an encoded message body.
+
+        :param body: The compressed message body.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class ZlibCompressor(Compressor):
+    """
+    zlib compressor, always available.
+    """
+
+    name = "zlib"
+
+    def __init__(self, level: int = 1):
+        """
+        :param level: Compression level from 1 (fastest) to 9 (smallest).
+        """
+        self.level = level
+
+    def compress(self, body: bytes) -> bytes:
+        return zlib.compress(body, self.level)
+
+    def decompress(self, body: bytes) -> bytes:
+        try:
+            return zlib.decompress(body)
+        except zlib.error as e:
+            raise MessageDecodeError(str(e)) from e
+
+
+class Lz4Compressor(Compressor):
+    """
+    LZ4 frame compressor, several times faster than zlib at a lower ratio.
+    """
+
+    name = "lz4"
+
+    def compress(self, body: bytes) -> bytes:
+        return lz4_frame.compress(body)
+
+    def decompress(self, body: bytes) -> bytes:
+        try:
+            return lz4_frame.decompress(body)
+        except RuntimeError as e:
+            raise MessageDecodeError(str(e)) from e
+
+
+class ZstdCompressor(Compressor):
+    """
+    Zstandard compressor, faster than zlib at a better ratio.
+    """
+
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        """
+        :param level: Compression level, higher is smaller and slower.
+        """
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, body: bytes) -> bytes:
+        return self._compressor.compress(body)
+
+    def decompress(self, body: bytes) -> bytes:
+        try:
+            return self._decompressor.decompress(body)
+        except zstandard.ZstdError as e:
+            raise MessageDecodeError(str(e)) from e
+
+
+compressors: dict[str, Compressor] = {"zlib": ZlibCompressor()}
+if zstandard is not None:
+    compressors["zstd"] = ZstdCompressor()
+if lz4_frame is not None:
+    compressors["lz4"] = Lz4Compressor()
+
+# Preference order for ``auto``: the fastest installed compressor wins.
+AUTO_PREFERENCE = ("lz4", "zstd", "zlib")
+
+
+def register_compressor(compressor: Compressor):
+    """
+    Register a compressor so it can be selected by name and honoured by consumers.
+    """
+    compressors[compressor.name] = compressor
+
+
+def get_compressor(name: str | None) -> Compressor | None:
+    """
+    Look up a compressor by its configured name.
+
+    ``auto`` picks the fastest installed compressor; None disables compression.
+    """
+    if name is None:
+        return None
+    if name == "auto":
+        return next(compressors[candidate] for candidate in AUTO_PREFERENCE if candidate in compressors)
+    compressor = compressors.get(name)
+    if compressor is None:
+        raise ValueError(f"Unknown compressor: {name}")
+    return compressor
+
+
+def compressor_for_encoding(content_encoding: str) -> Compressor:
+    """
+    Pick the compressor able to restore a body with the given content encoding.
+    """
+    compressor = compressors.get(content_encoding)
+    if compressor is None:
+        raise MessageDecodeError(f"No compressor registered for content encoding: {content_encoding}")
+    return compressor
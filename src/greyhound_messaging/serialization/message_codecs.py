@@ -0,0 +1,158 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+class MessageDecodeError(ValueError):
+    """
+    Raised when a message body cannot be decoded by a codec.
+    """
+
+
+class MessageCodec(ABC):
+    """
+    Abstract base class for message codecs.
+    A codec turns a GreyhoundMessageRoot into bytes on the wire and back again.
+    """
+
+    name: str
+    content_type: str
+    # Whether decode accepts any buffer, such as a memoryview, and not only bytes.
+    buffer_decode: bool = False
+
+    @abstractmethod
+    def encode(self, message: BaseModel) -> bytes:
+        """
+        Encode a message into its wire representation.
+
+        :param message: The message to be encoded.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def decode(self, body: bytes, model: type[BaseModel] = GreyhoundMessageRoot) -> BaseModel:
+        """
+        Decode and validate a wire representation.
+
+        :param body: The raw message body.
+        :param model: The pydantic model to validate into.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class JsonCodec(MessageCodec):
+    """
+    JSON codec that validates straight from bytes with pydantic-core, without an intermediate dict.
+    """
+
+    name = "json"
+    content_type = "application/json"
+
+    def encode(self, message: BaseModel) -> bytes:
+        return message.__pydantic_serializer__.to_json(message)
+
+    def decode(self, body: bytes, model: type[BaseModel] = GreyhoundMessageRoot) -> BaseModel:
+        return model.model_validate_json(body)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec that parses with orjson before validating, for payloads where it is faster.
+    """
+
+    name = "orjson"
+    buffer_decode = True
+
+    def decode(self, body: bytes, model: type[BaseModel] = GreyhoundMessageRoot) -> BaseModel:
+        try:
+            raw = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise MessageDecodeError(str(e)) from e
+        return model.model_validate(raw)
+
+
+class MsgpackCodec(MessageCodec):
+    """
+    MessagePack codec producing smaller bodies than JSON.
+    """
+
+    name = "msgpack"
+    content_type = "application/msgpack"
+    buffer_decode = True
+
+    def encode(self, message: BaseModel) -> bytes:
+        return msgpack.packb(message.model_dump(mode="json"))
+
+    def decode(self, body: bytes, model: type[BaseModel] = GreyhoundMessageRoot) -> BaseModel:
+        try:
+            raw = msgpack.unpackb(body)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise MessageDecodeError(str(e)) from e
+        return model.model_validate(raw)
+
+
+codecs: dict[str, MessageCodec] = {"json": JsonCodec()}
+if orjson is not None:
+    codecs["orjson"] = OrjsonCodec()
+if msgpack is not None:
+    codecs["msgpack"] = MsgpackCodec()
+
+DEFAULT_CODEC = codecs["json"]
+
+# Codecs shipped with the package whose library is not installed, by name and by content type.
+_MISSING_CODECS = {name: content_type for name, content_type in (
+    ("orjson", "application/json"), ("msgpack", "application/msgpack")
+) if name not in codecs}
+_CODECS_EXTRA = "pip install greyhound-messaging[codecs]"
+
+
+def register_codec(codec: MessageCodec):
+    """
+    Register a codec so it can be selected by name and negotiated by content type.
+    """
+    codecs[codec.name] = codec
+
+
+def get_codec(name: str | None) -> MessageCodec:
+    """
+    Look up a codec by its configured name, defaulting to JSON.
+    """
+    if name is None:
+        return DEFAULT_CODEC
+    codec = codecs.get(name)
+    if codec is None:
+        if name in _MISSING_CODECS:
+            raise ValueError(f"The {name} codec requires the {name} package: {_CODECS_EXTRA}")
+        raise ValueError(f"Unknown codec: {name}")
+    return codec
+
+
+def codec_for_content_type(content_type: str | None, preferred: MessageCodec = DEFAULT_CODEC) -> MessageCodec:
+    """
+    Pick the codec able to decode a body with the given content type.
+
+    Bodies without a content type come from producers that predate codec
+    negotiation and are always JSON.
+    """
+    if content_type is None or content_type == preferred.content_type:
+        return preferred
+    if content_type == DEFAULT_CODEC.content_type:
+        return DEFAULT_CODEC
+    for codec in codecs.values():
+        if codec.content_type == content_type:
+            return codec
+    for name, missing_content_type in _MISSING_CODECS.items():
+        if missing_content_type == content_type:
+            raise MessageDecodeError(f"No codec registered for content type: {content_type}, the {name} codec requires the {name} package: {_CODECS_EXTRA}")
+    raise MessageDecodeError(f"No codec registered for content type: {content_type}")
@@ -0,0 +1,150 @@
+from functools import partial
+from typing import TYPE_CHECKING, Mapping
+
+from pydantic import ValidationError
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.model.lazy_message import GreyhoundMessageEnvelope, LazyGreyhoundMessage
+from greyhound_messaging.serialization.compressors import Compressor, compressor_for_encoding, get_compressor
+from greyhound_messaging.serialization.message_codecs import DEFAULT_CODEC, MessageCodec, MessageDecodeError, codec_for_content_type, get_codec
+
+if TYPE_CHECKING:
+    # The claim check decodes blobs with the codecs of this package.
+    from greyhound_messaging.claim_check import ClaimCheck
+
+CONTENT_TYPE_HEADER = "content-type"
+CONTENT_ENCODING_HEADER = "content-encoding"
+
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# Exceptions an adapter should treat as an undecodable message rather than a failure.
+DECODE_ERRORS = (MessageDecodeError, ValidationError)
+
+
+class MessageSerializer:
+    """
+    Converts messages to and from their wire representation for an adapter.
+
+    The codec used to encode is fixed by configuration, while the codec used to
+    decode is negotiated from the ``content-type`` header of each message so
+    producers and consumers on different versions keep interoperating.
+
+    In lazy mode only the envelope is validated on decode and consumers receive
+    a LazyGreyhoundMessage. A lazy message that was never fully decoded is
+    encoded as its original body.
+
+    Decoded messages keep a reference to the body they came from. In
+    passthrough mode a message that has not been modified since it was decoded
+    is encoded as that original body instead of being serialized again.
+
+    With a compressor, encoded bodies of at least ``compression_threshold``
+    bytes are compressed and labelled with a ``content-encoding`` header.
+    Bodies carrying that header are always decompressed, whether or not
+    compression is enabled on the decoding side.
+
+    With a ClaimCheck, the payload of a body of at least its threshold is
+    offloaded to a blob store before compression, and claim-checked payloads
+    are read back when the full message is decoded.
+    """
+
+    def __init__(
+            self,
+            codec: MessageCodec = DEFAULT_CODEC,
+            lazy: bool = False,
+            passthrough: bool = False,
+            compressor: Compressor | None = None,
+            compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+            claim_check: "ClaimCheck | None" = None
+            ):
+        """
+        Initialize the serializer.
+
+        :param codec: The codec used to encode outgoing messages.
+        :param lazy: Decode messages lazily, validating only their envelope up front.
+        :param passthrough: Encode unmodified decoded messages as their original body.
+        :param compressor: Compresses large outgoing bodies, None to send every body uncompressed.
+        :param compression_threshold: Smallest body size in bytes that is compressed.
+        :param claim_check: Offloads oversized payloads to a blob store, None to always send payloads inline.
+        """
+        self.codec = codec
+        self.lazy = lazy
+        self.passthrough = passthrough
+        self.compressor = compressor
+        self.compression_threshold = compression_threshold
+        self.claim_check = claim_check
+        self._headers = {CONTENT_TYPE_HEADER: codec.content_type}
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Create a MessageSerializer from an adapter configuration.
+
+        :param config: Configuration dictionary optionally naming a ``codec`` and ``compression``, enabling ``lazy`` or ``passthrough``, and configuring a ``claim_check``.
+        :return: An instance of MessageSerializer.
+        """
+        from greyhound_messaging.claim_check import ClaimCheck
+
+        return cls(
+            get_codec(config.get("codec")),
+            lazy=config.get("lazy", False),
+            passthrough=config.get("passthrough", False),
+            compressor=get_compressor(config.get("compression")),
+            compression_threshold=config.get("compression_threshold", DEFAULT_COMPRESSION_THRESHOLD),
+            claim_check=ClaimCheck.from_config(config.get("claim_check"))
+        )
+
+    def encode(self, message: GreyhoundMessageRoot | LazyGreyhoundMessage) -> tuple[bytes, dict]:
+        """
+        Encode a message into a body and the headers describing it.
+        """
+        body, headers = self._encode(message)
+        if self.compressor is not None and len(body) >= self.compression_threshold:
+            body = self.compressor.compress(body)
+            headers[CONTENT_ENCODING_HEADER] = self.compressor.name
+        return body, headers
+
+    def _encode(self, message: GreyhoundMessageRoot | LazyGreyhoundMessage) -> tuple[bytes, dict]:
+        claim_check = self.claim_check
+        if isinstance(message, LazyGreyhoundMessage):
+            if not message.is_materialized:
+                if claim_check is not None:
+                    claim_check.retain(message.metadata)
+                return message.raw, {CONTENT_TYPE_HEADER: message.content_type}
+            message = message.message
+        if self.passthrough:
+            raw_body = getattr(message, "raw_body", None)
+            if raw_body is not None:
+                if claim_check is not None:
+                    claim_check.retain(message.metadata)
+                return raw_body[0], {CONTENT_TYPE_HEADER: raw_body[1]}
+        body = self.codec.encode(message)
+        if claim_check is not None:
+            body = claim_check.check_in(message, self.codec, body)
+        return body, dict(self._headers)
+
+    def decode(self, body: bytes, headers: Mapping | None = None) -> GreyhoundMessageRoot | LazyGreyhoundMessage:
+        """
+        Decode a body using the codec, and decompress it with the compressor, named by its headers.
+        """
+        content_type = headers.get(CONTENT_TYPE_HEADER) if headers else None
+        content_encoding = headers.get(CONTENT_ENCODING_HEADER) if headers else None
+        if content_encoding is not None and content_encoding != "identity":
+            body = compressor_for_encoding(content_encoding).decompress(body)
+        codec = codec_for_content_type(content_type, self.codec)
+        if self.lazy:
+            envelope = codec.decode(body, GreyhoundMessageEnvelope)
+            return LazyGreyhoundMessage(body, envelope, partial(self._decode_deferred, codec), codec.content_type)
+        return self._decode_full(codec, body)
+
+    def _decode_deferred(self, codec: MessageCodec, body: bytes) -> GreyhoundMessageRoot:
+        # Runs inside the handler, where a ValidationError would pass for one raised by the handler itself.
+        try:
+            return self._decode_full(codec, body)
+        except ValidationError as e:
+            raise MessageDecodeError(str(e)) from e
+
+    def _decode_full(self, codec: MessageCodec, body: bytes) -> GreyhoundMessageRoot:
+        message = codec.decode(body)
+        if self.claim_check is not None:
+            self.claim_check.check_out(message)
+        message.attach_raw_body(body, codec.content_type)
+        return message
@@ -0,0 +1,373 @@
+import asyncio
+import json
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+from aiokafka import TopicPartition
+from greyhound_messaging.adapters.adapter_factory import adapter_factory_async_consumer, adapter_factory_async_producer
+from greyhound_messaging.adapters._implementations.kafka_async_adapters import KafkaAsyncConsumerAdapter, KafkaAsyncProducerAdapter
+from greyhound_messaging.adapters._implementations.rabbitmq_async_adapters import RabbitMQAsyncConsumerAdapter, RabbitMQAsyncProducerAdapter
+from greyhound_messaging.greyhound_consumers import AsyncGreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+
+@pytest.fixture
+def valid_message():
+    return {
+        "event_type": "test.event",
+        "is_dry_run": False,
+        "stages": [
+            {
+                "destination": "service-X",
+                "inputs": {"key": "value"},
+                "outputs": {"result": "success"},
+                "parameters": {"param1": "value1"}
+            }
+        ],
+        "payload": {"data": "test"},
+        "metadata": {
+            "correlation_id": "12345",
+            "message_id": "msg-123",
+            "timestamp": "2023-10-01T12:00:00Z",
+            "priority": 1,
+            "retry_count": 0,
+            "error_message": "",
+            "custom_headers": {"header1": "value1"}
+        }
+    }
+
+
+class RecordingAsyncConsumer(AsyncGreyhoundConsumer):
+
+    def __init__(self, expected: int):
+        super().__init__()
+        self.received = []
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    async def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        await asyncio.sleep(0)
+        self.received.append(message)
+        if len(self.received) == self.expected:
+            self.done.set()
+        return message
+
+
+class InProcessAmqpBroker:
+    """
+    Minimal stand-in for the parts of aio-pika used by the adapters.
+    """
+
+    def __init__(self):
+        self.consumers = {}
+        self.queue_arguments = {}
+        self.published = []
+        self.acked = []
+        self.nacked = []
+
+    async def connect_robust(self, **kwargs):
+        return _FakeAmqpConnection(self)
+
+
+class _FakeAmqpConnection:
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def channel(self):
+        return _FakeAmqpChannel(self.broker)
+
+    async def close(self):
+        pass
+
+
+class _FakeAmqpChannel:
+
+    def __init__(self, broker):
+        self.broker = broker
+        self.default_exchange = self
+
+    async def set_qos(self, prefetch_count):
+        self.prefetch_count = prefetch_count
+
+    async def declare_queue(self, name, arguments=None):
+        self.broker.queue_arguments[name] = arguments
+        return _FakeAmqpQueue(self.broker, name)
+
+    async def publish(self, message, routing_key):
+        self.broker.published.append(message)
+        callback = self.broker.consumers[routing_key]
+        await callback(_FakeIncomingMessage(self.broker, message.body, message.content_type, message.headers, message.content_encoding))
+
+
+class _FakeAmqpQueue:
+
+    def __init__(self, broker, name):
+        self.broker = broker
+        self.name = name
+
+    async def consume(self, callback):
+        self.broker.consumers[self.name] = callback
+        return "ctag"
+
+    async def cancel(self, consumer_tag):
+        self.broker.consumers.pop(self.name, None)
+
+
+class _FakeIncomingMessage:
+
+    def __init__(self, broker, body, content_type=None, headers=None, content_encoding=None):
+        self.broker = broker
+        self.body = body
+        self.content_type = content_type
+        self.content_encoding = content_encoding
+        self.headers = headers
+
+    async def ack(self):
+        self.broker.acked.append(self.body)
+
+    async def nack(self, requeue=True):
+        self.broker.nacked.append(self.body)
+
+
+class InProcessKafkaBroker:
+    """
+    Minimal stand-in for the parts of aiokafka used by the adapters.
+    """
+
+    def __init__(self):
+        self.topics = defaultdict(list)
+        self.commits = 0
+        self.committed = {}
+
+    def consumer(self, topic, **kwargs):
+        return _FakeKafkaConsumer(self, topic)
+
+    def producer(self, **kwargs):
+        return _FakeKafkaProducer(self)
+
+
+class _FakeRecord:
+
+    def __init__(self, value, headers, topic="", offset=0):
+        self.value = value
+        self.headers = headers
+        self.topic = topic
+        self.partition = 0
+        self.offset = offset
+
+
+class _FakeKafkaConsumer:
+
+    def __init__(self, broker, topic):
+        self.broker = broker
+        self.topic = topic
+        self.position = 0
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def getmany(self, timeout_ms, max_records):
+        await asyncio.sleep(0)
+        start = self.position
+        records = self.broker.topics[self.topic][start:start + max_records]
+        self.position += len(records)
+        if not records:
+            return {}
+        return {TopicPartition(self.topic, 0): [
+            _FakeRecord(value, headers, self.topic, start + index) for index, (value, headers) in enumerate(records)
+        ]}
+
+    def seek(self, partition, offset):
+        self.position = offset
+
+    async def commit(self, offsets=None):
+        self.broker.commits += 1
+        self.broker.committed.update(offsets or {TopicPartition(self.topic, 0): self.position})
+
+
+class _FakeKafkaProducer:
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def send(self, topic, value, headers=None):
+        self.broker.topics[topic].append((value, headers))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def flush(self):
+        pass
+
+
+@pytest.fixture
+def async_config():
+    return {
+        "producer": {"backend": "RABBITMQ", "queue": "greyhound-async"},
+        "consumer": {"backend": "RABBITMQ", "queue": "greyhound-async"}
+    }
+
+
+def test_async_factory_creates_rabbitmq_adapters(async_config):
+    # Act
+    consumer_adapter = adapter_factory_async_consumer(RecordingAsyncConsumer(1), async_config)
+    producer_adapter = adapter_factory_async_producer(async_config)
+
+    # Assert
+    assert isinstance(consumer_adapter, RabbitMQAsyncConsumerAdapter)
+    assert isinstance(producer_adapter, RabbitMQAsyncProducerAdapter)
+    assert consumer_adapter.connection_params["virtualhost"] == "/"
+
+
+def test_async_factory_raises_value_error_for_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown async consumer adapter type: SOME_UNKNOWN_BACKEND"):
+        adapter_factory_async_consumer(RecordingAsyncConsumer(1), {"consumer": {"backend": "SOME_UNKNOWN_BACKEND"}})
+
+
+def test_rabbitmq_async_round_trip_through_stand_in_broker(valid_message):
+    broker = InProcessAmqpBroker()
+    consumer = RecordingAsyncConsumer(expected=50)
+
+    async def scenario():
+        consumer_adapter = RabbitMQAsyncConsumerAdapter(consumer, "greyhound-async", {})
+        producer_adapter = RabbitMQAsyncProducerAdapter("greyhound-async", {})
+        consume_task = asyncio.create_task(consumer_adapter.consume())
+        while "greyhound-async" not in broker.consumers:
+            await asyncio.sleep(0)
+
+        message = GreyhoundMessageRoot(**valid_message)
+        for _ in range(50):
+            await producer_adapter.produce(message)
+        await asyncio.wait_for(consumer.done.wait(), timeout=1)
+
+        await consumer_adapter.close()
+        await producer_adapter.close()
+        await consume_task
+
+    with patch("greyhound_messaging.adapters._implementations.rabbitmq_async_adapters.aio_pika.connect_robust", broker.connect_robust):
+        asyncio.run(scenario())
+
+    assert len(consumer.received) == 50
+    assert len(broker.acked) == 50
+    assert broker.nacked == []
+
+
+def test_rabbitmq_async_priority_mode_declares_priority_queue_and_publishes_priority(valid_message):
+    broker = InProcessAmqpBroker()
+    consumer = RecordingAsyncConsumer(expected=1)
+
+    async def scenario():
+        consumer_adapter = RabbitMQAsyncConsumerAdapter(consumer, "greyhound-async", {}, max_priority=5)
+        producer_adapter = RabbitMQAsyncProducerAdapter("greyhound-async", {}, max_priority=5)
+        consume_task = asyncio.create_task(consumer_adapter.consume())
+        while "greyhound-async" not in broker.consumers:
+            await asyncio.sleep(0)
+
+        message = GreyhoundMessageRoot(**valid_message)
+        message.metadata.priority = 9
+        await producer_adapter.produce(message)
+        await asyncio.wait_for(consumer.done.wait(), timeout=1)
+
+        await consumer_adapter.close()
+        await producer_adapter.close()
+        await consume_task
+
+    with patch("greyhound_messaging.adapters._implementations.rabbitmq_async_adapters.aio_pika.connect_robust", broker.connect_robust):
+        asyncio.run(scenario())
+
+    assert broker.queue_arguments["greyhound-async"] == {"x-max-priority": 5}
+    assert broker.published[0].priority == 5
+
+
+def test_rabbitmq_async_consumer_nacks_invalid_message():
+    broker = InProcessAmqpBroker()
+
+    async def scenario():
+        consumer_adapter = RabbitMQAsyncConsumerAdapter(RecordingAsyncConsumer(1), "greyhound-async", {})
+        await consumer_adapter.message_received(_FakeIncomingMessage(broker, b"not-json"))
+        await consumer_adapter.close()
+
+    asyncio.run(scenario())
+
+    assert broker.nacked == [b"not-json"]
+    assert broker.acked == []
+
+
+def test_kafka_async_round_trip_through_stand_in_broker(valid_message):
+    broker = InProcessKafkaBroker()
+    consumer = RecordingAsyncConsumer(expected=25)
+
+    async def scenario():
+        producer_adapter = KafkaAsyncProducerAdapter("greyhound-async", {})
+        message = GreyhoundMessageRoot(**valid_message)
+        for _ in range(25):
+            await producer_adapter.produce(message)
+        await producer_adapter.close()
+
+        consumer_adapter = KafkaAsyncConsumerAdapter(consumer, "greyhound-async", {}, batch_size=10)
+        consume_task = asyncio.create_task(consumer_adapter.consume())
+        await asyncio.wait_for(consumer.done.wait(), timeout=1)
+        await consumer_adapter.close()
+        await consume_task
+
+    module = "greyhound_messaging.adapters._implementations.kafka_async_adapters"
+    with patch(f"{module}.AIOKafkaConsumer", broker.consumer), patch(f"{module}.AIOKafkaProducer", broker.producer):
+        asyncio.run(scenario())
+
+    assert len(consumer.received) == 25
+    assert broker.commits == 3
+
+
+class FailingOnceAsyncConsumer(RecordingAsyncConsumer):
+
+    def __init__(self, expected: int, failing_offset: int):
+        super().__init__(expected)
+        self.failing_offset = failing_offset
+        self.attempts = 0
+
+    async def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        if message.payload["offset"] == self.failing_offset:
+            self.attempts += 1
+            if self.attempts == 1:
+                raise RuntimeError("handler failed")
+        return await super().message_received(message)
+
+
+def test_kafka_async_rewinds_the_partition_of_a_failed_handler(valid_message):
+    broker = InProcessKafkaBroker()
+    consumer = FailingOnceAsyncConsumer(expected=5, failing_offset=2)
+    committed_after_failure = []
+
+    async def scenario():
+        producer_adapter = KafkaAsyncProducerAdapter("greyhound-async", {})
+        for offset in range(4):
+            await producer_adapter.produce(GreyhoundMessageRoot(**{**valid_message, "payload": {"offset": offset}}))
+        await producer_adapter.close()
+
+        consumer_adapter = KafkaAsyncConsumerAdapter(consumer, "greyhound-async", {}, batch_size=4)
+        consume_task = asyncio.create_task(consumer_adapter.consume())
+        while broker.commits == 0:
+            await asyncio.sleep(0)
+        committed_after_failure.append(dict(broker.committed))
+        await asyncio.wait_for(consumer.done.wait(), timeout=1)
+        await consumer_adapter.close()
+        await consume_task
+
+    module = "greyhound_messaging.adapters._implementations.kafka_async_adapters"
+    with patch(f"{module}.AIOKafkaConsumer", broker.consumer), patch(f"{module}.AIOKafkaProducer", broker.producer):
+        asyncio.run(scenario())
+
+    assert committed_after_failure == [{TopicPartition("greyhound-async", 0): 2}]
+    assert [message.payload["offset"] for message in consumer.received] == [0, 1, 3, 2, 3]
+    assert broker.committed == {TopicPartition("greyhound-async", 0): 4}
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from greyhound_messaging.adapters import adapter_factory_producer
+from greyhound_messaging.adapters.backend_registry import BackendRegistry, backend_registry
+from greyhound_messaging.adapters._implementations.memory_adapters import MemoryConsumerAdapter, MemoryProducerAdapter
+
+
+def test_builtin_backends_are_resolved_on_first_use():
+    # Arrange
+    registry = BackendRegistry({"MEMORY": {"producer": "greyhound_messaging.adapters._implementations.memory_adapters:MemoryProducerAdapter"}})
+
+    # Act
+    producer_cls = registry.get("MEMORY", "producer")
+
+    # Assert
+    assert producer_cls is MemoryProducerAdapter
+    assert registry.get("MEMORY", "buffered_producer") is None
+
+
+def test_unknown_backend_returns_none():
+    # Arrange
+    registry = BackendRegistry({}, group="greyhound_messaging.tests.no_such_group")
+
+    # Act & Assert
+    assert registry.get("NOPE", "consumer") is None
+
+
+def test_register_rejects_unknown_roles():
+    # Arrange
+    registry = BackendRegistry()
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown adapter roles for backend CUSTOM"):
+        registry.register("CUSTOM", {"sink": MemoryProducerAdapter})
+
+
+def test_entry_point_backends_are_loaded_once():
+    # Arrange
+    entry_point = MagicMock()
+    entry_point.name = "CUSTOM"
+    entry_point.load.return_value = {"consumer": MemoryConsumerAdapter}
+    registry = BackendRegistry()
+
+    # Act
+    with patch("greyhound_messaging.adapters.backend_registry.entry_points", return_value=[entry_point]) as discover:
+        first = registry.get("CUSTOM", "consumer")
+        registry.get("OTHER", "consumer")
+
+    # Assert
+    assert first is MemoryConsumerAdapter
+    assert registry.backends == ["CUSTOM"]
+    discover.assert_called_once_with(group="greyhound_messaging.backends")
+
+
+def test_broken_entry_point_is_skipped():
+    # Arrange
+    entry_point = MagicMock()
+    entry_point.name = "BROKEN"
+    entry_point.load.side_effect = ImportError("missing client")
+    registry = BackendRegistry()
+
+    # Act
+    with patch("greyhound_messaging.adapters.backend_registry.entry_points", return_value=[entry_point]):
+        result = registry.get("BROKEN", "consumer")
+
+    # Assert
+    assert result is None
+
+
+def test_registered_backend_is_used_by_the_factory():
+    # Arrange
+    producer = MagicMock()
+    custom_cls = MagicMock()
+    custom_cls.from_config.return_value = producer
+    backend_registry.register("TEST_CUSTOM", {"producer": custom_cls})
+
+    # Act
+    result = adapter_factory_producer({"producer": {"backend": "TEST_CUSTOM", "queue": "q"}})
+
+    # Assert
+    assert result is producer
+    custom_cls.from_config.assert_called_once_with(config={"backend": "TEST_CUSTOM", "queue": "q"})
+
+
+def test_importing_the_adapters_does_not_load_client_libraries():
+    # Arrange
+    code = (
+        "import sys\n"
+        "from greyhound_messaging.adapters import adapter_factory_producer\n"
+        "adapter_factory_producer({'producer': {'backend': 'MEMORY', 'queue': 'q'}})\n"
+        "print(','.join(m for m in ('pika', 'confluent_kafka', 'aio_pika', 'aiokafka') if m in sys.modules))\n"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={"PYTHONPATH": ":".join(sys.path)})
+
+    # Assert
+    assert result.stdout.strip() == ""
@@ -0,0 +1,105 @@
+import threading
+from unittest.mock import MagicMock
+
+import pika
+import pytest
+from greyhound_messaging.adapters._implementations.connection_pool import KafkaProducerPool, RabbitMQConnectionPool
+from greyhound_messaging.adapters._implementations.rabbitmq_adapters import RabbitMQBlockingConsumerAdapter, RabbitMQBlockingProducerAdapter
+
+
+def _params(host="localhost"):
+    return pika.ConnectionParameters(host, credentials=pika.PlainCredentials("guest", "guest"))
+
+
+def test_pool_shares_connection_per_thread_and_params():
+    # Arrange
+    pool = RabbitMQConnectionPool(connect=lambda params: MagicMock())
+    other_thread = []
+
+    # Act
+    first = pool.acquire(_params())
+    second = pool.acquire(_params())
+    other_host = pool.acquire(_params("other-host"))
+    thread = threading.Thread(target=lambda: other_thread.append(pool.acquire(_params())))
+    thread.start()
+    thread.join()
+
+    # Assert
+    assert first is second
+    assert other_host is not first
+    assert other_thread[0] is not first
+
+
+def test_pool_closes_connection_after_last_release():
+    pool = RabbitMQConnectionPool(connect=lambda params: MagicMock())
+    connection = pool.acquire(_params())
+    pool.acquire(_params())
+
+    pool.release(connection)
+    connection.close.assert_not_called()
+    pool.release(connection)
+
+    connection.close.assert_called_once()
+    assert pool.acquire(_params()) is not connection
+
+
+def test_pool_replaces_unhealthy_connection():
+    # Arrange
+    pool = RabbitMQConnectionPool(connect=lambda params: MagicMock())
+    dead = pool.acquire(_params())
+    dead.process_data_events.side_effect = pika.exceptions.StreamLostError("connection reset")
+
+    # Act
+    replacement = pool.acquire(_params())
+
+    # Assert
+    assert replacement is not dead
+
+
+def test_pooled_producers_share_one_channel():
+    # Arrange
+    pool = RabbitMQConnectionPool(connect=lambda params: MagicMock())
+
+    # Act
+    orders = RabbitMQBlockingProducerAdapter("orders", _params(), pool=pool)
+    invoices = RabbitMQBlockingProducerAdapter("invoices", _params(), pool=pool)
+
+    # Assert
+    assert orders.connection is invoices.connection
+    assert orders.channel is invoices.channel
+    orders.connection.channel.assert_called_once()
+
+
+def test_rabbitmq_adapters_use_dedicated_connections_by_default(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(pika, "BlockingConnection", MagicMock(side_effect=lambda params: MagicMock()))
+    config = {"queue": "orders"}
+
+    # Act
+    consumer = RabbitMQBlockingConsumerAdapter.from_config(MagicMock(), config)
+    producer = RabbitMQBlockingProducerAdapter.from_config(config)
+
+    # Assert
+    assert consumer.pool is None
+    assert producer.pool is None
+    assert consumer.connection is not producer.connection
+
+
+def test_rabbitmq_consumer_rejects_shared_connection_with_dispatcher():
+    # Arrange
+    config = {"queue": "orders", "share_connection": True, "dispatch": {"workers": 4}}
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        RabbitMQBlockingConsumerAdapter.from_config(MagicMock(), config)
+
+
+def test_kafka_producer_pool_shares_clients_by_configuration():
+    pool = KafkaProducerPool(create=lambda config: MagicMock())
+
+    first = pool.acquire({"bootstrap.servers": "localhost:9092", "acks": "all"})
+    second = pool.acquire({"acks": "all", "bootstrap.servers": "localhost:9092"})
+    other = pool.acquire({"bootstrap.servers": "localhost:9092", "acks": "1"})
+
+    assert first is second
+    assert other is not first
@@ -1,6 +1,9 @@
 import json
 from datetime import datetime
-from greyhound_messaging.adapters._implementations.kafka_adapters import KafkaConsumerAdapter
+import threading
+import time
+from greyhound_messaging.adapters._implementations.kafka_adapters import KafkaConsumerAdapter, KafkaProducerAdapter
+from confluent_kafka import KafkaError, KafkaException
 from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
 from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
 from unittest.mock import MagicMock, patch
@@ -58,4 +61,443 @@ def test_kafka_adapter_calls_consumer_method(valid_message):
             pass  # simulate clean exit
 
         # Assert
-        mock_consumer.message_received.assert_called_once()
\ No newline at end of file
+        mock_consumer.message_received.assert_called_once()
+
+def _mock_kafka_message(value, offset, partition=0, topic="test-topic"):
+    mock_msg = MagicMock()
+    mock_msg.value.return_value = value
+    mock_msg.error.return_value = None
+    mock_msg.topic.return_value = topic
+    mock_msg.partition.return_value = partition
+    mock_msg.offset.return_value = offset
+    return mock_msg
+
+def test_kafka_adapter_batch_mode_commits_once_per_batch(valid_message):
+    # Arrange
+    mock_consumer = MagicMock(spec=GreyhoundConsumer)
+    body = json.dumps(valid_message).encode("utf-8")
+    batch = [_mock_kafka_message(body, offset) for offset in range(3)]
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        kafka_mock_instance.consume.side_effect = [batch, [], KeyboardInterrupt]
+
+        adapter = KafkaConsumerAdapter(
+            consumer=mock_consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=10
+        )
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            adapter.consume()
+
+        # Assert
+        assert mock_consumer.message_received.call_count == 3
+        kafka_mock_instance.consume.assert_called_with(num_messages=10, timeout=1.0)
+        kafka_mock_instance.commit.assert_called_once()
+        kafka_mock_instance.commit.assert_called_once_with(asynchronous=True)
+        assert kafka_mock_instance.store_offsets.call_count == 3
+
+def test_kafka_adapter_close_commits_only_processed_offsets(valid_message):
+    # Arrange
+    mock_consumer = MagicMock(spec=GreyhoundConsumer)
+    body = json.dumps(valid_message).encode("utf-8")
+    batch = [_mock_kafka_message(body, offset) for offset in range(3)]
+    mock_consumer.message_received.side_effect = [None, KeyboardInterrupt]
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        kafka_mock_instance.consume.return_value = batch
+
+        adapter = KafkaConsumerAdapter(
+            consumer=mock_consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=3
+        )
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            adapter.consume()
+        adapter.close()
+
+        # Assert
+        kafka_mock_instance.store_offsets.assert_called_once_with(message=batch[0])
+        kafka_mock_instance.commit.assert_called_once_with(asynchronous=False)
+        kafka_mock_instance.close.assert_called_once()
+
+
+class FakeKafkaProducer:
+    """
+    Stand-in for confluent_kafka.Producer with a bounded local queue served by poll().
+    """
+
+    def __init__(self, config, capacity=100, error=None):
+        self.config = config
+        self.capacity = capacity
+        self.error = error
+        self.pending = []
+        self.delivered = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def produce(self, topic, value=None, headers=None, on_delivery=None):
+        with self._lock:
+            if len(self.pending) >= self.capacity:
+                raise BufferError("Local: Queue full")
+            self.pending.append((value, on_delivery))
+
+    def poll(self, timeout=None):
+        with self._lock:
+            pending, self.pending = self.pending, []
+        for value, on_delivery in pending:
+            msg = MagicMock(latency=MagicMock(return_value=0.001))
+            msg.value.return_value = value
+            self.delivered.append(value)
+            on_delivery(self.error, msg)
+        if not pending and timeout:
+            time.sleep(min(timeout, 0.01))
+        return len(pending)
+
+    def flush(self, timeout=None):
+        self.poll(0)
+        return 0
+
+
+def test_kafka_producer_from_config_exposes_batching_settings():
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Producer", FakeKafkaProducer):
+        producer = KafkaProducerAdapter.from_config({
+            "queue": "topic", "linger_ms": 20, "batch_size": 65536, "compression_type": "lz4", "acks": 1
+        })
+        producer.close()
+
+    assert producer.producer.config["linger.ms"] == 20
+    assert producer.producer.config["batch.size"] == 65536
+    assert producer.producer.config["compression.type"] == "lz4"
+    assert producer.producer.config["acks"] == 1
+    assert "enable.auto.commit" not in producer.producer.config
+
+
+def test_kafka_producer_serves_delivery_reports_when_queue_is_full(valid_message):
+    # Arrange
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Producer", lambda config: FakeKafkaProducer(config, capacity=2)):
+        producer = KafkaProducerAdapter("topic", {}, poll_interval=60)
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    for _ in range(5):
+        producer.produce(message)
+    producer.close()
+
+    # Assert
+    assert len(producer.producer.delivered) == 5
+    assert producer.delivery_failures == 0
+
+
+def test_kafka_producer_reports_failed_deliveries(valid_message):
+    # Arrange
+    error = KafkaError(KafkaError._MSG_TIMED_OUT)
+    failures = []
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Producer", lambda config: FakeKafkaProducer(config, error=error)):
+        producer = KafkaProducerAdapter("topic", {}, poll_interval=0.01, on_delivery_error=lambda err, msg: failures.append(err))
+
+    # Act
+    future = producer.send(GreyhoundMessageRoot(**valid_message))
+    producer.flush()
+
+    # Assert
+    with pytest.raises(KafkaException):
+        future.result(timeout=1)
+    assert failures == [error]
+    assert producer.delivery_failures == 1
+    producer.close()
+
+
+def test_kafka_adapter_dispatch_commits_only_the_low_water_mark(valid_message):
+    # Arrange
+    body = json.dumps(valid_message).encode("utf-8")
+    batch = [_mock_kafka_message(body, offset) for offset in range(3)]
+    release_first = threading.Event()
+    handled = []
+
+    class SlowFirstConsumer(GreyhoundConsumer):
+        def message_received(self, message):
+            if not handled:
+                handled.append(message)
+                release_first.wait(5)
+            else:
+                handled.append(message)
+
+    consumer = SlowFirstConsumer()
+    dispatcher = MagicMock()
+    workers = []
+
+    def submit(message, on_done):
+        from concurrent.futures import Future
+        future = Future()
+        future.add_done_callback(on_done)
+
+        def run():
+            consumer.message_received(message)
+            future.set_result(None)
+
+        worker = threading.Thread(target=run)
+        workers.append(worker)
+        worker.start()
+        return future
+
+    dispatcher.submit.side_effect = submit
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        adapter = KafkaConsumerAdapter(
+            consumer=consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=3,
+            dispatcher=dispatcher
+        )
+
+        # Act
+        adapter._process_batch(batch)
+        for worker in workers[1:]:
+            worker.join()
+        adapter._maybe_commit()
+        committed_early = kafka_mock_instance.commit.call_count
+        release_first.set()
+        workers[0].join()
+        adapter._maybe_commit()
+
+        # Assert
+        assert committed_early == 0
+        kafka_mock_instance.commit.assert_called_once()
+        offsets = kafka_mock_instance.commit.call_args.kwargs["offsets"]
+        assert [(tp.topic, tp.partition, tp.offset) for tp in offsets] == [("test-topic", 0, 3)]
+        kafka_mock_instance.store_offsets.assert_not_called()
+
+
+def test_kafka_adapter_commits_revoked_partitions_before_dropping_them(valid_message):
+    # Arrange
+    from confluent_kafka import TopicPartition
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        adapter = KafkaConsumerAdapter(
+            consumer=MagicMock(spec=GreyhoundConsumer),
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            dispatcher=MagicMock(),
+            revoke_timeout=0.01
+        )
+        for offset in range(4):
+            adapter.tracker.track(("test-topic", 0), offset)
+        for offset in (0, 1, 3):
+            adapter.tracker.complete(("test-topic", 0), offset)
+
+        # Act
+        adapter._on_revoke(kafka_mock_instance, [TopicPartition("test-topic", 0)])
+
+        # Assert
+        offsets = kafka_mock_instance.commit.call_args.kwargs["offsets"]
+        assert [(tp.topic, tp.partition, tp.offset) for tp in offsets] == [("test-topic", 0, 2)]
+        assert kafka_mock_instance.commit.call_args.kwargs["asynchronous"] is False
+        assert ("test-topic", 0) not in adapter.tracker
+
+
+def test_kafka_adapter_rewinds_the_partition_of_a_failed_message(valid_message):
+    # Arrange
+    mock_consumer = MagicMock(spec=GreyhoundConsumer)
+    body = json.dumps(valid_message).encode("utf-8")
+    batch = [_mock_kafka_message(body, offset) for offset in range(3)] + [_mock_kafka_message(body, 7, partition=1)]
+    mock_consumer.message_received.side_effect = [None, RuntimeError("boom"), None]
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        kafka_mock_instance.consume.side_effect = [batch, KeyboardInterrupt]
+        adapter = KafkaConsumerAdapter(
+            consumer=mock_consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=4
+        )
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            adapter.consume()
+
+        # Assert
+        assert mock_consumer.message_received.call_count == 3
+        seeked = kafka_mock_instance.seek.call_args.args[0]
+        assert (seeked.topic, seeked.partition, seeked.offset) == ("test-topic", 0, 1)
+        stored = [call.kwargs["message"] for call in kafka_mock_instance.store_offsets.call_args_list]
+        assert stored == [batch[0], batch[3]]
+
+
+def test_kafka_adapter_skips_lazily_decoded_message_with_invalid_payload(valid_message):
+    # Arrange
+    from greyhound_messaging.serialization import MessageSerializer
+    mock_consumer = MagicMock(spec=GreyhoundConsumer)
+    mock_consumer.message_received.side_effect = lambda message: message.payload
+    valid_message["payload"] = "should-be-dict"
+    batch = [_mock_kafka_message(json.dumps(valid_message).encode("utf-8"), 0)]
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        adapter = KafkaConsumerAdapter(
+            consumer=mock_consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            serializer=MessageSerializer(lazy=True)
+        )
+
+        # Act
+        adapter._process_batch(batch)
+
+        # Assert
+        kafka_mock_instance.seek.assert_not_called()
+        kafka_mock_instance.store_offsets.assert_called_once_with(message=batch[0])
+
+
+def test_kafka_adapter_dispatch_rewinds_to_the_earliest_failed_offset(valid_message):
+    # Arrange
+    from concurrent.futures import Future
+    body = json.dumps(valid_message).encode("utf-8")
+    failing = {1, 2}
+    dispatcher = MagicMock()
+
+    def submit(message, on_done):
+        future = Future()
+        future.add_done_callback(on_done)
+        offset = submitted.pop(0)
+        if offset in failing:
+            failing.discard(offset)
+            future.set_exception(RuntimeError(f"offset {offset} failed"))
+        else:
+            future.set_result(None)
+        return future
+
+    submitted = []
+    dispatcher.submit.side_effect = submit
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        adapter = KafkaConsumerAdapter(
+            consumer=MagicMock(spec=GreyhoundConsumer),
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=4,
+            dispatcher=dispatcher
+        )
+
+        # Act
+        submitted.extend(range(4))
+        adapter._process_batch([_mock_kafka_message(body, offset) for offset in range(4)])
+        adapter._rewind_failures()
+        adapter._maybe_commit()
+        first_commit = kafka_mock_instance.commit.call_args.kwargs["offsets"]
+        submitted.extend(range(1, 4))
+        adapter._process_batch([_mock_kafka_message(body, offset) for offset in range(1, 4)])
+        adapter._rewind_failures()
+        adapter._maybe_commit()
+
+        # Assert
+        seeked = kafka_mock_instance.seek.call_args.args[0]
+        assert kafka_mock_instance.seek.call_count == 1
+        assert (seeked.topic, seeked.partition, seeked.offset) == ("test-topic", 0, 1)
+        assert [tp.offset for tp in first_commit] == [1]
+        assert [tp.offset for tp in kafka_mock_instance.commit.call_args.kwargs["offsets"]] == [4]
+        assert adapter.tracker.in_flight == 0
+
+
+class HeldKafkaProducer(FakeKafkaProducer):
+    """
+    FakeKafkaProducer that serves no delivery reports until released.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.released = threading.Event()
+
+    def poll(self, timeout=None):
+        if not self.released.is_set():
+            time.sleep(0.01)
+            return 0
+        return super().poll(timeout)
+
+
+def test_kafka_producer_backlog_counts_undelivered_messages_and_bytes(valid_message):
+    # Arrange
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Producer", HeldKafkaProducer):
+        producer = KafkaProducerAdapter("topic", {}, poll_interval=0.01)
+    message = GreyhoundMessageRoot(**valid_message)
+    body, _ = producer.serializer.encode(message)
+
+    # Act
+    producer.produce(message)
+    producer.produce(message)
+    backlog = producer.backlog
+    producer.producer.released.set()
+    producer.close()
+
+    # Assert
+    assert backlog == (2, 2 * len(body))
+    assert producer.backlog == (0, 0)
+
+
+class _FailingOnceConsumer(GreyhoundConsumer):
+
+    def __init__(self):
+        super().__init__()
+        self.attempts = 0
+        self.retried = threading.Event()
+
+    def message_received(self, message):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise RuntimeError("boom")
+        if message.metadata.retry_count:
+            self.retried.set()
+        return message
+
+
+def _committed_offsets(kafka_mock_instance):
+    return [
+        [(tp.partition, tp.offset) for tp in call.kwargs["offsets"]]
+        for call in kafka_mock_instance.commit.call_args_list
+    ]
+
+
+@pytest.mark.parametrize("base_delay, committed", [(0.01, [[(0, 2)]]), (60, [])])
+def test_kafka_adapter_commits_failed_offset_once_retry_is_over(valid_message, base_delay, committed):
+    # Arrange
+    from greyhound_messaging.retry import RetryingConsumer
+    flaky = _FailingOnceConsumer()
+    consumer = RetryingConsumer(flaky, base_delay=base_delay, jitter=0.0)
+    body = json.dumps(valid_message).encode("utf-8")
+    batch = [_mock_kafka_message(body, offset) for offset in range(2)]
+
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        kafka_mock_instance.consume.side_effect = [batch, KeyboardInterrupt]
+        adapter = KafkaConsumerAdapter(
+            consumer=consumer,
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            batch_size=2
+        )
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            adapter.consume()
+        committed_before_retry = _committed_offsets(kafka_mock_instance)
+        if base_delay < 1:
+            assert flaky.retried.wait(2)
+        adapter.close()
+
+        # Assert
+        assert committed_before_retry == []
+        assert _committed_offsets(kafka_mock_instance) == committed
+        kafka_mock_instance.store_offsets.assert_not_called()
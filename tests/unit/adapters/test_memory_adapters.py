@@ -0,0 +1,127 @@
+import queue
+import threading
+
+import pytest
+from greyhound_messaging.adapters.adapter_factory import adapter_factory_consumer, adapter_factory_producer
+from greyhound_messaging.adapters._implementations.memory_adapters import MemoryConsumerAdapter, MemoryProducerAdapter, reset_queues
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics, MetricsRegistry
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+
+@pytest.fixture(autouse=True)
+def fresh_queues():
+    reset_queues()
+    yield
+    reset_queues()
+
+
+@pytest.fixture
+def config_fixture():
+    return {
+        "producer": {"backend": "MEMORY", "queue": "memory-queue"},
+        "consumer": {"backend": "MEMORY", "queue": "memory-queue", "poll_timeout": 0.01}
+    }
+
+
+@pytest.fixture
+def valid_message():
+    return GreyhoundMessageRoot(
+        event_type="test.event",
+        payload={"data": "test"},
+        metadata={"correlation_id": "12345", "message_id": "msg-123"}
+    )
+
+
+class CountingConsumer(GreyhoundConsumer):
+
+    def __init__(self, expected: int):
+        super().__init__()
+        self.received = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        self.received.append(message)
+        if len(self.received) == self.expected:
+            self.done.set()
+        return message
+
+
+def test_adapter_factory_creates_memory_adapters(config_fixture):
+    # Act
+    consumer_adapter = adapter_factory_consumer(CountingConsumer(1), config_fixture)
+    producer_adapter = adapter_factory_producer(config_fixture)
+
+    # Assert
+    assert isinstance(consumer_adapter, MemoryConsumerAdapter)
+    assert isinstance(producer_adapter, MemoryProducerAdapter)
+    assert consumer_adapter.queue is producer_adapter.queue
+
+
+def test_memory_round_trip_across_threads(config_fixture, valid_message):
+    # Arrange
+    consumer = CountingConsumer(expected=100)
+    consumer_adapter = adapter_factory_consumer(consumer, config_fixture)
+    producer_adapter = adapter_factory_producer(config_fixture)
+    thread = threading.Thread(target=consumer_adapter.consume)
+    thread.start()
+
+    # Act
+    for _ in range(100):
+        producer_adapter.produce(valid_message)
+    assert consumer.done.wait(timeout=5)
+    consumer_adapter.close()
+    thread.join(timeout=5)
+
+    # Assert
+    assert consumer.received[0] == valid_message
+    assert len(consumer.received) == 100
+
+
+def test_memory_consumer_drops_undecodable_messages(config_fixture):
+    # Arrange
+    consumer = CountingConsumer(expected=1)
+    consumer_adapter = adapter_factory_consumer(consumer, config_fixture)
+
+    # Act
+    consumer_adapter.message_received(b"not-json", {})
+
+    # Assert
+    assert consumer.received == []
+
+
+def test_bounded_memory_queue_applies_backpressure(valid_message):
+    # Arrange
+    producer_adapter = MemoryProducerAdapter("bounded-queue", maxsize=1, block_timeout=0.01)
+    producer_adapter.produce(valid_message)
+
+    # Act & Assert
+    with pytest.raises(queue.Full):
+        producer_adapter.produce(valid_message)
+
+
+def test_memory_adapters_record_metrics(valid_message):
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    consumer_metrics = AdapterMetrics(registry, "MEMORY", "consumer", "memory-queue")
+    producer_metrics = AdapterMetrics(registry, "MEMORY", "producer", "memory-queue")
+    consumer_adapter = MemoryConsumerAdapter(CountingConsumer(2), "memory-queue", metrics=consumer_metrics)
+    producer_adapter = MemoryProducerAdapter("memory-queue", metrics=producer_metrics)
+
+    # Act
+    producer_adapter.produce(valid_message)
+    producer_adapter.produce(valid_message)
+    buffered = consumer_metrics.buffer_depth.value
+    consumer_adapter.message_received(*consumer_adapter.queue.get())
+    consumer_adapter.message_received(b"not-json", {})
+
+    # Assert
+    assert buffered == 2
+    assert producer_metrics.produced.value == 2
+    assert producer_metrics.produce_seconds.count == 2
+    assert consumer_metrics.consumed.value == 2
+    assert consumer_metrics.decode_errors.value == 1
+    assert consumer_metrics.handler_seconds.count == 1
+    assert consumer_metrics.in_flight.value == 0
+    assert 'greyhound_messages_consumed_total{backend="MEMORY",role="consumer",queue="memory-queue"} 2' in registry.render()
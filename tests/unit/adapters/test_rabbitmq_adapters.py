@@ -1,12 +1,19 @@
 from unittest.mock import MagicMock
 
 import pytest
-from greyhound_messaging.adapters._implementations.rabbitmq_adapters import RabbitMQBlockingConsumerAdapter
+from greyhound_messaging.adapters._implementations.rabbitmq_adapters import PublishNackedError, RabbitMQBlockingConsumerAdapter, headers_from_properties, properties_from_headers, RabbitMQBlockingProducerAdapter, RabbitMQBufferedProducerAdapter
+from greyhound_messaging.adapters.adapter_factory import adapter_factory_producer
 import pika
 from datetime import datetime
 import json
+import threading
+import time
 
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.metrics import AdapterMetrics, MetricsRegistry
 from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.retry import RetryingConsumer
+from greyhound_messaging.serialization import MessageSerializer
 
 @pytest.fixture
 def valid_message():
@@ -80,4 +87,422 @@ def test_adapter_calls_consumer_method(valid_message):
     )
 
     # Assert
-    mock_consumer.message_received.assert_called_once()
\ No newline at end of file
+    mock_consumer.message_received.assert_called_once()
+def _adapter_with_mocked_connection(mock_consumer, **kwargs):
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    pika.BlockingConnection = MagicMock(return_value=mock_connection)
+    mock_connection.channel.return_value = mock_channel
+
+    adapter = RabbitMQBlockingConsumerAdapter(
+        consumer=mock_consumer,
+        queue_name="test-queue",
+        connection_params=pika.ConnectionParameters("localhost"),
+        **kwargs
+    )
+    return adapter, mock_channel
+
+def test_adapter_sets_prefetch_before_consuming():
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), prefetch_count=50)
+
+    # Act
+    adapter.consume()
+
+    # Assert
+    mock_channel.basic_qos.assert_called_once_with(prefetch_count=50)
+    mock_channel.start_consuming.assert_called_once()
+
+def test_adapter_batches_acks_with_multiple_flag(valid_message):
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), prefetch_count=10, ack_batch_size=2)
+    body = json.dumps(valid_message).encode("utf-8")
+
+    # Act
+    for delivery_tag in (1, 2, 3):
+        adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=delivery_tag), properties=None, body=body)
+
+    # Assert
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=2, multiple=True)
+
+    adapter.close()
+    mock_channel.basic_ack.assert_called_with(delivery_tag=3, multiple=True)
+
+def test_adapter_batches_acks_by_interval_alone(valid_message):
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), ack_batch_interval_ms=60000)
+    body = json.dumps(valid_message).encode("utf-8")
+
+    # Act
+    for delivery_tag in range(1, 51):
+        adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=delivery_tag), properties=None, body=body)
+
+    # Assert
+    mock_channel.basic_ack.assert_not_called()
+
+    adapter.close()
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=50, multiple=True)
+
+def test_adapter_flushes_interval_batch_once_prefetch_window_is_full(valid_message):
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), prefetch_count=10, ack_batch_interval_ms=60000)
+    body = json.dumps(valid_message).encode("utf-8")
+
+    # Act
+    for delivery_tag in range(1, 13):
+        adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=delivery_tag), properties=None, body=body)
+
+    # Assert
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=10, multiple=True)
+
+def test_adapter_nacks_invalid_message_while_batching(valid_message):
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), ack_batch_size=5)
+    body = json.dumps(valid_message).encode("utf-8")
+
+    # Act
+    adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=1), properties=None, body=body)
+    adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=2), properties=None, body=b"not-json")
+    adapter.flush_acks()
+
+    # Assert
+    mock_channel.basic_nack.assert_called_once_with(delivery_tag=2, requeue=False)
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=1, multiple=True)
+
+def test_adapter_rejects_lazily_decoded_message_with_invalid_payload(valid_message):
+    # Arrange
+    mock_consumer = MagicMock()
+    mock_consumer.message_received.side_effect = lambda message: message.payload
+    adapter, mock_channel = _adapter_with_mocked_connection(mock_consumer)
+    adapter.serializer = MessageSerializer(lazy=True)
+    valid_message["payload"] = "should-be-dict"
+
+    # Act
+    adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=1), properties=None, body=json.dumps(valid_message).encode("utf-8"))
+
+    # Assert
+    mock_channel.basic_nack.assert_called_once_with(delivery_tag=1, requeue=False)
+    mock_channel.basic_ack.assert_not_called()
+
+def test_adapter_rejects_ack_batch_larger_than_prefetch():
+    with pytest.raises(ValueError):
+        _adapter_with_mocked_connection(MagicMock(), prefetch_count=5, ack_batch_size=10)
+
+def test_adapter_never_batch_acks_past_an_in_flight_delivery(valid_message):
+    # Arrange
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), prefetch_count=3, ack_batch_interval_ms=1000)
+    adapter.dispatcher = MagicMock()
+    adapter.connection.add_callback_threadsafe.side_effect = lambda callback: callback()
+    body = json.dumps(valid_message).encode("utf-8")
+    for delivery_tag in (1, 2, 3):
+        adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=delivery_tag), properties=None, body=body)
+    completed = MagicMock()
+    completed.exception.return_value = None
+
+    # Act
+    adapter._on_dispatched(mock_channel, 2, completed)
+    adapter._on_dispatched(mock_channel, 3, completed)
+
+    # Assert
+    mock_channel.basic_ack.assert_not_called()
+
+    adapter._on_dispatched(mock_channel, 1, completed)
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=3, multiple=True)
+
+def test_adapter_records_ack_metrics_for_multiple_acks(valid_message):
+    # Arrange
+    metrics = AdapterMetrics(MetricsRegistry(enabled=True), "RABBITMQ", "consumer", "test-queue")
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), ack_batch_size=3, metrics=metrics)
+    body = json.dumps(valid_message).encode("utf-8")
+
+    # Act
+    for delivery_tag in (1, 2):
+        adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=delivery_tag), properties=None, body=body)
+    adapter.message_received(ch=mock_channel, method=MagicMock(delivery_tag=3), properties=None, body=b"not-json")
+    unacked = metrics.buffer_depth.value
+    adapter.flush_acks()
+
+    # Assert
+    assert unacked == 2
+    assert metrics.acked.value == 2
+    assert metrics.nacked.value == 1
+    assert metrics.ack_latency_seconds.count == 2
+    assert metrics.buffer_depth.value == 0
+
+def test_adapter_resubmits_messages_on_the_connection_thread(valid_message):
+    # Arrange
+    mock_consumer = MagicMock()
+    adapter, _ = _adapter_with_mocked_connection(mock_consumer)
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    adapter.resubmit(message)
+
+    # Assert
+    mock_consumer.message_received.assert_not_called()
+    callback = adapter.connection.add_callback_threadsafe.call_args.args[0]
+    callback()
+    mock_consumer.message_received.assert_called_once_with(message)
+
+def test_consumer_declares_priority_queue_when_max_priority_is_set():
+    # Arrange / Act
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock(), max_priority=10)
+
+    # Assert
+    mock_channel.queue_declare.assert_called_once_with("test-queue", arguments={"x-max-priority": 10})
+
+def test_consumer_declares_plain_queue_by_default():
+    # Arrange / Act
+    adapter, mock_channel = _adapter_with_mocked_connection(MagicMock())
+
+    # Assert
+    mock_channel.queue_declare.assert_called_once_with("test-queue", arguments=None)
+
+def test_producer_publishes_clamped_metadata_priority(valid_message):
+    # Arrange
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    pika.BlockingConnection = MagicMock(return_value=mock_connection)
+    mock_connection.channel.return_value = mock_channel
+    producer = RabbitMQBlockingProducerAdapter(
+        queue_name="test-queue",
+        connection_params=pika.ConnectionParameters("localhost"),
+        max_priority=5
+    )
+    urgent = GreyhoundMessageRoot(**valid_message)
+    urgent.metadata.priority = 50
+    bulk = GreyhoundMessageRoot(**valid_message)
+    bulk.metadata.priority = None
+
+    # Act
+    producer.produce(urgent)
+    producer.produce(bulk)
+
+    # Assert
+    mock_channel.queue_declare.assert_called_once_with("test-queue", arguments={"x-max-priority": 5})
+    priorities = [call.kwargs["properties"].priority for call in mock_channel.basic_publish.call_args_list]
+    assert priorities == [5, 0]
+
+def _confirming_producer(**kwargs):
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    pika.BlockingConnection = MagicMock(return_value=mock_connection)
+    mock_connection.channel.return_value = mock_channel
+    mock_channel._impl.confirm_delivery.side_effect = lambda ack_nack_callback, callback: callback(MagicMock())
+
+    producer = RabbitMQBlockingProducerAdapter(
+        queue_name="test-queue",
+        connection_params=pika.ConnectionParameters("localhost"),
+        confirm_delivery=True,
+        **kwargs
+    )
+    return producer, mock_connection, mock_channel
+
+def _confirm(producer, method):
+    producer._on_confirm(pika.frame.Method(1, method))
+
+def test_producer_pipelines_publishes_until_window_is_full(valid_message):
+    # Arrange
+    producer, mock_connection, mock_channel = _confirming_producer(confirm_window=3)
+    message = GreyhoundMessageRoot(**valid_message)
+    mock_connection.process_data_events.side_effect = lambda time_limit: (
+        time_limit and _confirm(producer, pika.spec.Basic.Ack(delivery_tag=2, multiple=True))
+    )
+
+    # Act
+    for _ in range(3):
+        producer.produce(message)
+    outstanding_before_full = producer.outstanding
+    producer.produce(message)
+
+    # Assert
+    assert outstanding_before_full == 3
+    assert producer.outstanding == 2
+    assert mock_channel.basic_publish.call_count == 4
+
+def test_producer_retries_nacked_publish_and_flush_waits_for_confirms(valid_message):
+    # Arrange
+    producer, mock_connection, mock_channel = _confirming_producer(confirm_retries=1)
+    producer.produce(GreyhoundMessageRoot(**valid_message))
+    confirms = iter([
+        pika.spec.Basic.Nack(delivery_tag=1),
+        pika.spec.Basic.Ack(delivery_tag=2),
+    ])
+    mock_connection.process_data_events.side_effect = lambda time_limit: time_limit and _confirm(producer, next(confirms))
+
+    # Act
+    producer.flush()
+
+    # Assert
+    assert mock_channel.basic_publish.call_count == 2
+    assert producer.outstanding == 0
+
+def test_producer_flush_raises_once_retries_are_exhausted(valid_message):
+    # Arrange
+    producer, mock_connection, _ = _confirming_producer(confirm_retries=0)
+    producer.produce(GreyhoundMessageRoot(**valid_message))
+    _confirm(producer, pika.spec.Basic.Nack(delivery_tag=1))
+
+    # Act / Assert
+    with pytest.raises(PublishNackedError) as error:
+        producer.flush()
+    assert len(error.value.bodies) == 1
+
+def _buffered_producer(**kwargs):
+    mock_connection = MagicMock()
+    mock_channel = MagicMock()
+    pika.BlockingConnection = MagicMock(return_value=mock_connection)
+    mock_connection.channel.return_value = mock_channel
+
+    producer = RabbitMQBufferedProducerAdapter(
+        queue_name="test-queue",
+        connection_params=pika.ConnectionParameters("localhost"),
+        **kwargs
+    )
+    return producer, mock_connection, mock_channel
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+def test_buffered_producer_publishes_full_batch_in_one_flush(valid_message):
+    # Arrange
+    producer, mock_connection, mock_channel = _buffered_producer(batch_size=3, linger_ms=60000)
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    for _ in range(3):
+        producer.produce(message)
+
+    # Assert
+    assert _wait_until(lambda: mock_channel._impl.basic_publish.call_count == 3)
+    mock_channel.basic_publish.assert_not_called()
+    producer.close()
+
+def test_buffered_producer_publishes_after_linger(valid_message):
+    # Arrange
+    producer, _, mock_channel = _buffered_producer(batch_size=100, linger_ms=20)
+
+    # Act
+    producer.produce(GreyhoundMessageRoot(**valid_message))
+
+    # Assert
+    assert _wait_until(lambda: mock_channel._impl.basic_publish.call_count == 1)
+    producer.close()
+
+def test_buffered_producer_flushes_by_bytes(valid_message):
+    # Arrange
+    message = GreyhoundMessageRoot(**valid_message)
+    producer, _, mock_channel = _buffered_producer(batch_size=100, batch_bytes=len(message.model_dump_json()) + 1, linger_ms=60000)
+
+    # Act
+    producer.produce(message)
+    producer.produce(message)
+
+    # Assert
+    assert _wait_until(lambda: mock_channel._impl.basic_publish.call_count == 2)
+    producer.close()
+
+def test_buffered_producer_flush_all_and_close_drain_the_buffer(valid_message):
+    # Arrange
+    producer, mock_connection, mock_channel = _buffered_producer(batch_size=100, linger_ms=60000)
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    producer.produce(message)
+    producer.flush_all()
+    published_after_flush = mock_channel._impl.basic_publish.call_count
+    producer.produce(message)
+    producer.close()
+
+    # Assert
+    assert published_after_flush == 1
+    assert mock_channel._impl.basic_publish.call_count == 2
+    mock_connection.close.assert_called_once()
+    with pytest.raises(ValueError):
+        producer.produce(message)
+
+def test_buffered_producer_raises_a_failed_batch_from_the_next_produce(valid_message):
+    # Arrange
+    producer, _, mock_channel = _buffered_producer(batch_size=1, linger_ms=60000)
+    message = GreyhoundMessageRoot(**valid_message)
+    mock_channel._impl.basic_publish.side_effect = ConnectionError("socket closed")
+    producer.produce(message)
+    assert _wait_until(lambda: producer._error is not None)
+    mock_channel._impl.basic_publish.side_effect = None
+
+    # Act / Assert
+    with pytest.raises(ConnectionError, match="socket closed"):
+        producer.produce(message)
+    producer.produce(message)
+    producer.close()
+    assert mock_channel._impl.basic_publish.call_count == 2
+
+def test_factory_creates_buffered_producer_when_configured():
+    pika.BlockingConnection = MagicMock(return_value=MagicMock())
+
+    producer = adapter_factory_producer({"producer": {"backend": "RABBITMQ", "queue": "test-queue", "buffered": True}})
+
+    assert isinstance(producer, RabbitMQBufferedProducerAdapter)
+    producer.close()
+
+def test_content_headers_map_onto_amqp_properties():
+    headers = {"content-type": "application/json", "content-encoding": "zlib", "trace": "abc"}
+
+    properties = properties_from_headers(headers)
+
+    assert properties.content_type == "application/json"
+    assert properties.content_encoding == "zlib"
+    assert properties.headers == {"trace": "abc"}
+    assert headers_from_properties(properties) == headers
+
+class _FailingOnceConsumer(GreyhoundConsumer):
+
+    def __init__(self):
+        super().__init__()
+        self.attempts = 0
+
+    def message_received(self, message):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise RuntimeError("boom")
+        return message
+
+def _settle_callbacks(adapter):
+    settled = threading.Event()
+    adapter.connection.add_callback_threadsafe.side_effect = lambda callback: (callback(), settled.set())
+    return settled
+
+def test_adapter_holds_ack_until_retry_succeeds(valid_message):
+    # Arrange
+    consumer = RetryingConsumer(_FailingOnceConsumer(), base_delay=0.01, jitter=0.0)
+    adapter, mock_channel = _adapter_with_mocked_connection(consumer)
+    settled = _settle_callbacks(adapter)
+    method = MagicMock(delivery_tag=7)
+
+    # Act
+    adapter.message_received(mock_channel, method, None, json.dumps(valid_message).encode())
+    acked_before_retry = mock_channel.basic_ack.called
+
+    # Assert
+    assert not acked_before_retry
+    assert settled.wait(2)
+    mock_channel.basic_ack.assert_called_once_with(delivery_tag=7)
+    consumer.close()
+
+def test_adapter_close_requeues_delivery_of_abandoned_retry(valid_message):
+    # Arrange
+    consumer = RetryingConsumer(_FailingOnceConsumer(), base_delay=60)
+    adapter, mock_channel = _adapter_with_mocked_connection(consumer)
+    _settle_callbacks(adapter)
+    method = MagicMock(delivery_tag=7)
+    adapter.message_received(mock_channel, method, None, json.dumps(valid_message).encode())
+
+    # Act
+    adapter.close()
+
+    # Assert
+    mock_channel.basic_ack.assert_not_called()
+    mock_channel.basic_nack.assert_called_once_with(delivery_tag=7, requeue=True)
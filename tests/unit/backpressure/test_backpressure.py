@@ -0,0 +1,165 @@
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pika
+import pytest
+from greyhound_messaging.adapters._implementations.kafka_adapters import KafkaConsumerAdapter
+from greyhound_messaging.adapters._implementations.memory_adapters import MemoryConsumerAdapter, MemoryProducerAdapter, reset_queues
+from greyhound_messaging.adapters._implementations.rabbitmq_adapters import RabbitMQBlockingConsumerAdapter
+from greyhound_messaging.backpressure import Backpressure
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+
+MESSAGE = {
+    "event_type": "test.event",
+    "payload": {"data": "test"},
+    "metadata": {"correlation_id": "c-1", "message_id": "m-1"}
+}
+
+
+class FakeProducer:
+
+    def __init__(self):
+        self.backlog = (0, 0)
+
+
+@pytest.fixture
+def producer():
+    return FakeProducer()
+
+
+def test_pauses_over_either_budget_and_resumes_once_drained(producer):
+    # Arrange
+    backpressure = Backpressure(producer, max_in_flight=10, max_buffered_bytes=1000, resume_ratio=0.5)
+
+    # Act
+    producer.backlog = (3, 1000)
+    paused = backpressure.update()
+    producer.backlog = (3, 600)
+    still_paused = backpressure.update()
+    producer.backlog = (3, 500)
+    resumed = backpressure.update()
+    producer.backlog = (10, 0)
+    paused_again = backpressure.update()
+
+    # Assert
+    assert paused is True
+    assert still_paused is None
+    assert resumed is False
+    assert paused_again is True
+    assert backpressure.pauses == 2
+
+
+def test_from_config_returns_none_when_not_configured(producer):
+    # Act & Assert
+    assert Backpressure.from_config(producer, None) is None
+
+
+def test_producer_without_backlog_is_rejected():
+    # Act & Assert
+    with pytest.raises(ValueError, match="does not report its backlog"):
+        Backpressure(object())
+
+
+def test_kafka_consumer_pauses_and_resumes_its_assignment(producer):
+    # Arrange
+    backpressure = Backpressure(producer, max_in_flight=10)
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        assignment = [MagicMock()]
+        kafka_mock_instance.assignment.return_value = assignment
+        adapter = KafkaConsumerAdapter(
+            consumer=MagicMock(spec=GreyhoundConsumer),
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            backpressure=backpressure
+        )
+
+        # Act
+        producer.backlog = (10, 0)
+        adapter._apply_backpressure()
+        adapter._on_assign(kafka_mock_instance, ["new-partition"])
+        producer.backlog = (0, 0)
+        adapter._apply_backpressure()
+
+        # Assert
+        assert kafka_mock_instance.pause.call_args_list[0].args == (assignment,)
+        assert kafka_mock_instance.pause.call_args_list[1].args == (["new-partition"],)
+        kafka_mock_instance.resume.assert_called_once_with(assignment)
+
+
+def test_kafka_consumer_subscribes_with_an_assign_callback(producer):
+    # Arrange
+    with patch("greyhound_messaging.adapters._implementations.kafka_adapters.Consumer") as MockKafkaConsumer:
+        kafka_mock_instance = MockKafkaConsumer.return_value
+        kafka_mock_instance.poll.side_effect = KeyboardInterrupt
+        adapter = KafkaConsumerAdapter(
+            consumer=MagicMock(spec=GreyhoundConsumer),
+            queue_name="test-topic",
+            connection_params={"bootstrap.servers": "localhost:9092", "group.id": "test-group"},
+            backpressure=Backpressure(producer)
+        )
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            adapter.consume()
+
+        # Assert
+        kafka_mock_instance.subscribe.assert_called_once_with(["test-topic"], on_assign=adapter._on_assign)
+
+
+def test_rabbitmq_consumer_shrinks_prefetch_and_holds_acks_while_paused(producer):
+    # Arrange
+    backpressure = Backpressure(producer, max_in_flight=10, paused_prefetch=2)
+    pool = MagicMock()
+    connection = pool.acquire.return_value
+    channel = connection.channel.return_value
+    adapter = RabbitMQBlockingConsumerAdapter(
+        consumer=MagicMock(),
+        queue_name="test-queue",
+        connection_params=pika.ConnectionParameters("localhost"),
+        prefetch_count=50,
+        pool=pool,
+        backpressure=backpressure
+    )
+    body = json.dumps(MESSAGE).encode("utf-8")
+
+    # Act
+    producer.backlog = (10, 0)
+    adapter.message_received(channel, MagicMock(delivery_tag=1), MagicMock(headers=None, content_type=None, content_encoding=None), body)
+    adapter.message_received(channel, MagicMock(delivery_tag=2), MagicMock(headers=None, content_type=None, content_encoding=None), body)
+    acked_while_paused = [c.kwargs["delivery_tag"] for c in channel.basic_ack.call_args_list]
+    producer.backlog = (0, 0)
+    adapter._on_backpressure_timer()
+
+    # Assert
+    assert acked_while_paused == [1]
+    assert [c.kwargs["delivery_tag"] for c in channel.basic_ack.call_args_list] == [1, 2]
+    assert [c.kwargs["prefetch_count"] for c in channel.basic_qos.call_args_list] == [2, 50]
+    connection.call_later.assert_called_once()
+
+
+def test_memory_consumer_stops_taking_messages_while_paused(producer):
+    # Arrange
+    reset_queues()
+    handled = threading.Event()
+    consumer = MagicMock(spec=GreyhoundConsumer)
+    consumer.message_received.side_effect = lambda message: handled.set()
+    backpressure = Backpressure(producer, max_in_flight=1, check_interval=0.01)
+    adapter = MemoryConsumerAdapter(consumer, "backpressure-test", poll_timeout=0.01, backpressure=backpressure)
+    MemoryProducerAdapter("backpressure-test").produce(MemoryProducerAdapter("x").serializer.codec.decode(json.dumps(MESSAGE).encode("utf-8")))
+    producer.backlog = (1, 0)
+    worker = threading.Thread(target=adapter.consume)
+
+    # Act
+    worker.start()
+    handled_while_paused = handled.wait(0.1)
+    producer.backlog = (0, 0)
+    handled_after_resume = handled.wait(2)
+    adapter.stop()
+    worker.join()
+    reset_queues()
+
+    # Assert
+    assert not handled_while_paused
+    assert handled_after_resume
@@ -0,0 +1,28 @@
+import pytest
+from greyhound_messaging.bench import run_case
+from greyhound_messaging.bench.runner import percentile
+
+
+@pytest.fixture
+def memory_config():
+    return {
+        "producer": {"backend": "MEMORY", "queue": "unused"},
+        "consumer": {"backend": "MEMORY", "queue": "unused", "poll_timeout": 0.01}
+    }
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile(values, 0.999) == 100
+    assert percentile([], 0.5) == 0.0
+
+
+def test_run_case_honours_target_rate(memory_config):
+    result = run_case(memory_config, "MEMORY", "json", "small", messages=100, rate=1000)
+
+    assert result.received == 100
+    assert result.duration_s >= 0.09
+    assert result.throughput_msgs_per_s <= 1200
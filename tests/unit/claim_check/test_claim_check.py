@@ -0,0 +1,207 @@
+import asyncio
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from greyhound_messaging.claim_check import CLAIM_CHECK_HEADER, ClaimCheck, ClaimCheckReleasingConsumer, FilesystemBlobStore
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.model.lazy_message import LazyGreyhoundMessage
+from greyhound_messaging.serialization import MessageDecodeError, MessageSerializer, codecs, get_codec
+
+
+def make_message(size: int) -> GreyhoundMessageRoot:
+    return GreyhoundMessageRoot(
+        event_type="test.event",
+        payload={"data": "x" * size},
+        metadata={"correlation_id": "c-1", "message_id": "m-1", "custom_headers": {"tenant": "a"}}
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FilesystemBlobStore(str(tmp_path / "blobs"))
+
+
+@pytest.mark.parametrize("codec_name", sorted(codecs))
+def test_large_payload_is_offloaded_and_read_back(store, codec_name):
+    # Arrange
+    serializer = MessageSerializer(get_codec(codec_name), claim_check=ClaimCheck(store, threshold=1024))
+    message = make_message(10000)
+
+    # Act
+    body, headers = serializer.encode(message)
+    decoded = serializer.decode(body, headers)
+
+    # Assert
+    assert len(body) < 1024
+    assert decoded.payload == message.payload
+    assert decoded.metadata.custom_headers["tenant"] == "a"
+    assert message.payload == {"data": "x" * 10000}
+    assert CLAIM_CHECK_HEADER not in message.metadata.custom_headers
+
+
+def test_small_payload_stays_inline(store):
+    # Arrange
+    serializer = MessageSerializer(claim_check=ClaimCheck(store, threshold=1024))
+
+    # Act
+    body, _ = serializer.encode(make_message(10))
+
+    # Assert
+    assert b"x" * 10 in body
+    assert os.listdir(store.path) == []
+
+
+def test_lazy_message_only_opens_the_blob_on_payload_access(store):
+    # Arrange
+    serializer = MessageSerializer(lazy=True, claim_check=ClaimCheck(store, threshold=1024))
+    body, headers = serializer.encode(make_message(10000))
+    reference = serializer.decode(body, headers)
+    blob_id = reference.metadata.custom_headers[CLAIM_CHECK_HEADER]["blob"]
+    store.read = MagicMock(wraps=store.read)
+
+    # Act
+    event_type = reference.event_type
+    read_before_access = store.read.call_count
+    payload = reference.payload
+
+    # Assert
+    assert isinstance(reference, LazyGreyhoundMessage)
+    assert event_type == "test.event"
+    assert read_before_access == 0
+    store.read.assert_called_once_with(blob_id)
+    assert payload == {"data": "x" * 10000}
+
+
+@pytest.mark.parametrize("codec_name", sorted(codecs))
+def test_offloaded_blob_is_the_encoded_body(store, codec_name):
+    # Arrange
+    serializer = MessageSerializer(get_codec(codec_name), claim_check=ClaimCheck(store, threshold=1024))
+    message = make_message(10000)
+
+    # Act
+    body, headers = serializer.encode(message)
+
+    # Assert
+    blob_id = serializer.decode(body, headers).metadata.custom_headers[CLAIM_CHECK_HEADER]["blob"]
+    assert store.read(blob_id) == MessageSerializer(get_codec(codec_name)).encode(message)[0]
+
+
+def test_missing_blob_is_a_decode_error(store):
+    # Arrange
+    serializer = MessageSerializer(claim_check=ClaimCheck(store, threshold=1024))
+    body, headers = serializer.encode(make_message(10000))
+    for blob_id in os.listdir(store.path):
+        store.release(blob_id)
+
+    # Act & Assert
+    with pytest.raises(MessageDecodeError):
+        serializer.decode(body, headers)
+
+
+def test_refcount_cleanup_follows_forwarding_and_handling(store):
+    # Arrange
+    claim_check = ClaimCheck(store, threshold=1024, cleanup="refcount")
+    serializer = MessageSerializer(passthrough=True, claim_check=claim_check)
+    body, headers = serializer.encode(make_message(10000))
+    blob_id = os.listdir(store.path)[0]
+    handler = MagicMock()
+    consumer = ClaimCheckReleasingConsumer(handler, claim_check)
+
+    # Act
+    received = serializer.decode(body, headers)
+    forwarded, _ = serializer.encode(received)
+    consumer.message_received(received)
+    still_referenced = blob_id in store
+    consumer.message_received(serializer.decode(forwarded, headers))
+
+    # Assert
+    assert forwarded == body
+    assert still_referenced
+    assert blob_id not in store
+
+
+def test_failed_handler_keeps_its_reference(store):
+    # Arrange
+    claim_check = ClaimCheck(store, threshold=1024, cleanup="refcount")
+    serializer = MessageSerializer(claim_check=claim_check)
+    body, headers = serializer.encode(make_message(10000))
+    handler = MagicMock()
+    handler.message_received.side_effect = RuntimeError("boom")
+    consumer = ClaimCheckReleasingConsumer(handler, claim_check)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        consumer.message_received(serializer.decode(body, headers))
+
+    # Assert
+    assert len(os.listdir(store.path)) == 1
+
+
+def test_async_handler_releases_after_it_completes(store):
+    # Arrange
+    claim_check = ClaimCheck(store, threshold=1024, cleanup="refcount")
+    serializer = MessageSerializer(claim_check=claim_check)
+    body, headers = serializer.encode(make_message(10000))
+
+    class Handler:
+        async def message_received(self, message):
+            return message
+
+    consumer = ClaimCheckReleasingConsumer(Handler(), claim_check)
+
+    # Act
+    pending = consumer.message_received(serializer.decode(body, headers))
+    before = len(os.listdir(store.path))
+    asyncio.run(pending)
+
+    # Assert
+    assert before == 1
+    assert os.listdir(store.path) == []
+
+
+def test_expired_blobs_are_swept(store):
+    # Arrange
+    blob_id = store.put(b"{}")
+    fresh_id = store.put(b"{}")
+    old = time.time() - 2 * store.ttl
+    os.utime(os.path.join(store.path, blob_id, "data"), (old, old))
+
+    # Act
+    deleted = store.sweep()
+
+    # Assert
+    assert deleted == 1
+    assert blob_id not in store
+    assert fresh_id in store
+
+
+def test_blob_is_read_through_mmap(store):
+    # Arrange
+    blob_id = store.put(b"hello")
+
+    # Act
+    with store.open(blob_id) as view:
+        content = bytes(view)
+        kind = type(view.obj).__name__
+
+    # Assert
+    assert content == b"hello"
+    assert kind == "mmap"
+
+
+def test_from_config_builds_a_filesystem_store(tmp_path):
+    # Act
+    serializer = MessageSerializer.from_config({"claim_check": {"path": str(tmp_path), "threshold": 10, "cleanup": "refcount"}})
+
+    # Assert
+    assert isinstance(serializer.claim_check.store, FilesystemBlobStore)
+    assert serializer.claim_check.threshold == 10
+    assert serializer.claim_check.refcount
+
+
+def test_unknown_cleanup_mode_is_rejected(store):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown claim check cleanup mode: never"):
+        ClaimCheck(store, cleanup="never")
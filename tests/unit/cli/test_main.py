@@ -0,0 +1,32 @@
+import json
+
+from click.testing import CliRunner
+from greyhound_messaging.cli.main import cli
+
+
+def test_bench_writes_machine_readable_results(tmp_path):
+    # Arrange
+    output = tmp_path / "bench.json"
+    runner = CliRunner()
+
+    # Act
+    result = runner.invoke(cli, [
+        "bench", "--messages", "50", "--warmup", "5", "--payload-size", "small", "--output", str(output)
+    ])
+
+    # Assert
+    assert result.exit_code == 0, result.output
+    report = json.loads(output.read_text())
+    [case] = report["results"]
+    assert case["backend"] == "MEMORY"
+    assert case["codec"] == "json"
+    assert case["received"] == 50
+    assert set(case["latency_us"]) == {"p50", "p99", "p999", "max"}
+
+
+def test_cli_without_arguments_prints_help():
+    result = CliRunner().invoke(cli, [])
+
+    assert result.exit_code == 2
+    assert "consume" in result.output
+    assert "bench" in result.output
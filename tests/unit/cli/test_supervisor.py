@@ -0,0 +1,87 @@
+import os
+import signal
+import threading
+import time
+
+from click.testing import CliRunner
+from greyhound_messaging.cli.main import cli
+from greyhound_messaging.cli.supervisor import Supervisor
+
+
+def draining_worker(index, stats_queue):
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    forwarded = 0
+    try:
+        while True:
+            forwarded += 1
+            stats_queue.put((index, {"forwarded": forwarded}))
+            time.sleep(0.01)
+    except KeyboardInterrupt:
+        stats_queue.put((index, {"forwarded": forwarded, "drained": 1}))
+
+
+def crash_once_worker(marker):
+    def worker(index, stats_queue):
+        if not os.path.exists(f"{marker}-{index}"):
+            open(f"{marker}-{index}", "w").close()
+            stats_queue.put((index, {"forwarded": 5}))
+            os._exit(1)
+        draining_worker(index, stats_queue)
+    return worker
+
+
+def run_in_thread(supervisor):
+    thread = threading.Thread(target=supervisor.run, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.02)
+
+
+def test_supervisor_drains_workers_and_combines_stats():
+    # Arrange
+    supervisor = Supervisor(draining_worker, workers=3, drain_timeout=5)
+    thread = run_in_thread(supervisor)
+    wait_until(lambda: supervisor.stats.get("forwarded", 0) >= 30)
+
+    # Act
+    supervisor.stop()
+    thread.join(10)
+
+    # Assert
+    assert not thread.is_alive()
+    assert supervisor.stats["drained"] == 3
+    assert len(set(supervisor.pids)) == 3
+
+
+def test_supervisor_restarts_crashed_workers_and_keeps_their_stats(tmp_path):
+    # Arrange
+    supervisor = Supervisor(crash_once_worker(str(tmp_path / "crashed")), workers=2, restart_delay=0.05, drain_timeout=5)
+
+    # Act
+    thread = run_in_thread(supervisor)
+    wait_until(lambda: supervisor.restarts == 2)
+    supervisor.stop()
+    thread.join(10)
+
+    # Assert
+    assert supervisor.stats["drained"] == 2
+    assert supervisor.stats["forwarded"] > 10
+
+
+def test_consume_rejects_workers_with_in_memory_backend(tmp_path):
+    # Arrange
+    config = tmp_path / "config.yaml"
+    config.write_text("consumer: {backend: MEMORY, queue: a}\nproducer: {backend: MEMORY, queue: b}\n")
+
+    # Act
+    result = CliRunner().invoke(cli, ["consume", "--config", str(config), "--workers", "2"])
+
+    # Assert
+    assert result.exit_code == 2
+    assert "--workers needs a broker backend" in result.output
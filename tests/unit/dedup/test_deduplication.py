@@ -0,0 +1,220 @@
+import asyncio
+import time
+
+import pytest
+from greyhound_messaging.adapters import adapter_factory_consumer
+from greyhound_messaging.dedup import DeduplicatingConsumer, DeduplicationCache, SqliteDeduplicationStore
+from greyhound_messaging.greyhound_consumers import AsyncGreyhoundConsumer, GreyhoundConsumer, dispatch_async
+from greyhound_messaging.metrics import MetricsRegistry
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.model.lazy_message import LazyGreyhoundMessage
+from greyhound_messaging.serialization import MessageSerializer
+
+
+@pytest.fixture
+def valid_message():
+    return GreyhoundMessageRoot(
+        event_type="orders.created",
+        payload={"order_id": 1},
+        metadata={"correlation_id": "c-1", "message_id": "m-1"}
+    )
+
+
+class CountingConsumer(GreyhoundConsumer):
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+        self.handled = []
+
+    def message_received(self, message):
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.handled.append(message.metadata.message_id)
+        return message
+
+
+def test_cache_counts_hits_and_misses():
+    # Arrange
+    cache = DeduplicationCache()
+
+    # Act
+    first = cache.seen("m-1")
+    cache.add("m-1")
+    second = cache.seen("m-1")
+
+    # Assert
+    assert (first, second) == (False, True)
+    assert cache.stats == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_cache_evicts_least_recently_seen_beyond_max_entries():
+    # Arrange
+    cache = DeduplicationCache(max_entries=2)
+    cache.add("m-1")
+    cache.add("m-2")
+    cache.seen("m-1")
+
+    # Act
+    cache.add("m-3")
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.seen("m-1")
+    assert not cache.seen("m-2")
+
+
+def test_cache_forgets_ids_after_ttl():
+    # Arrange
+    cache = DeduplicationCache(ttl=0.01)
+    cache.add("m-1")
+
+    # Act
+    time.sleep(0.02)
+
+    # Assert
+    assert not cache.seen("m-1")
+    assert len(cache) == 0
+
+
+def test_persistent_store_survives_restart(tmp_path):
+    # Arrange
+    path = str(tmp_path / "dedup.sqlite")
+    cache = DeduplicationCache(store=SqliteDeduplicationStore(path))
+    cache.add("m-1")
+    cache.close()
+
+    # Act
+    restarted = DeduplicationCache(store=SqliteDeduplicationStore(path))
+
+    # Assert
+    assert restarted.seen("m-1")
+    assert not restarted.seen("m-2")
+    restarted.close()
+
+
+def test_consumer_skips_duplicates(valid_message):
+    # Arrange
+    inner = CountingConsumer()
+    consumer = DeduplicatingConsumer(inner, DeduplicationCache())
+
+    # Act
+    consumer.message_received(valid_message)
+    consumer.message_received(valid_message.model_copy())
+
+    # Assert
+    assert inner.handled == ["m-1"]
+
+
+def test_consumer_does_not_remember_failed_messages(valid_message):
+    # Arrange
+    cache = DeduplicationCache()
+    consumer = DeduplicatingConsumer(CountingConsumer(fail=True), cache)
+
+    # Act
+    with pytest.raises(RuntimeError):
+        consumer.message_received(valid_message)
+
+    # Assert
+    assert not cache.seen("m-1")
+
+
+class FailingAsyncConsumer(AsyncGreyhoundConsumer):
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.handled = []
+
+    async def message_received(self, message):
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("handler failed")
+        self.handled.append(message.metadata.message_id)
+        return message
+
+
+def test_async_consumer_does_not_remember_failed_messages(valid_message):
+    # Arrange
+    cache = DeduplicationCache()
+    inner = FailingAsyncConsumer(failures=1)
+    consumer = DeduplicatingConsumer(inner, cache)
+
+    async def deliver_twice():
+        with pytest.raises(RuntimeError):
+            await dispatch_async(consumer, valid_message)
+        remembered_after_failure = cache.seen("m-1")
+        await dispatch_async(consumer, valid_message.model_copy())
+        return remembered_after_failure
+
+    # Act
+    remembered_after_failure = asyncio.run(deliver_twice())
+
+    # Assert
+    assert not remembered_after_failure
+    assert inner.handled == ["m-1"]
+    assert cache.seen("m-1")
+
+
+def test_lazy_duplicate_is_skipped_without_decoding_payload(valid_message):
+    # Arrange
+    serializer = MessageSerializer(lazy=True)
+    consumer = DeduplicatingConsumer(CountingConsumer(), DeduplicationCache())
+    body, headers = serializer.encode(valid_message)
+    consumer.message_received(serializer.decode(body, headers))
+    duplicate = serializer.decode(body, headers)
+
+    # Act
+    consumer.message_received(duplicate)
+
+    # Assert
+    assert isinstance(duplicate, LazyGreyhoundMessage)
+    assert not duplicate.is_materialized
+
+
+def test_from_config_exports_stats_when_metrics_are_enabled(valid_message):
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    consumer = DeduplicatingConsumer.from_config(CountingConsumer(), {"max_entries": 10}, queue="orders", registry=registry)
+
+    # Act
+    consumer.message_received(valid_message)
+    consumer.message_received(valid_message)
+
+    # Assert
+    rendered = registry.render()
+    assert 'greyhound_dedup_hits_total{queue="orders"} 1' in rendered
+    assert 'greyhound_dedup_misses_total{queue="orders"} 1' in rendered
+    assert 'greyhound_dedup_entries{queue="orders"} 1' in rendered
+
+
+def test_adapter_factory_wraps_consumer_when_dedup_is_configured():
+    # Arrange
+    config = {"consumer": {"backend": "MEMORY", "queue": "orders", "dedup": {"ttl": 60}}}
+
+    # Act
+    adapter = adapter_factory_consumer(CountingConsumer(), config)
+
+    # Assert
+    assert isinstance(adapter.consumer, DeduplicatingConsumer)
+    assert adapter.consumer.cache.ttl == 60
+
+
+def test_adapter_close_persists_ids_for_a_restarted_adapter(tmp_path, valid_message):
+    # Arrange
+    config = {"consumer": {"backend": "MEMORY", "queue": "orders", "dedup": {"path": str(tmp_path / "dedup.sqlite")}}}
+    body, headers = MessageSerializer().encode(valid_message)
+    adapter = adapter_factory_consumer(CountingConsumer(), config)
+    adapter.message_received(body, headers)
+
+    # Act
+    adapter.close()
+    restarted_consumer = CountingConsumer()
+    restarted = adapter_factory_consumer(restarted_consumer, config)
+    restarted.message_received(body, headers)
+
+    # Assert
+    assert restarted_consumer.handled == []
+    assert restarted.consumer.cache.stats["hits"] == 1
+    restarted.close()
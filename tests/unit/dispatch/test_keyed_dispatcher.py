@@ -0,0 +1,194 @@
+import threading
+import time
+
+import pytest
+from greyhound_messaging.dispatch import KeyedDispatcher
+from greyhound_messaging.greyhound_consumers import GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+
+
+def make_message(correlation_id: str, sequence: int) -> GreyhoundMessageRoot:
+    return GreyhoundMessageRoot(
+        event_type="test.event",
+        payload={"sequence": sequence},
+        metadata={"correlation_id": correlation_id, "message_id": f"{correlation_id}-{sequence}"}
+    )
+
+
+class RecordingConsumer(GreyhoundConsumer):
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.seen = []
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        time.sleep(self.delay)
+        with self.lock:
+            self.seen.append((message.metadata.correlation_id, message.payload["sequence"]))
+        return message
+
+
+class FailingConsumer(GreyhoundConsumer):
+
+    def message_received(self, message: GreyhoundMessageRoot) -> GreyhoundMessageRoot:
+        raise RuntimeError("handler failed")
+
+
+class EventTypeConsumer(GreyhoundConsumer):
+
+    def message_received(self, message: GreyhoundMessageRoot) -> str:
+        return message.event_type
+
+
+def test_dispatcher_preserves_order_per_key():
+    # Arrange
+    consumer = RecordingConsumer(delay=0.001)
+    dispatcher = KeyedDispatcher(consumer, workers=4)
+
+    # Act
+    futures = [
+        dispatcher.submit(make_message(f"entity-{entity}", sequence))
+        for sequence in range(20)
+        for entity in range(5)
+    ]
+    for future in futures:
+        future.result(timeout=5)
+    dispatcher.close()
+
+    # Assert
+    for entity in range(5):
+        sequences = [sequence for key, sequence in consumer.seen if key == f"entity-{entity}"]
+        assert sequences == list(range(20))
+
+
+def test_dispatcher_runs_different_keys_in_parallel():
+    # Arrange
+    consumer = RecordingConsumer(delay=0.05)
+    dispatcher = KeyedDispatcher(consumer, workers=8)
+    messages = [make_message(f"entity-{entity}", 0) for entity in range(8)]
+    assert len({dispatcher.worker_for(message) for message in messages}) > 1
+
+    # Act
+    started = time.monotonic()
+    for future in [dispatcher.submit(message) for message in messages]:
+        future.result(timeout=5)
+    elapsed = time.monotonic() - started
+    dispatcher.close()
+
+    # Assert
+    assert elapsed < 0.05 * len(messages)
+
+
+def test_dispatcher_reports_handler_failures_through_the_future():
+    # Arrange
+    dispatcher = KeyedDispatcher(FailingConsumer(), workers=1)
+    done = []
+
+    # Act
+    future = dispatcher.submit(make_message("entity", 0), on_done=done.append)
+
+    # Assert
+    with pytest.raises(RuntimeError, match="handler failed"):
+        future.result(timeout=5)
+    dispatcher.close()
+    assert done == [future]
+
+
+def test_dispatcher_runs_handlers_in_child_processes():
+    # Arrange
+    dispatcher = KeyedDispatcher(EventTypeConsumer(), workers=2, mode="process")
+
+    # Act
+    result = dispatcher.submit(make_message("entity", 0)).result(timeout=30)
+    dispatcher.close()
+
+    # Assert
+    assert result == "test.event"
+
+
+def test_dispatcher_from_config_returns_none_when_not_configured():
+    assert KeyedDispatcher.from_config(GreyhoundConsumer(), None) is None
+
+
+def test_dispatcher_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown dispatch mode: fibers"):
+        KeyedDispatcher(GreyhoundConsumer(), mode="fibers")
+
+
+def test_priority_dispatcher_lets_high_priority_messages_skip_the_backlog():
+    # Arrange
+    gate = threading.Event()
+    seen = []
+
+    class GatedConsumer(GreyhoundConsumer):
+        def message_received(self, message):
+            gate.wait(5)
+            seen.append(message.metadata.message_id)
+            return message
+
+    dispatcher = KeyedDispatcher(GatedConsumer(), workers=1, priority=True)
+    first = make_message("entity", 0)
+    low = [make_message("entity", sequence) for sequence in (1, 2)]
+    high = make_message("entity", 3)
+    high.metadata.priority = 9
+
+    # Act
+    futures = [dispatcher.submit(first)]
+    time.sleep(0.05)
+    futures += [dispatcher.submit(message) for message in low + [high]]
+    gate.set()
+    for future in futures:
+        future.result(timeout=5)
+    dispatcher.close()
+
+    # Assert
+    assert seen == ["entity-0", "entity-3", "entity-1", "entity-2"]
+
+
+def test_priority_dispatcher_close_drains_backlog_first():
+    # Arrange
+    consumer = RecordingConsumer()
+    dispatcher = KeyedDispatcher.from_config(consumer, {"workers": 1, "priority": True})
+
+    # Act
+    for sequence in range(5):
+        dispatcher.submit(make_message("entity", sequence))
+    dispatcher.close()
+
+    # Assert
+    assert dispatcher.priority
+    assert [sequence for _, sequence in consumer.seen] == [0, 1, 2, 3, 4]
+
+
+class CountingConsumer(GreyhoundConsumer):
+
+    def __init__(self):
+        super().__init__()
+        self.handled = 0
+
+    def message_received(self, message: GreyhoundMessageRoot) -> int:
+        self.handled += 1
+        return self.handled
+
+
+def test_process_dispatcher_installs_the_consumer_once_per_child():
+    # Arrange
+    dispatcher = KeyedDispatcher(CountingConsumer(), workers=1, mode="process")
+
+    # Act
+    results = [dispatcher.submit(make_message("entity", sequence)).result(timeout=30) for sequence in range(3)]
+    dispatcher.close()
+
+    # Assert
+    assert results == [1, 2, 3]
+
+
+def test_process_dispatcher_rejects_consumers_that_cannot_be_pickled():
+    # Arrange
+    consumer = RecordingConsumer()
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="requires a picklable consumer, RecordingConsumer"):
+        KeyedDispatcher(consumer, mode="process")
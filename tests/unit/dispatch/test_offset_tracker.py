@@ -0,0 +1,170 @@
+import threading
+
+from greyhound_messaging.dispatch import OffsetTracker, PartitionOffsets
+
+PARTITION = ("orders", 0)
+
+
+def test_low_water_mark_waits_for_the_oldest_in_flight_offset():
+    # Arrange
+    tracker = OffsetTracker()
+    for offset in range(10, 15):
+        tracker.track(PARTITION, offset)
+
+    # Act
+    for offset in (11, 12, 14):
+        tracker.complete(PARTITION, offset)
+    before = tracker.committable()
+    tracker.complete(PARTITION, 10)
+    after = tracker.committable()
+
+    # Assert
+    assert before == {}
+    assert after == {PARTITION: 13}
+    assert tracker.in_flight == 1
+
+
+def test_completed_offsets_are_merged_into_intervals():
+    # Arrange
+    offsets = PartitionOffsets(0)
+    for offset in range(8):
+        offsets.track(offset)
+
+    # Act
+    for offset in (2, 4, 3, 6):
+        offsets.complete(offset)
+
+    # Assert
+    assert offsets.intervals == [(2, 5), (6, 7)]
+    assert offsets.base == 0
+
+
+def test_offsets_skipped_by_the_broker_count_as_completed():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 5)
+    tracker.track(PARTITION, 9)
+
+    # Act
+    tracker.complete(PARTITION, 5)
+
+    # Assert
+    assert tracker.committable() == {PARTITION: 9}
+
+
+def test_committable_only_reports_partitions_that_advanced():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 0)
+    tracker.track(("orders", 1), 0)
+    tracker.complete(PARTITION, 0)
+    tracker.committable()
+
+    # Act
+    result = tracker.committable()
+
+    # Assert
+    assert result == {}
+
+
+def test_duplicate_and_unknown_completions_are_ignored():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 0)
+    tracker.track(PARTITION, 1)
+
+    # Act
+    tracker.complete(PARTITION, 1)
+    tracker.complete(PARTITION, 1)
+    tracker.complete(PARTITION, 7)
+    tracker.complete(("orders", 3), 0)
+
+    # Assert
+    assert tracker.in_flight == 1
+    assert tracker.uncommitted == 1
+
+
+def test_revoke_waits_for_in_flight_offsets_and_drops_the_partition():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 0)
+    tracker.track(PARTITION, 1)
+    tracker.complete(PARTITION, 0)
+    finisher = threading.Timer(0.05, tracker.complete, args=(PARTITION, 1))
+    finisher.start()
+
+    # Act
+    offsets = tracker.revoke([PARTITION], timeout=5.0)
+
+    # Assert
+    assert offsets == {PARTITION: 2}
+    assert PARTITION not in tracker
+
+
+def test_revoke_gives_up_after_the_timeout():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 0)
+    tracker.track(PARTITION, 1)
+    tracker.complete(PARTITION, 0)
+
+    # Act
+    offsets = tracker.revoke([PARTITION], timeout=0.01)
+    tracker.complete(PARTITION, 1)
+
+    # Assert
+    assert offsets == {PARTITION: 1}
+    assert tracker.in_flight == 0
+
+
+def test_wait_for_capacity_times_out_while_full():
+    # Arrange
+    tracker = OffsetTracker()
+    tracker.track(PARTITION, 0)
+
+    # Act
+    full = tracker.wait_for_capacity(1, timeout=0.01)
+    tracker.complete(PARTITION, 0)
+    free = tracker.wait_for_capacity(1, timeout=0.01)
+
+    # Assert
+    assert not full
+    assert free
+
+
+def test_rewind_drops_the_failed_offset_and_everything_after_it():
+    # Arrange
+    tracker = OffsetTracker()
+    for offset in range(6):
+        tracker.track(PARTITION, offset)
+    for offset in (0, 3, 5):
+        tracker.complete(PARTITION, offset)
+
+    # Act
+    rewound = tracker.rewind(PARTITION, 2)
+    for offset in range(2, 6):
+        tracker.track(PARTITION, offset)
+        tracker.complete(PARTITION, offset)
+    tracker.complete(PARTITION, 1)
+
+    # Assert
+    assert rewound is True
+    assert tracker.committable() == {PARTITION: 6}
+    assert tracker.in_flight == 0
+
+
+def test_rewind_ignores_completed_and_untracked_offsets():
+    # Arrange
+    tracker = OffsetTracker()
+    for offset in range(4):
+        tracker.track(PARTITION, offset)
+    tracker.complete(PARTITION, 2)
+
+    # Act
+    completed = tracker.rewind(PARTITION, 2)
+    past_the_end = tracker.rewind(PARTITION, 7)
+    unknown = tracker.rewind(("orders", 1), 0)
+
+    # Assert
+    assert (completed, past_the_end, unknown) == (False, False, False)
+    assert tracker.in_flight == 3
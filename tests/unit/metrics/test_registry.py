@@ -0,0 +1,86 @@
+import urllib.request
+
+import pytest
+from greyhound_messaging.metrics import AdapterMetrics, MetricsRegistry, configure_metrics, start_http_server
+
+
+def test_render_uses_prometheus_text_format():
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    registry.counter("greyhound_test_total", "A test counter.", ("queue",)).labels(queue='a"b').inc(3)
+    registry.gauge("greyhound_test_depth", "A test gauge.").labels().set(2.5)
+
+    # Act
+    rendered = registry.render()
+
+    # Assert
+    assert "# HELP greyhound_test_total A test counter.\n# TYPE greyhound_test_total counter\n" in rendered
+    assert 'greyhound_test_total{queue="a\\"b"} 3\n' in rendered
+    assert "greyhound_test_depth 2.5\n" in rendered
+
+
+def test_histogram_buckets_are_cumulative():
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    histogram = registry.histogram("greyhound_test_seconds", "A test histogram.", buckets=(0.1, 1.0)).labels()
+
+    # Act
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+    rendered = registry.render()
+
+    # Assert
+    assert 'greyhound_test_seconds_bucket{le="0.1"} 1\n' in rendered
+    assert 'greyhound_test_seconds_bucket{le="1"} 3\n' in rendered
+    assert 'greyhound_test_seconds_bucket{le="+Inf"} 4\n' in rendered
+    assert "greyhound_test_seconds_count 4\n" in rendered
+    assert "greyhound_test_seconds_sum 6.05\n" in rendered
+
+
+def test_gauge_function_is_read_at_render_time():
+    registry = MetricsRegistry(enabled=True)
+    depth = []
+    registry.gauge("greyhound_test_depth", "A test gauge.").labels().set_function(lambda: len(depth))
+
+    depth.extend([1, 2])
+
+    assert "greyhound_test_depth 2\n" in registry.render()
+
+
+def test_registering_a_name_twice_with_another_type_raises():
+    registry = MetricsRegistry()
+    registry.counter("greyhound_test", "A counter.")
+
+    with pytest.raises(ValueError):
+        registry.gauge("greyhound_test", "A gauge.")
+
+
+def test_adapter_metrics_are_not_created_while_disabled():
+    registry = MetricsRegistry()
+
+    assert AdapterMetrics.from_config("MEMORY", "consumer", {"queue": "q"}, registry=registry) is None
+
+    configure_metrics({"enabled": True}, registry=registry)
+
+    assert isinstance(AdapterMetrics.from_config("MEMORY", "consumer", {"queue": "q"}, registry=registry), AdapterMetrics)
+
+
+def test_http_endpoint_serves_metrics():
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    registry.counter("greyhound_test_total", "A test counter.").labels().inc()
+    server = start_http_server(0, registry=registry)
+    url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+
+    # Act
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Assert
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "greyhound_test_total 1\n" in body
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from greyhound_messaging.model.lazy_message import LazyGreyhoundMessage
+from greyhound_messaging.serialization import MessageDecodeError, MessageSerializer
+
+
+@pytest.fixture
+def valid_message():
+    return {
+        "event_type": "test.event",
+        "is_dry_run": False,
+        "stages": [
+            {
+                "destination": "service-X",
+                "inputs": {"key": "value"},
+                "outputs": {"result": "success"},
+                "parameters": {"param1": "value1"}
+            }
+        ],
+        "payload": {"data": "test"},
+        "metadata": {
+            "correlation_id": "12345",
+            "message_id": "msg-123",
+            "timestamp": "2023-10-01T12:00:00Z",
+            "priority": 1,
+            "retry_count": 0,
+            "error_message": "",
+            "custom_headers": {"header1": "value1"}
+        }
+    }
+
+
+@pytest.fixture
+def lazy_serializer():
+    return MessageSerializer.from_config({"lazy": True})
+
+
+def test_lazy_message_exposes_envelope_without_decoding_payload(valid_message, lazy_serializer):
+    body = json.dumps(valid_message).encode("utf-8")
+
+    msg = lazy_serializer.decode(body, {})
+
+    assert isinstance(msg, LazyGreyhoundMessage)
+    assert msg.event_type == "test.event"
+    assert msg.metadata.correlation_id == "12345"
+    assert msg.is_materialized is False
+
+
+def test_lazy_message_decodes_payload_on_first_access(valid_message, lazy_serializer):
+    msg = lazy_serializer.decode(json.dumps(valid_message).encode("utf-8"), {})
+
+    assert msg.payload["data"] == "test"
+    assert msg.stages[0].destination == "service-X"
+    assert msg.is_materialized is True
+
+
+def test_lazy_message_defers_payload_validation(valid_message, lazy_serializer):
+    valid_message["payload"] = "should-be-dict"
+    msg = lazy_serializer.decode(json.dumps(valid_message).encode("utf-8"), {})
+
+    assert msg.event_type == "test.event"
+    with pytest.raises(MessageDecodeError):
+        msg.payload
+
+
+def test_lazy_message_still_validates_envelope(valid_message, lazy_serializer):
+    del valid_message["event_type"]
+
+    with pytest.raises(ValidationError):
+        lazy_serializer.decode(json.dumps(valid_message).encode("utf-8"), {})
+
+
+def test_lazy_message_envelope_is_read_only(valid_message, lazy_serializer):
+    msg = lazy_serializer.decode(json.dumps(valid_message).encode("utf-8"), {})
+
+    with pytest.raises(ValidationError):
+        msg.metadata.retry_count = 1
+
+
+def test_untouched_lazy_message_is_encoded_as_its_original_body(valid_message, lazy_serializer):
+    body = json.dumps(valid_message).encode("utf-8")
+    msg = lazy_serializer.decode(body, {})
+
+    encoded, headers = MessageSerializer().encode(msg)
+
+    assert encoded is body
+    assert headers["content-type"] == "application/json"
+
+
+def test_materialized_lazy_message_is_re_encoded(valid_message, lazy_serializer):
+    body = json.dumps(valid_message).encode("utf-8")
+    msg = lazy_serializer.decode(body, {})
+    msg.payload["data"] = "changed"
+
+    encoded, _ = MessageSerializer().encode(msg)
+
+    assert json.loads(encoded)["payload"] == {"data": "changed"}
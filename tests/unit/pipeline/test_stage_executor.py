@@ -0,0 +1,137 @@
+import pytest
+from greyhound_messaging.adapters._implementations.memory_adapters import get_queue, reset_queues
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.pipeline import STAGE_CURSOR_HEADER, StageExecutor
+from greyhound_messaging.serialization import MessageSerializer
+
+
+@pytest.fixture(autouse=True)
+def fresh_queues():
+    reset_queues()
+    yield
+    reset_queues()
+
+
+def make_message(*destinations: str) -> GreyhoundMessageRoot:
+    return GreyhoundMessageRoot(
+        event_type="orders.created",
+        stages=[{"destination": destination} for destination in destinations],
+        payload={"amount": 2},
+        metadata={"correlation_id": "c-1", "message_id": "m-1"}
+    )
+
+
+class RecordingProducer:
+
+    def __init__(self):
+        self.produced = []
+        self.closed = False
+
+    def produce(self, message):
+        self.produced.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+def double(stage, message):
+    return {"amount": message.payload["amount"] * 2}
+
+
+def add_previous(stage, message):
+    return {"amount": message.stages[0].outputs["amount"] + 1}
+
+
+def test_executor_runs_consecutive_local_stages_in_memory():
+    # Arrange
+    completed = []
+    executor = StageExecutor({"double": double, "add": add_previous}, on_complete=completed.append)
+    message = make_message("double", "add")
+
+    # Act
+    executor.message_received(message)
+
+    # Assert
+    assert [stage.outputs for stage in message.stages] == [{"amount": 4}, {"amount": 5}]
+    assert message.metadata.custom_headers[STAGE_CURSOR_HEADER] == 2
+    assert completed == [message]
+
+
+def test_executor_forwards_to_first_remote_destination():
+    # Arrange
+    remote = RecordingProducer()
+    executor = StageExecutor({"double": double, "add": add_previous}, producers={"billing": remote})
+    message = make_message("double", "billing", "add")
+
+    # Act
+    executor.message_received(message)
+
+    # Assert
+    assert remote.produced == [message]
+    assert message.stages[0].outputs == {"amount": 4}
+    assert message.stages[2].outputs == {}
+    assert message.metadata.custom_headers[STAGE_CURSOR_HEADER] == 1
+
+
+def test_executor_resumes_from_stage_cursor():
+    # Arrange
+    seen = []
+    executor = StageExecutor({"billing": lambda stage, message: seen.append(stage.destination)})
+    message = make_message("double", "billing")
+    message.metadata.custom_headers[STAGE_CURSOR_HEADER] = 1
+
+    # Act
+    executor.message_received(message)
+
+    # Assert
+    assert seen == ["billing"]
+    assert message.stages[0].outputs == {}
+
+
+def test_executor_without_producer_for_remote_destination_raises():
+    # Arrange
+    executor = StageExecutor({"double": double})
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        executor.message_received(make_message("double", "billing"))
+
+
+def test_executor_re_encodes_lazily_decoded_messages():
+    # Arrange
+    serializer = MessageSerializer(lazy=True, passthrough=True)
+    remote = RecordingProducer()
+    executor = StageExecutor({"double": double}, producers={"billing": remote})
+    lazy = serializer.decode(*serializer.encode(make_message("double", "billing")))
+
+    # Act
+    executor.message_received(lazy)
+
+    # Assert
+    body, headers = serializer.encode(remote.produced[0])
+    assert serializer.decode(body, headers).stages[0].outputs == {"amount": 4}
+
+
+def test_executor_from_config_creates_producer_per_destination():
+    # Arrange
+    executor = StageExecutor.from_config({"double": double}, {"backend": "MEMORY"})
+
+    # Act
+    executor.message_received(make_message("double", "billing"))
+    executor.close()
+
+    # Assert
+    body, headers = get_queue("billing").get_nowait()
+    assert MessageSerializer().decode(body, headers).stages[0].outputs == {"amount": 4}
+
+
+def test_executor_close_closes_producers():
+    # Arrange
+    remote = RecordingProducer()
+    executor = StageExecutor(producers={"billing": remote})
+
+    # Act
+    executor.close()
+
+    # Assert
+    assert remote.closed
@@ -0,0 +1,291 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from greyhound_messaging.adapters import adapter_factory_consumer
+from greyhound_messaging.adapters._implementations.memory_adapters import get_queue, reset_queues
+from greyhound_messaging.greyhound_consumers import AsyncGreyhoundConsumer, GreyhoundConsumer
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.retry import DelayScheduler, RetryingConsumer
+from greyhound_messaging.serialization import MessageSerializer
+
+
+@pytest.fixture(autouse=True)
+def fresh_queues():
+    reset_queues()
+    yield
+    reset_queues()
+
+
+@pytest.fixture
+def valid_message():
+    return GreyhoundMessageRoot(
+        event_type="orders.created",
+        payload={"order_id": 1},
+        metadata={"correlation_id": "c-1", "message_id": "m-1"}
+    )
+
+
+class FlakyConsumer(GreyhoundConsumer):
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+        self.threads = set()
+        self.succeeded = threading.Event()
+        self.closed = False
+
+    def message_received(self, message):
+        self.attempts += 1
+        self.threads.add(threading.get_ident())
+        if self.attempts <= self.failures:
+            raise RuntimeError(f"failure {self.attempts}")
+        self.succeeded.set()
+        return message
+
+    def close(self):
+        self.closed = True
+
+
+class FlakyAsyncConsumer(AsyncGreyhoundConsumer):
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+        self.threads = set()
+        self.succeeded = asyncio.Event()
+
+    async def message_received(self, message):
+        self.attempts += 1
+        self.threads.add(threading.get_ident())
+        if self.attempts <= self.failures:
+            raise RuntimeError(f"failure {self.attempts}")
+        self.succeeded.set()
+        return message
+
+
+class RecordingProducer:
+
+    def __init__(self):
+        self.produced = []
+        self.received = threading.Event()
+
+        self.closed = False
+
+    def produce(self, message):
+        self.produced.append(message)
+        self.received.set()
+
+    def close(self):
+        self.closed = True
+
+
+def test_delay_scheduler_runs_callbacks_in_due_order():
+    # Arrange
+    scheduler = DelayScheduler()
+    ran = []
+    done = threading.Event()
+
+    # Act
+    scheduler.schedule(0.03, ran.append, "late")
+    scheduler.schedule(0.0, ran.append, "early")
+    scheduler.schedule(0.04, done.set)
+
+    # Assert
+    assert done.wait(2)
+    assert ran == ["early", "late"]
+    scheduler.close()
+
+
+def test_delay_scheduler_close_returns_pending_callbacks():
+    # Arrange
+    scheduler = DelayScheduler()
+    for index in range(10000):
+        scheduler.schedule(60 + index, print, index)
+
+    # Act
+    pending = scheduler.close()
+
+    # Assert
+    assert len(pending) == 10000
+    assert pending[0] == (print, (0,))
+    with pytest.raises(ValueError):
+        scheduler.schedule(0, print)
+
+
+def test_backoff_grows_exponentially_up_to_max_delay():
+    # Arrange
+    consumer = RetryingConsumer(GreyhoundConsumer(), base_delay=0.1, multiplier=2, max_delay=1.0, jitter=0.0)
+
+    # Act
+    delays = [consumer.delay(retry_count) for retry_count in range(6)]
+
+    # Assert
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+    consumer.close()
+
+
+def test_jitter_keeps_delay_within_bounds():
+    # Arrange
+    consumer = RetryingConsumer(GreyhoundConsumer(), base_delay=1.0, jitter=0.5)
+
+    # Act
+    delays = [consumer.delay(0) for _ in range(200)]
+
+    # Assert
+    assert all(0.5 <= delay <= 1.0 for delay in delays)
+    assert len(set(delays)) > 1
+    consumer.close()
+
+
+def test_failed_message_is_retried_without_blocking_the_caller(valid_message):
+    # Arrange
+    flaky = FlakyConsumer(failures=2)
+    consumer = RetryingConsumer(flaky, base_delay=0.01, jitter=0.0)
+
+    # Act
+    started = time.perf_counter()
+    consumer.message_received(valid_message)
+    elapsed = time.perf_counter() - started
+
+    # Assert
+    assert elapsed < 0.01
+    assert flaky.succeeded.wait(2)
+    assert flaky.attempts == 3
+    assert valid_message.metadata.retry_count == 2
+    assert valid_message.metadata.error_message == "RuntimeError: failure 2"
+    consumer.close()
+
+
+def test_failed_async_message_is_retried_on_its_event_loop(valid_message):
+    # Arrange
+    flaky = FlakyAsyncConsumer(failures=2)
+    consumer = RetryingConsumer(flaky, base_delay=0.01, jitter=0.0)
+
+    async def consume():
+        await consumer.message_received(valid_message)
+        await asyncio.wait_for(flaky.succeeded.wait(), 2)
+
+    # Act
+    asyncio.run(consume())
+
+    # Assert
+    assert flaky.attempts == 3
+    assert flaky.threads == {threading.get_ident()}
+    assert valid_message.metadata.retry_count == 2
+    assert valid_message.metadata.error_message == "RuntimeError: failure 2"
+    consumer.close()
+
+
+def test_exhausted_message_goes_to_dead_letter(valid_message):
+    # Arrange
+    dead_letter = RecordingProducer()
+    consumer = RetryingConsumer(FlakyConsumer(failures=10), max_retries=2, base_delay=0.001, dead_letter=dead_letter)
+
+    # Act
+    consumer.message_received(valid_message)
+
+    # Assert
+    assert dead_letter.received.wait(2)
+    assert dead_letter.produced == [valid_message]
+    assert valid_message.metadata.retry_count == 2
+    assert consumer.pending == 0
+    consumer.close()
+
+
+def test_requeue_producer_redelivers_through_broker(valid_message):
+    # Arrange
+    requeue = RecordingProducer()
+    flaky = FlakyConsumer(failures=1)
+    consumer = RetryingConsumer(flaky, base_delay=0.001, requeue=requeue)
+
+    # Act
+    consumer.message_received(valid_message)
+
+    # Assert
+    assert requeue.received.wait(2)
+    assert flaky.attempts == 1
+    assert requeue.produced[0].metadata.retry_count == 1
+    consumer.close()
+
+
+def test_adapter_factory_wraps_consumer_when_retry_is_configured(valid_message):
+    # Arrange
+    config = {
+        "consumer": {
+            "backend": "MEMORY",
+            "queue": "orders",
+            "retry": {"max_retries": 0, "dead_letter": {"backend": "MEMORY", "queue": "orders.dlq"}},
+        }
+    }
+    adapter = adapter_factory_consumer(FlakyConsumer(failures=1), config)
+    serializer = MessageSerializer()
+
+    # Act
+    adapter.message_received(*serializer.encode(valid_message))
+
+    # Assert
+    assert isinstance(adapter.consumer, RetryingConsumer)
+    body, headers = get_queue("orders.dlq").get_nowait()
+    assert serializer.decode(body, headers).metadata.error_message == "RuntimeError: failure 1"
+    adapter.consumer.close()
+
+
+def test_adapter_factory_redelivers_on_the_consume_thread(valid_message):
+    # Arrange
+    config = {"consumer": {"backend": "MEMORY", "queue": "orders", "poll_timeout": 0.01, "retry": {"base_delay": 0.01, "jitter": 0.0}}}
+    flaky = FlakyConsumer(failures=2)
+    adapter = adapter_factory_consumer(flaky, config)
+    get_queue("orders").put(MessageSerializer().encode(valid_message))
+    consume_thread = threading.Thread(target=adapter.consume)
+
+    # Act
+    consume_thread.start()
+    succeeded = flaky.succeeded.wait(2)
+    adapter.stop()
+    consume_thread.join(2)
+
+    # Assert
+    assert succeeded
+    assert flaky.attempts == 3
+    assert flaky.threads == {consume_thread.ident}
+    adapter.consumer.close()
+
+
+def test_close_requeues_pending_retries_and_closes_wrapped_consumer(valid_message):
+    # Arrange
+    requeue = RecordingProducer()
+    flaky = FlakyConsumer(failures=1)
+    consumer = RetryingConsumer(flaky, base_delay=60, requeue=requeue)
+    outcome = consumer.message_received(valid_message)
+
+    # Act
+    consumer.close()
+
+    # Assert
+    assert outcome.result(0) is valid_message
+    assert requeue.produced == [valid_message]
+    assert requeue.closed
+    assert flaky.closed
+
+
+def test_adapter_close_abandons_pending_retries(valid_message):
+    # Arrange
+    config = {"consumer": {"backend": "MEMORY", "queue": "orders", "retry": {"base_delay": 60}}}
+    flaky = FlakyConsumer(failures=1)
+    adapter = adapter_factory_consumer(flaky, config)
+    adapter.message_received(*MessageSerializer().encode(valid_message))
+    pending = adapter.consumer.pending
+
+    # Act
+    adapter.close()
+
+    # Assert
+    assert pending == 1
+    assert adapter.consumer.pending == 0
+    assert flaky.closed
+    with pytest.raises(ValueError):
+        adapter.consumer.scheduler.schedule(0, print)
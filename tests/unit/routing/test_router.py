@@ -0,0 +1,147 @@
+import json
+
+import pytest
+from greyhound_messaging.adapters._implementations.memory_adapters import MemoryConsumerAdapter
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.routing import GreyhoundRouter
+
+
+def make_message(event_type: str) -> GreyhoundMessageRoot:
+    return GreyhoundMessageRoot(
+        event_type=event_type,
+        payload={"order_id": 1},
+        metadata={"correlation_id": "c-1", "message_id": "m-1"}
+    )
+
+
+def recorder(seen: list, name: str):
+    def handler(message: GreyhoundMessageRoot):
+        seen.append((name, message.event_type))
+    return handler
+
+
+@pytest.mark.parametrize("pattern, event_type, matches", [
+    ("orders.created", "orders.created", True),
+    ("orders.created", "orders.updated", False),
+    ("orders.*", "orders.created", True),
+    ("orders.*", "orders.eu.created", False),
+    ("orders.*", "orders", False),
+    ("orders.#", "orders", True),
+    ("orders.#", "orders.eu.created", True),
+    ("orders.#.created", "orders.created", True),
+    ("orders.#.created", "orders.eu.west.created", True),
+    ("orders.#.created", "orders.eu.updated", False),
+    ("#", "anything.at.all", True),
+    ("*.created", "invoices.created", True),
+])
+def test_router_matches_wildcard_patterns(pattern, event_type, matches):
+    # Arrange
+    seen = []
+    router = GreyhoundRouter()
+    router.add_route(pattern, recorder(seen, pattern))
+
+    # Act
+    router.message_received(make_message(event_type))
+
+    # Assert
+    assert bool(seen) is matches
+
+
+def test_router_runs_every_matching_handler_in_registration_order():
+    # Arrange
+    seen = []
+    router = GreyhoundRouter()
+    router.add_route("orders.#", recorder(seen, "all"))
+    router.add_route("orders.created", recorder(seen, "exact"))
+    router.add_route("*.created", recorder(seen, "created"))
+    router.add_route("#.#", recorder(seen, "double-hash"))
+
+    # Act
+    router.message_received(make_message("orders.created"))
+
+    # Assert
+    assert [name for name, _ in seen] == ["all", "exact", "created", "double-hash"]
+
+
+def test_router_sends_unmatched_messages_to_fallback():
+    # Arrange
+    seen = []
+    router = GreyhoundRouter(fallback=recorder(seen, "fallback"))
+    router.add_route("orders.*", recorder(seen, "orders"))
+
+    # Act
+    router.message_received(make_message("invoices.created"))
+
+    # Assert
+    assert seen == [("fallback", "invoices.created")]
+
+
+def test_router_returns_last_handler_result():
+    # Arrange
+    router = GreyhoundRouter()
+    replacement = make_message("orders.enriched")
+    router.add_route("orders.*", lambda message: replacement)
+    router.add_route("orders.created", lambda message: None)
+
+    # Act
+    result = router.message_received(make_message("orders.created"))
+
+    # Assert
+    assert result is replacement
+
+
+def test_router_decorator_registers_route_and_invalidates_cache():
+    # Arrange
+    seen = []
+    router = GreyhoundRouter()
+    assert router.handlers_for("orders.created") == ()
+
+    # Act
+    @router.route("orders.*")
+    def on_order(message):
+        seen.append(message.event_type)
+
+    router.message_received(make_message("orders.created"))
+
+    # Assert
+    assert router.handlers_for("orders.created") == (on_order,)
+    assert seen == ["orders.created"]
+
+
+@pytest.mark.parametrize("pattern", ["", "orders.", ".orders", "orders..created"])
+def test_router_rejects_invalid_patterns(pattern):
+    # Arrange
+    router = GreyhoundRouter()
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        router.add_route(pattern, lambda message: None)
+
+
+def test_router_from_config_loads_handlers_by_import_path():
+    # Arrange
+    config = {
+        "routes": {"orders.*": "json:dumps"},
+        "fallback": "json:loads",
+    }
+
+    # Act
+    router = GreyhoundRouter.from_config(config)
+
+    # Assert
+    assert router.handlers_for("orders.created") == (json.dumps,)
+    assert router.fallback is json.loads
+
+
+def test_router_plugs_into_adapter_from_config():
+    # Arrange
+    seen = []
+    router = GreyhoundRouter()
+    router.add_route("orders.#", recorder(seen, "orders"))
+    adapter = MemoryConsumerAdapter.from_config(router, {"queue": "routed"})
+
+    # Act
+    adapter.message_received(make_message("orders.eu.created").model_dump_json().encode(), {})
+
+    # Assert
+    assert seen == [("orders", "orders.eu.created")]
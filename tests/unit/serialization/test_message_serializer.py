@@ -0,0 +1,240 @@
+import json
+import pickle
+
+import pytest
+from greyhound_messaging.model.greyhound_message import GreyhoundMessageRoot
+from greyhound_messaging.serialization import CONTENT_ENCODING_HEADER, DECODE_ERRORS, MessageDecodeError, MessageSerializer, codecs, compressors, get_codec, get_compressor
+
+
+@pytest.fixture
+def valid_message():
+    return {
+        "event_type": "test.event",
+        "is_dry_run": False,
+        "stages": [
+            {
+                "destination": "service-X",
+                "inputs": {"key": "value"},
+                "outputs": {"result": "success"},
+                "parameters": {"param1": "value1"}
+            }
+        ],
+        "payload": {"data": "test"},
+        "metadata": {
+            "correlation_id": "12345",
+            "message_id": "msg-123",
+            "timestamp": "2023-10-01T12:00:00Z",
+            "priority": 1,
+            "retry_count": 0,
+            "error_message": "",
+            "custom_headers": {"header1": "value1"}
+        }
+    }
+
+
+@pytest.mark.parametrize("codec_name", sorted(codecs))
+def test_codec_round_trip(codec_name, valid_message):
+    # Arrange
+    serializer = MessageSerializer(get_codec(codec_name))
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    body, headers = serializer.encode(message)
+    decoded = serializer.decode(body, headers)
+
+    # Assert
+    assert headers["content-type"] == serializer.codec.content_type
+    assert decoded == message
+
+
+def test_json_codec_matches_model_dump_json(valid_message):
+    message = GreyhoundMessageRoot(**valid_message)
+
+    body, _ = MessageSerializer().encode(message)
+
+    assert body == message.model_dump_json().encode("utf-8")
+
+
+def test_body_without_content_type_is_decoded_as_json(valid_message):
+    serializer = MessageSerializer.from_config({"codec": "json"})
+
+    decoded = serializer.decode(json.dumps(valid_message).encode("utf-8"), {})
+
+    assert decoded.metadata.message_id == "msg-123"
+
+
+@pytest.mark.skipif("msgpack" not in codecs, reason="msgpack is not installed")
+def test_content_type_header_selects_the_decoding_codec(valid_message):
+    message = GreyhoundMessageRoot(**valid_message)
+    body, headers = MessageSerializer(get_codec("msgpack")).encode(message)
+
+    decoded = MessageSerializer(get_codec("json")).decode(body, headers)
+
+    assert decoded == message
+
+
+def test_unknown_content_type_raises_decode_error(valid_message):
+    with pytest.raises(MessageDecodeError):
+        MessageSerializer().decode(b"{}", {"content-type": "application/x-unknown"})
+
+
+def test_invalid_body_raises_a_decode_error():
+    with pytest.raises(DECODE_ERRORS):
+        MessageSerializer().decode(b"not-json", {})
+
+
+def test_unknown_codec_name_raises_value_error():
+    with pytest.raises(ValueError, match="Unknown codec: yaml"):
+        MessageSerializer.from_config({"codec": "yaml"})
+
+
+@pytest.mark.skipif("msgpack" in codecs, reason="msgpack is installed")
+def test_missing_optional_codec_points_to_the_codecs_extra():
+    with pytest.raises(ValueError, match=r"greyhound-messaging\[codecs\]"):
+        MessageSerializer.from_config({"codec": "msgpack"})
+
+
+def test_passthrough_forwards_unmodified_message_as_original_body(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+
+    encoded, headers = MessageSerializer(passthrough=True).encode(message)
+
+    assert encoded is body
+    assert headers["content-type"] == "application/json"
+
+
+def test_passthrough_re_encodes_after_field_assignment(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    message.event_type = "changed.event"
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert json.loads(encoded)["event_type"] == "changed.event"
+
+
+def test_passthrough_re_encodes_after_mark_dirty(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    message.metadata.retry_count = 3
+    message.mark_dirty()
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert json.loads(encoded)["metadata"]["retry_count"] == 3
+
+
+def test_passthrough_re_encodes_after_nested_metadata_assignment(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    message.metadata.retry_count = 3
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert json.loads(encoded)["metadata"]["retry_count"] == 3
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda message: message.payload.update(data="changed"),
+    lambda message: message.stages[0].inputs.update(key="changed"),
+    lambda message: message.metadata.custom_headers.update(header1="changed"),
+    lambda message: message.payload["nested"]["items"].append(4),
+    lambda message: message.stages.append(message.stages[0]),
+    lambda message: setattr(message.stages[0], "destination", "service-Y"),
+])
+def test_passthrough_re_encodes_after_in_place_changes(mutate, valid_message):
+    valid_message["payload"]["nested"] = {"items": [1, 2, 3]}
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    mutate(message)
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert encoded == message.model_dump_json().encode("utf-8")
+    assert encoded != body
+
+
+def test_passthrough_survives_reading_envelope_fields(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    _ = (message.event_type, message.metadata.message_id, message.metadata.get_header("header1"))
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert encoded is body
+
+
+def test_passthrough_forwards_original_body_after_reading_mutable_fields(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+    _ = (message.payload["data"], message.stages[0].inputs["key"], message.metadata.custom_headers["header1"])
+
+    encoded, _ = MessageSerializer(passthrough=True).encode(message)
+
+    assert encoded is body
+
+
+def test_tracked_fields_copy_and_pickle_on_their_own(valid_message):
+    message = MessageSerializer().decode(json.dumps(valid_message).encode("utf-8"), {})
+    _ = message.payload
+
+    restored = pickle.loads(pickle.dumps(message))
+    copied = message.model_copy(deep=True)
+    copied.payload["data"] = "changed"
+
+    assert type(restored.__dict__["payload"]) is dict
+    assert restored == message
+    assert message.raw_body is not None and restored.raw_body is not None
+    assert copied.raw_body is None
+
+
+def test_passthrough_is_off_by_default(valid_message):
+    body = json.dumps(valid_message).encode("utf-8")
+    message = MessageSerializer().decode(body, {})
+
+    encoded, _ = MessageSerializer().encode(message)
+
+    assert encoded is not body
+    assert encoded == message.model_dump_json().encode("utf-8")
+
+
+@pytest.mark.parametrize("compressor_name", sorted(compressors))
+def test_large_bodies_are_compressed_and_restored(compressor_name, valid_message):
+    # Arrange
+    valid_message["payload"] = {"data": "x" * 4096}
+    producer_side = MessageSerializer(compressor=get_compressor(compressor_name), compression_threshold=1024)
+    consumer_side = MessageSerializer()
+    message = GreyhoundMessageRoot(**valid_message)
+
+    # Act
+    body, headers = producer_side.encode(message)
+    decoded = consumer_side.decode(body, headers)
+
+    # Assert
+    assert headers[CONTENT_ENCODING_HEADER] == compressor_name
+    assert len(body) < len(message.model_dump_json())
+    assert decoded == message
+
+
+def test_small_bodies_are_not_compressed(valid_message):
+    serializer = MessageSerializer.from_config({"compression": "zlib", "compression_threshold": 1024})
+
+    body, headers = serializer.encode(GreyhoundMessageRoot(**valid_message))
+
+    assert CONTENT_ENCODING_HEADER not in headers
+    assert json.loads(body)["event_type"] == "test.event"
+
+
+def test_unknown_content_encoding_raises_decode_error(valid_message):
+    body = GreyhoundMessageRoot(**valid_message).model_dump_json().encode("utf-8")
+
+    with pytest.raises(MessageDecodeError):
+        MessageSerializer().decode(body, {CONTENT_ENCODING_HEADER: "brotli"})
+
+
+def test_auto_compression_picks_an_installed_compressor():
+    assert get_compressor("auto").name in compressors
+    assert get_compressor(None) is None
+    with pytest.raises(ValueError):
+        get_compressor("brotli")